@@ -1,22 +1,189 @@
+import os
+import time
+
 import dash
-from dash import dcc, html, Input, Output, dash_table
+from dash import dcc, html, Input, Output, State, dash_table, callback, ctx, no_update
+from dash.exceptions import PreventUpdate
+from flask import Response, g, jsonify, request
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import duckdb
+import numpy as np
 import pandas as pd
 import plotly.express as px  
 
-app = dash.Dash(__name__)
-app.title = "Cricket Dashboard"
+from connection_manager import get_connection_manager
+from dashboard_data import get_dashboard_data
+from data_loader import filter_by_series
+from head_to_head import ALL_FORMATS, OUTCOMES, build_head_to_head_query, load_head_to_head
+from match_table import build_match_table_query, page_count
+from memoize import CallbackMemoizer, FileSystemBackend, MemoryBackend
+import metrics
+from metrics import RENDER_SECONDS, execute_timed, timed, timed_callback, timed_render
+
+# Database used by the app; create_app() may point it elsewhere
+DB_PATH = os.environ.get('CRICKET_DB_PATH', 'cricket_matches.db')
+
+# CRICKET_ENV=production (set by gunicorn.conf.py) turns off debug mode and dev tools
+DEBUG = os.environ.get('CRICKET_ENV', 'development') != 'production'
+
+def dashboard_data():
+    """
+    Lazily loaded match data for the configured database
+
+    :return: DashboardData; call .load() before reading the in-memory frames
+    """
+    return get_dashboard_data(DB_PATH)
+
+# Pure callbacks are memoized on their arguments and the current data version.
+# Set CRICKET_CALLBACK_CACHE_DIR to share results between workers on disk.
+CALLBACK_CACHE_TTL = 3600
+
+def _callback_cache_backend():
+    cache_dir = os.environ.get('CRICKET_CALLBACK_CACHE_DIR')
+    return FileSystemBackend(cache_dir) if cache_dir else MemoryBackend()
+
+callback_memoizer = CallbackMemoizer(
+    backend=_callback_cache_backend(),
+    version=lambda: dashboard_data().manager.data_version(),
+    ttl=CALLBACK_CACHE_TTL
+)
+
+def _cache_metrics():
+    # Memoizer and cache counters, read at scrape time
+    lines = ["# HELP dashboard_callback_cache_total Memoized callback lookups, by function and outcome",
+             "# TYPE dashboard_callback_cache_total counter"]
+    for name, counters in sorted(callback_memoizer.stats().items()):
+        for outcome in ('hits', 'misses'):
+            lines.append(f'dashboard_callback_cache_total{{function="{name}",outcome="{outcome}"}} {counters[outcome]}')
+    data = dashboard_data()
+    lines += ["# HELP dashboard_render_cache_bytes Serialized views held by the render cache",
+              "# TYPE dashboard_render_cache_bytes gauge",
+              f"dashboard_render_cache_bytes {data.render_cache.cache.total_bytes}",
+              "# HELP dashboard_data_load_seconds Time taken by the latest load of the match data",
+              "# TYPE dashboard_data_load_seconds gauge",
+              f"dashboard_data_load_seconds {data.load_seconds or 0}"]
+    return lines
+
+metrics.REGISTRY.register_collector(_cache_metrics)
+
+def load_data(query, params=None):
+    with get_connection_manager(DB_PATH).cursor() as con:
+        return execute_timed(con, query, params).df()
+
+# Everything the match tabs need, grouped by innings, in one round trip
+MATCH_BUNDLE_QUERY = """
+    WITH batting AS (
+        SELECT innings_id,
+               any_value(bat_team_name) AS batting_team,
+               list({'batsman_name': batsman_name, 'runs': runs, 'balls_faced': balls_faced,
+                     'fours': fours, 'sixes': sixes, 'strike_rate': strike_rate}
+                    ORDER BY batting_position NULLS LAST) AS batting
+        FROM batsmen_details WHERE match_id = $1
+        GROUP BY innings_id
+    ), bowling AS (
+        SELECT innings_id,
+               any_value(bowl_team_name) AS bowling_team,
+               list({'bowler_name': bowler_name, 'overs': overs, 'maidens': maidens,
+                     'runs_conceded': runs_conceded, 'wickets': wickets, 'economy': economy}
+                    ORDER BY bowling_position NULLS LAST) AS bowling
+        FROM bowlers_details WHERE match_id = $1
+        GROUP BY innings_id
+    ), partnership AS (
+        SELECT innings_id,
+               list({'batsman1': bat1_name, 'bat1_runs': bat1_runs, 'batsman2': bat2_name,
+                     'bat2_runs': bat2_runs, 'runs': total_runs, 'balls': total_balls}
+                    ORDER BY partnership_id) AS partnerships
+        FROM partnerships WHERE match_id = $1
+        GROUP BY innings_id
+    ), innings AS (
+        SELECT innings_id, total_runs, total_wickets, overs
+        FROM innings_details WHERE match_id = $1
+    ), innings_ids AS (
+        SELECT innings_id FROM batting
+        UNION SELECT innings_id FROM bowling
+        UNION SELECT innings_id FROM partnership
+        UNION SELECT innings_id FROM innings
+    ), header AS (
+        SELECT {'team1_name': im.team1_name,
+                'team2_name': im.team2_name,
+                'match_desc': im.match_desc,
+                'winner_team': md.winning_team_name,
+                'match_result': md.match_status,
+                'match_state': md.match_state,
+                'venue': im.venue_ground || ', ' || im.venue_city} AS header
+        FROM international_matches im
+        JOIN match_details md ON im.match_id = md.match_id
+        WHERE im.match_id = $1
+    )
+    SELECT (SELECT header FROM header LIMIT 1) AS header,
+           ids.innings_id, b.batting_team, w.bowling_team,
+           i.total_runs, i.total_wickets, i.overs,
+           b.batting, w.bowling, p.partnerships
+    FROM (SELECT 1) AS one
+    LEFT JOIN innings_ids ids ON true
+    LEFT JOIN batting b ON b.innings_id = ids.innings_id
+    LEFT JOIN bowling w ON w.innings_id = ids.innings_id
+    LEFT JOIN partnership p ON p.innings_id = ids.innings_id
+    LEFT JOIN innings i ON i.innings_id = ids.innings_id
+    ORDER BY ids.innings_id
+"""
+
+# Databases not yet migrated by fetch_data/schema.py have no position columns; keep stored order there
+UNPOSITIONED_MATCH_BUNDLE_QUERY = (MATCH_BUNDLE_QUERY
+                                   .replace("ORDER BY batting_position NULLS LAST", "")
+                                   .replace("ORDER BY bowling_position NULLS LAST", ""))
+
+POSITION_COLUMNS_QUERY = """
+    SELECT COUNT(*) FROM duckdb_columns()
+    WHERE database_name = current_database()
+      AND (table_name, column_name) IN (('batsmen_details', 'batting_position'), ('bowlers_details', 'bowling_position'))
+"""
+
+def has_position_columns():
+    """
+    Whether the scorecard tables record batting and bowling positions, checked once per data version
+
+    :return: True if the match bundle can order the cards by position
+    """
+    return dashboard_data().query_cache.cached(
+        POSITION_COLUMNS_QUERY, (), lambda con: con.execute(POSITION_COLUMNS_QUERY).fetchone()[0] == 2
+    )
+
+def _fetch_match_bundle(con, match_id, query):
+    rows = execute_timed(con, query, [match_id]).fetchall()
+    bundle = {'header': rows[0][0] if rows else None, 'innings': []}
+    for _, innings_id, batting_team, bowling_team, total_runs, total_wickets, overs, batting, bowling, partnerships in rows:
+        if innings_id is None:
+            continue
+        bundle['innings'].append({
+            'innings_id': innings_id,
+            'batting_team': batting_team,
+            'bowling_team': bowling_team,
+            'total_runs': total_runs,
+            'total_wickets': total_wickets,
+            'overs': overs,
+            'batting': batting or [],
+            'bowling': bowling or [],
+            'partnerships': partnerships or []
+        })
+    return bundle
 
+def load_match_bundle(match_id):
+    """
+    Load header, innings totals, batting, bowling and partnerships for one match
 
-def load_data(query):
-    con = duckdb.connect('cricket_matches.db', read_only=True)
-    return con.execute(query).df()
+    :param match_id: Match to load
+    :return: {'header': dict or None, 'innings': [per-innings dict, ordered by innings_id]}
+    """
+    match_id = int(match_id)
+    query = MATCH_BUNDLE_QUERY if has_position_columns() else UNPOSITIONED_MATCH_BUNDLE_QUERY
+    return dashboard_data().query_cache.cached(
+        query, (match_id,), lambda con: _fetch_match_bundle(con, match_id, query)
+    )
 
 # Queries for data
 def get_international_matches():
-    return load_data("SELECT * FROM international_matches m JOIN match_details md ON m.match_id = md.match_id")
+    return dashboard_data().load().matches
 
 def get_team_wins(data_international_matches):
     return data_international_matches.groupby('winning_team_name').size().reset_index(name='wins').sort_values('wins', ascending=False)
@@ -24,212 +191,440 @@ def get_team_wins(data_international_matches):
 def get_match_formats(data_international_matches):
     return data_international_matches['match_format'].value_counts().reset_index(name='count')
 
-data_international_matches = get_international_matches()
-data_team_wins = get_team_wins(data_international_matches)
-data_match_formats = get_match_formats(data_international_matches)
+# Precomputed per-series summaries, refreshed by the ingest run
+SERIES_TEAM_WINS_QUERY = """
+    SELECT winning_team_name, wins FROM series_team_wins
+    WHERE series_name = ? ORDER BY wins DESC
+"""
 
-try:
-    series_options = [{'label': series, 'value': series} 
-                      for series in data_international_matches['series_name'].unique() 
-                      if pd.notna(series)]
-    series_options.insert(0, {'label': 'All Series', 'value': 'All Series'})
-except Exception as e:
-    print(f"Error creating series options: {e}")
-    series_options = [{'label': 'All Series', 'value': 'All Series'}]
+SERIES_MATCH_FORMATS_QUERY = """
+    SELECT match_format, count FROM series_match_formats
+    WHERE series_name = ? ORDER BY count DESC
+"""
+
+def filter_series(selected_series):
+    data = dashboard_data().load()
+    return filter_by_series(data.matches, data.series_index, selected_series)
+
+def get_series_team_wins(selected_series, df_filtered=None):
+    try:
+        return dashboard_data().query_cache.query(SERIES_TEAM_WINS_QUERY, (selected_series,))
+    except Exception:
+        # Aggregate tables not built yet: count from the in-memory frame
+        return get_team_wins(filter_series(selected_series) if df_filtered is None else df_filtered)
+
+def get_series_match_formats(selected_series, df_filtered=None):
+    try:
+        return dashboard_data().query_cache.query(SERIES_MATCH_FORMATS_QUERY, (selected_series,))
+    except Exception:
+        return get_match_formats(filter_series(selected_series) if df_filtered is None else df_filtered)
 
 # Layout
-app.layout = html.Div([ html.H1("StumpStats"),
-    dcc.Tabs([ 
-        dcc.Tab(label="Series Overview", children=[
-            html.H2("Series Overview"),
-            dbc.Row([
-                dbc.Col([
-                    html.H4("Select Series"),
+def build_layout():
+    """
+    Build the page layout without touching the database
+
+    Series options are filled in by update_series_options once the data is loaded.
+
+    :return: Root component
+    """
+    return html.Div([ html.H1("StumpStats"),
+        dcc.Tabs([ 
+            dcc.Tab(label="Series Overview", children=[
+                html.H2("Series Overview"),
+                dbc.Row([
+                    dbc.Col([
+                        html.H4("Select Series"),
+                        dcc.Dropdown(
+                            id='series-dropdown',
+                            options=[{'label': 'All Series', 'value': 'All Series'}],
+                            value='All Series',
+                            clearable=False
+                        )
+                    ], width=6)
+                ], className="mb-4"),
+                dbc.Row([
+                    dbc.Col([
+                        html.H4("Match Details"),
+                        dash_table.DataTable(
+                            id='match-table',
+                            columns=[
+                                {"name": "Match ID", "id": "match_id", "type": "numeric"},
+                                {"name": "Series", "id": "series_name"},
+                                {"name": "Match Description", "id": "match_desc"},
+                                {"name": "Team 1", "id": "team1_name"},
+                                {"name": "Team 2", "id": "team2_name"},
+                                {"name": "Status", "id": "status"}
+                            ],
+                            style_table={'overflowX': 'auto'},
+                            style_cell={'textAlign': 'left'},
+                            # Paging, sorting and filtering run in DuckDB, one page at a time
+                            page_action='custom',
+                            page_current=0,
+                            page_size=11,
+                            sort_action='custom',
+                            sort_mode='single',
+                            sort_by=[],
+                            filter_action='custom',
+                            filter_query=''
+                        )
+                    ], width=12)
+                    ]),
+
+                dbc.Row([
+                    dbc.Col([
+                        html.H4("Teams by Number of Matches"),
+                        dcc.Graph(id='wins-bar-chart')
+                    ], width=6),
+        
+                    dbc.Col([
+                        html.H4("Match Formats Distribution"),
+                        dcc.Graph(id='format-pie-chart')
+                    ], width=6)
+                ])
+            ]),
+            dcc.Tab(label="Match Details", children=[
+                html.H2("Match Scorecard and Partnerships"),
+                html.Div([
+                    html.Label("Select a Match:"),
                     dcc.Dropdown(
-                        id='series-dropdown',
-                        options=series_options,
-                        value='All Series',
-                        clearable=False
+                        id="match-dropdown",
+                        options=[],
+                        placeholder="Type a team, series, match or date...",
+                        # Keep the server's newest-first order instead of the browser's relevance sort
+                        search_order="original",
                     )
-                ], width=6)
-            ], className="mb-4"),
-            dbc.Row([
-                dbc.Col([
-                    html.H4("Match Details"),
-                    dash_table.DataTable(
-                        id='match-table',
-                        columns=[
-                            {"name": "Match ID", "id": "match_id"},
-                            {"name": "Series", "id": "series_name"},
-                            {"name": "Match Description", "id": "match_desc"},
-                            {"name": "Team 1", "id": "team1_name"},
-                            {"name": "Team 2", "id": "team2_name"},
-                            {"name": "Status", "id": "status"}
-                        ],
-                        style_table={'overflowX': 'auto'},
-                        style_cell={'textAlign': 'left'},
-                        page_size=11
+                ]),
+                html.Div(id="scorecard-output"),
+                html.Div(id="partnership-output")
+            ]),
+            dcc.Tab(label="Match Summary", children=[
+                html.H2("Match Summary"),
+                html.Div([
+                    html.Label("Select a Match:"),
+                    dcc.Dropdown(
+                        id="match2-dropdown",
+                        options=[],
+                        placeholder="Type a team, series, match or date...",
+                        # Keep the server's newest-first order instead of the browser's relevance sort
+                        search_order="original",
                     )
-                ], width=12)
                 ]),
-
-            dbc.Row([
-                dbc.Col([
-                    html.H4("Teams by Number of Matches"),
-                    dcc.Graph(id='wins-bar-chart')
-                ], width=6),
-        
-                dbc.Col([
-                    html.H4("Match Formats Distribution"),
-                    dcc.Graph(id='format-pie-chart')
-                ], width=6)
-            ])
-        ]),
-        dcc.Tab(label="Match Details", children=[
-            html.H2("Match Scorecard and Partnerships"),
-            html.Div([
-                html.Label("Select a Match:"),
-                dcc.Dropdown(
-                    id="match-dropdown",
-                    options=[
-                        {"label": f"{row['team1_name']} vs {row['team2_name']} ({row['match_desc']})", "value": row["match_id"]}
-                        for _, row in data_international_matches.iterrows()
-                    ],
-                )
+                html.Div(id="summary-output")
             ]),
-            html.Div(id="scorecard-output"),
-            html.Div(id="partnership-output")
-        ]),
-        dcc.Tab(label="Match Summary", children=[
-            html.H2("Match Summary"),
-            html.Div([
-                html.Label("Select a Match:"),
-                dcc.Dropdown(
-                    id="match2-dropdown",
-                    options=[
-                        {"label": f"{row['team1_name']} vs {row['team2_name']} ({row['match_desc']})", "value": row["match_id"]}
-                        for _, row in data_international_matches.iterrows()
-                    ],
-                )
+            dcc.Tab(label="Player Careers", children=[
+                html.H2("Player Careers"),
+                html.Div([
+                    html.Label("Select a Player:"),
+                    dcc.Dropdown(
+                        id="player-dropdown",
+                        options=[],
+                        placeholder="Type a player name...",
+                    )
+                ]),
+                html.Div(id="player-output")
             ]),
-            html.Div(id="summary-output")
+            dcc.Tab(label="Head to Head", children=[
+                html.H2("Head to Head"),
+                dbc.Row([
+                    dbc.Col([
+                        html.H4("Format"),
+                        dcc.Dropdown(
+                            id='h2h-format-dropdown',
+                            options=[{'label': ALL_FORMATS, 'value': ALL_FORMATS}],
+                            value=ALL_FORMATS,
+                            clearable=False
+                        )
+                    ], width=3),
+                    dbc.Col([
+                        html.H4("Years"),
+                        # Bounds are set from the data once it is loaded
+                        dcc.RangeSlider(id='h2h-year-slider', min=0, max=0, step=1, value=None,
+                                        marks=None, tooltip={'placement': 'bottom'})
+                    ], width=6),
+                    dbc.Col([
+                        html.H4("Show"),
+                        dcc.RadioItems(
+                            id='h2h-metric',
+                            options=[{'label': ' Win %', 'value': 'win_pct'}] + [
+                                {'label': f" {outcome.replace('_', ' ').capitalize()}", 'value': outcome}
+                                for outcome in OUTCOMES
+                            ],
+                            value='win_pct',
+                            inline=True,
+                            labelStyle={'margin-right': '12px'}
+                        )
+                    ], width=3)
+                ], className="mb-4"),
+                dcc.Graph(id='h2h-heatmap')
+            ])
         ])
     ])
-])
 
-# Callback to update match table
-@app.callback(
-    Output('match-table', 'data'),
-    Input('series-dropdown', 'value')
+# Fills the series picker on page load; waits for the data if warmup is still running
+@callback(
+    Output('series-dropdown', 'options'),
+    Input('series-dropdown', 'id')
 )
-def update_match_table(selected_series):
+@timed_callback
+def update_series_options(_):
     try:
-        if selected_series == 'All Series':
-            df_filtered = data_international_matches
-        else:
-            df_filtered = data_international_matches[data_international_matches['series_name'] == selected_series]
-        
-        # Select and rename columns for display
-        table_data = df_filtered[['match_id', 'series_name', 'match_desc', 'team1_name', 'team2_name', 'status']].to_dict('records')
-        return table_data
+        return dashboard_data().load().series_options
     except Exception as e:
-        print(f"Error in update_match_table: {e}")
-        return []
+        print(f"Error creating series options: {e}")
+        return [{'label': 'All Series', 'value': 'All Series'}]
 
-# Callback to update wins bar chart
-@app.callback(
-    Output('wins-bar-chart', 'figure'),
-    Input('series-dropdown', 'value')
+# Single callback for the Series Overview tab: filter once, fill all outputs
+@callback(
+    [Output('match-table', 'data'),
+     Output('match-table', 'page_count'),
+     Output('match-table', 'page_current'),
+     Output('wins-bar-chart', 'figure'),
+     Output('format-pie-chart', 'figure')],
+    [Input('series-dropdown', 'value'),
+     Input('match-table', 'page_current'),
+     Input('match-table', 'page_size'),
+     Input('match-table', 'sort_by'),
+     Input('match-table', 'filter_query')]
 )
-def update_wins_chart(selected_series):
+@timed_callback
+def update_series_overview(selected_series, page_current, page_size, sort_by, filter_query):
+    # A new series or filter starts again from the first page
+    if ctx.triggered_id is None or ctx.triggered_id == 'series-dropdown' or 'match-table.filter_query' in ctx.triggered_prop_ids:
+        page_current = 0
+    table_data, table_pages = update_match_table(selected_series, page_current, page_size, sort_by, filter_query)
+
+    # Paging, sorting and filtering the table leave the charts untouched
+    if ctx.triggered_id not in (None, 'series-dropdown'):
+        return table_data, table_pages, page_current, no_update, no_update
+
     try:
-        if selected_series == 'All Series':
-            df_filtered = data_international_matches
-        else:
-            df_filtered = data_international_matches[data_international_matches['series_name'] == selected_series]
-        
-        # Count wins by team
-        wins_df = get_team_wins(df_filtered)
-        
-        fig = px.bar(
-            wins_df, 
-            x='winning_team_name', 
-            y='wins', 
-            title='Team Matches',
-            labels={'winning_team_name': 'Team', 'wins': 'Number of Wins'}
-        )
-        fig.update_yaxes(
-            tickmode='linear',  # Set tick mode to linear
-            tick0=0,            # Start ticks at 0
-            dtick=1             # Increment ticks by 1
-        )
-        return fig
+        wins_figure, format_figure = update_series_charts(selected_series)
     except Exception as e:
-        print(f"Error in update_wins_chart: {e}")
-        return go.Figure()
+        # Fallback built outside the memoizer, so a transient error is not cached for every user
+        print(f"Error in update_series_charts: {e}")
+        wins_figure, format_figure = go.Figure(), go.Figure()
+    return table_data, table_pages, page_current, wins_figure, format_figure
 
-# Callback to update match formats pie chart
-@app.callback(
-    Output('format-pie-chart', 'figure'),
-    Input('series-dropdown', 'value')
-)
-def update_format_chart(selected_series):
+@callback_memoizer.memoize()
+def update_series_charts(selected_series):
+    """
+    Wins and format charts for one series, memoized per data version
+
+    Errors propagate so that the memoizer never stores a failed result.
+
+    :param selected_series: Series name, or 'All Series'
+    :return: (wins figure, format figure)
+    """
+    df_filtered = filter_series(selected_series)
+    return update_wins_chart(selected_series, df_filtered), update_format_chart(selected_series, df_filtered)
+
+@callback_memoizer.memoize()
+def match_table_page(selected_series, page_current, page_size, sort_by, filter_query):
+    # Fetch only the requested page; total_rows rides along for the page count
+    sql, params = build_match_table_query(selected_series, page_current, page_size, sort_by, filter_query)
+    page = dashboard_data().query_cache.query(sql, params)
+    total_rows = int(page['total_rows'].iloc[0]) if not page.empty else 0
+    with timed(RENDER_SECONDS, 'match_table'):
+        table_data = page.drop(columns='total_rows').to_dict('records')
+    return table_data, page_count(total_rows, page_size)
+
+def update_match_table(selected_series, page_current=0, page_size=11, sort_by=None, filter_query=''):
     try:
-        if selected_series == 'All Series':
-            df_filtered = data_international_matches
-        else:
-            df_filtered = data_international_matches[data_international_matches['series_name'] == selected_series]
-        
-        # Count match formats
-        format_df = get_match_formats(df_filtered)
-        
-        fig = px.pie(
-            format_df, 
-            values='count', 
-            names='match_format', 
-            title='Match Formats Distribution'
-        )
-        return fig
+        # Errors are raised before the memoizer stores anything, so they are never cached
+        return match_table_page(selected_series, page_current or 0, page_size or 11, sort_by or [], filter_query or '')
     except Exception as e:
-        print(f"Error in update_format_chart: {e}")
-        return go.Figure()
+        print(f"Error in update_match_table: {e}")
+        return [], 1
+
+@timed_render('wins_chart')
+def update_wins_chart(selected_series, df_filtered=None):
+    # Keyed lookup of the precomputed wins per team
+    wins_df = get_series_team_wins(selected_series, df_filtered)
+    
+    fig = px.bar(
+        wins_df, 
+        x='winning_team_name', 
+        y='wins', 
+        title='Team Matches',
+        labels={'winning_team_name': 'Team', 'wins': 'Number of Wins'}
+    )
+    fig.update_yaxes(
+        tickmode='linear',  # Set tick mode to linear
+        tick0=0,            # Start ticks at 0
+        dtick=1             # Increment ticks by 1
+    )
+    return fig
+
+@timed_render('format_chart')
+def update_format_chart(selected_series, df_filtered=None):
+    # Keyed lookup of the precomputed format counts
+    format_df = get_series_match_formats(selected_series, df_filtered)
+    
+    fig = px.pie(
+        format_df, 
+        values='count', 
+        names='match_format', 
+        title='Match Formats Distribution'
+    )
+    return fig
+
+MATCH_SEARCH_LIMIT = 20
+
+def search_match_options(search_value, selected_match_id=None, limit=MATCH_SEARCH_LIMIT):
+    """
+    Top matches for the text typed into a match dropdown
+
+    :param search_value: Text typed so far
+    :param selected_match_id: Current dropdown value, kept in the options so its label stays visible
+    :param limit: Maximum number of options returned
+    :return: List of dropdown options
+    """
+    search_index = dashboard_data().load().search_index
+    options = search_index.search(search_value, limit=limit)
+    if selected_match_id is not None and all(option['value'] != selected_match_id for option in options):
+        selected = search_index.option_for(selected_match_id)
+        if selected is not None:
+            options.insert(0, selected)
+    return options
+
+def match_search_endpoint():
+    limit = min(request.args.get('limit', MATCH_SEARCH_LIMIT, type=int), 100)
+    return jsonify(dashboard_data().load().search_index.search(request.args.get('q', ''), limit=limit))
+
+# Search-as-you-type options for both match pickers
+@callback(
+    Output("match-dropdown", "options"),
+    Input("match-dropdown", "search_value"),
+    State("match-dropdown", "value")
+)
+@timed_callback
+def update_match_options(search_value, selected_match_id):
+    if not search_value:
+        raise PreventUpdate
+    return search_match_options(search_value, selected_match_id)
+
+@callback(
+    Output("match2-dropdown", "options"),
+    Input("match2-dropdown", "search_value"),
+    State("match2-dropdown", "value")
+)
+@timed_callback
+def update_match2_options(search_value, selected_match_id):
+    if not search_value:
+        raise PreventUpdate
+    return search_match_options(search_value, selected_match_id)
+
+@timed_render('partnership_figure')
+def build_partnership_figure(innings, color_map):
+    """
+    Stacked partnership bars for one innings, as two array-backed traces
+
+    One trace holds every first batsman's share and the other every second
+    batsman's share; colors, labels and hover names are per-bar arrays, so
+    the figure size does not grow with the number of traces. The legend
+    keeps one entry per batsman through empty legend-only traces.
+
+    :param innings: Innings dict from load_match_bundle
+    :param color_map: Player name -> bar color
+    :return: go.Figure
+    """
+    partnerships = innings['partnerships']
+    pairs = [f"{row['batsman1']} & {row['batsman2']}" for row in partnerships]
+
+    traces = []
+    for name_key, runs_key in (('batsman1', 'bat1_runs'), ('batsman2', 'bat2_runs')):
+        names = [row[name_key] for row in partnerships]
+        runs = [row[runs_key] for row in partnerships]
+        traces.append(go.Bar(
+            x=runs,
+            y=pairs,
+            orientation="h",
+            marker=dict(color=[color_map[name] for name in names]),
+            text=[f"{name} ({player_runs} runs)" for name, player_runs in zip(names, runs)],
+            textposition="auto",
+            customdata=names,
+            hovertemplate="<b>Batsman:</b> %{customdata}<br><b>Runs:</b> %{x}<br><extra>%{customdata}</extra>",
+            showlegend=False
+        ))
+
+    # One entry per batsman in order of appearance; the traces hold no points
+    batsmen = dict.fromkeys(name for row in partnerships for name in (row['batsman1'], row['batsman2']))
+    for name in batsmen:
+        traces.append(go.Bar(
+            x=[None],
+            y=[None],
+            orientation="h",
+            name=name,
+            marker=dict(color=color_map[name]),
+            hoverinfo="skip"
+        ))
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=f"Innings {innings['innings_id']} Partnerships",
+        xaxis=dict(title="Runs Scored", tickmode="linear",dtick =50),
+        yaxis=dict(title="Batsmen Pairs", automargin=True),
+        barmode="stack",  # Ensures contributions stack horizontally
+        showlegend=True,  # Adds a legend for batsman differentiation
+        height=600,  # Adjust chart height for readability
+    )
+    return fig
 
 # Callbacks
-@app.callback(
+@callback(
     [Output("scorecard-output", "children"), Output("partnership-output", "children")],
     [Input("match-dropdown", "value")]
 )
+@timed_callback
 def update_match_details(match_id):
     if not match_id:
         return "", ""
 
-    # Fetch data for the match
-    batsmen_data = load_data(f"""
-        SELECT innings_id, bat_team_name AS team_name, batsman_name, runs, balls_faced, fours, sixes, strike_rate
-        FROM batsmen_details WHERE match_id = {match_id}
-    """)
-    bowlers_data = load_data(f"""
-        SELECT innings_id, bowl_team_name AS team_name, bowler_name, overs, maidens, runs_conceded, wickets, economy
-        FROM bowlers_details WHERE match_id = {match_id}
-    """)
-    partnership_data = load_data(f"""
-        SELECT innings_id, bat1_name AS batsman1,bat1_runs, bat2_name AS batsman2,bat2_runs, total_runs AS runs, total_balls AS balls
-        FROM partnerships WHERE match_id = {match_id}
-    """)
+    # Fetch everything for the match in one round trip
+    bundle = load_match_bundle(match_id)
+    return dashboard_data().render_cache.render(
+        int(match_id), 'details', lambda: render_match_details(bundle),
+        cacheable=is_finished_match(bundle['header'])
+    )
+
+def is_finished_match(header):
+    """
+    Whether a match can no longer change, so its rendered views can be cached
+
+    :param header: Match header from load_match_bundle
+    :return: True for completed matches
+    """
+    return header is not None and (header['match_state'] or '').lower() == 'complete'
+
+@timed_render('match_details')
+def render_match_details(bundle):
+    """
+    Batting and bowling scorecards plus partnership charts for one match
+
+    :param bundle: Output of load_match_bundle
+    :return: (scorecard children, partnership children)
+    """
+    innings_list = bundle['innings']
 
     # Generate a unique color mapping for players
-    unique_players = set(partnership_data['batsman1']).union(set(partnership_data['batsman2']))
+    unique_players = {
+        player
+        for innings in innings_list
+        for row in innings['partnerships']
+        for player in (row['batsman1'], row['batsman2'])
+    }
     color_map = {player: px.colors.qualitative.Safe[i % len(px.colors.qualitative.Safe)] for i, player in enumerate(unique_players)}
 
     # Prepare batting and bowling scorecards for each innings
-    innings_list = batsmen_data['innings_id'].unique()
     scorecard_content = []
 
-    for innings_id in innings_list:
+    for innings in innings_list:
+        if not innings['batting']:
+            continue
+
         # Batting scorecard
-        batting_data = batsmen_data[batsmen_data['innings_id'] == innings_id]
-        batting_team = batting_data['team_name'].iloc[0]
-        scorecard_content.append(html.H3(f"{batting_team} Batting"))
+        scorecard_content.append(html.H3(f"{innings['batting_team']} Batting"))
 
         scorecard_content.append(html.Div([
             dash_table.DataTable(
@@ -237,16 +632,14 @@ def update_match_details(match_id):
                     {"name": col.replace('_', ' ').capitalize(), "id": col}
                     for col in ['batsman_name', 'runs', 'balls_faced', 'fours', 'sixes', 'strike_rate']
                 ],
-                data=batting_data.to_dict("records"),
+                data=innings['batting'],
                 style_table={'overflowX': 'auto'},
                 page_size=10
             )
         ]))
 
         # Bowling scorecard
-        bowling_data = bowlers_data[bowlers_data['innings_id'] == innings_id]
-        bowling_team = bowling_data['team_name'].iloc[0]
-        scorecard_content.append(html.H3(f"{bowling_team} Bowling"))
+        scorecard_content.append(html.H3(f"{innings['bowling_team']} Bowling"))
 
         scorecard_content.append(html.Div([
             dash_table.DataTable(
@@ -254,7 +647,7 @@ def update_match_details(match_id):
                     {"name": col.replace('_', ' ').capitalize(), "id": col}
                     for col in ['bowler_name', 'overs', 'maidens', 'runs_conceded', 'wickets', 'economy']
                 ],
-                data=bowling_data.to_dict("records"),
+                data=innings['bowling'],
                 style_table={'overflowX': 'auto'},
                 page_size=10
             )
@@ -262,114 +655,49 @@ def update_match_details(match_id):
 
     # Partnerships - Generate chart for each innings
     partnership_charts = []
-    for innings_id in partnership_data['innings_id'].unique():
-        innings_partnerships = partnership_data[partnership_data['innings_id'] == innings_id]
-        fig = go.Figure()
-
-        for i, row in innings_partnerships.iterrows():
-            # Contribution for Batsman 1
-            fig.add_trace(go.Bar(
-                x=[row["bat1_runs"]],
-                y=[f"{row['batsman1']} & {row['batsman2']}"],
-                orientation="h",
-                name=row["batsman1"],
-                marker=dict(color=color_map[row["batsman1"]]),
-                text=f"{row['batsman1']} ({row['bat1_runs']} runs)",
-                textposition="auto",
-                hovertemplate=(
-                    f"<b>Batsman:</b> {row['batsman1']}<br>"
-                    f"<b>Runs:</b> {row['bat1_runs']}<br>"
-                )
-            ))
-
-            # Contribution for Batsman 2
-            fig.add_trace(go.Bar(
-                x=[row["bat2_runs"]],
-                y=[f"{row['batsman1']} & {row['batsman2']}"],
-                orientation="h",
-                name=row["batsman2"],
-                marker=dict(color=color_map[row["batsman2"]]),
-                text=f"{row['batsman2']} ({row['bat2_runs']} runs)",
-                textposition="auto",
-                hovertemplate=(
-                    f"<b>Batsman:</b> {row['batsman2']}<br>"
-                    f"<b>Runs:</b> {row['bat2_runs']}<br>"
-                   
-                )
-            ))
-
-        fig.update_layout(
-            title=f"Innings {innings_id} Partnerships",
-            xaxis=dict(title="Runs Scored", tickmode="linear",dtick =50),
-            yaxis=dict(title="Batsmen Pairs", automargin=True),
-            barmode="stack",  # Ensures contributions stack horizontally
-            showlegend=True,  # Adds a legend for batsman differentiation
-            height=600,  # Adjust chart height for readability
-        )
+    for innings in innings_list:
+        if not innings['partnerships']:
+            continue
+        innings_id = innings['innings_id']
+        fig = build_partnership_figure(innings, color_map)
 
         partnership_charts.append(html.Div([
-            html.H3(f"Innings {innings_id} : {batting_team}  Partnership Contributions"),
+            html.H3(f"Innings {innings_id} : {innings['batting_team']}  Partnership Contributions"),
             dcc.Graph(figure=fig)
         ]))
 
     return scorecard_content, partnership_charts
-@app.callback(
+
+@callback(
     [Output("summary-output", "children")],
     [Input("match2-dropdown", "value")]
 )
+@timed_callback
 def update_match_summary(match_id):
     if not match_id:
         return [' ']
 
-    # Fetch match details by joining international_matches and match_details
-    match_details = load_data(f"""
-        SELECT 
-            im.team1_name, 
-            im.team2_name, 
-            im.match_desc, 
-            md.winning_team_name as winner_team, 
-            md.match_status as match_result, 
-            im.venue_ground || ', ' || im.venue_city as venue
-        FROM international_matches im
-        JOIN match_details md ON im.match_id = md.match_id
-        WHERE im.match_id = {match_id}
-    """)
-
-    # Fetch batsmen data
-    batsmen_data = load_data(f"""
-        SELECT 
-            innings_id, 
-            bat_team_name AS team_name, 
-            batsman_name, 
-            runs, 
-            balls_faced, 
-            strike_rate,
-            ROW_NUMBER() OVER (PARTITION BY innings_id ORDER BY runs DESC) as rank
-        FROM batsmen_details 
-        WHERE match_id = {match_id}
-    """)
-
-    # Fetch bowlers data
-    bowlers_data = load_data(f"""
-        SELECT 
-            innings_id, 
-            bowl_team_name AS team_name, 
-            bowler_name, 
-            wickets, 
-            runs_conceded, 
-            economy,
-            overs,
-            ROW_NUMBER() OVER (PARTITION BY innings_id ORDER BY wickets DESC, economy ASC) as rank
-        FROM bowlers_details 
-        WHERE match_id = {match_id}
-    """)
+    # Fetch everything for the match in one round trip
+    bundle = load_match_bundle(match_id)
+    return dashboard_data().render_cache.render(
+        int(match_id), 'summary', lambda: render_match_summary(bundle),
+        cacheable=is_finished_match(bundle['header'])
+    )
 
+@timed_render('match_summary')
+def render_match_summary(bundle):
+    """
+    Match overview card and top performers per innings
+
+    :param bundle: Output of load_match_bundle
+    :return: One-element list with the summary Div
+    """
     # Prepare summary content
     summary_content = []
 
     # Match Overview
-    if not match_details.empty:
-        match_info = match_details.iloc[0]
+    if bundle['header'] is not None:
+        match_info = bundle['header']
         summary_content.extend([
             dbc.Container([
                 create_match_overview(match_info)
@@ -377,14 +705,16 @@ def update_match_summary(match_id):
         ])
 
     # Top Performers for each innings
-    innings_list = sorted(batsmen_data['innings_id'].unique())
-    if innings_list is None:
+    innings_list = [innings for innings in bundle['innings'] if innings['batting']]
+    if not innings_list:
         summary_content.append(html.P("No innings data found."))
         return [html.Div(summary_content)]
-    for innings_id in innings_list:
+    for innings in innings_list:
+        innings_id = innings['innings_id']
+
         # Top 5 Batsmen
-        top_batsmen = batsmen_data[batsmen_data['innings_id'] == innings_id][batsmen_data['rank'] <= 5]
-        team_name = top_batsmen['team_name'].iloc[0] if not top_batsmen.empty else "Unknown Team"
+        top_batsmen = sorted(innings['batting'], key=lambda row: -(row['runs'] or 0))[:5]
+        team_name = innings['batting_team'] or "Unknown Team"
         
         summary_content.append(html.H3(f"Innings {innings_id} Top Batsmen - {team_name}"))
         summary_content.append(
@@ -393,14 +723,17 @@ def update_match_summary(match_id):
                     {"name": col.replace('_', ' ').capitalize(), "id": col}
                     for col in ['batsman_name', 'runs', 'balls_faced', 'strike_rate']
                 ],
-                data=top_batsmen[['batsman_name', 'runs', 'balls_faced', 'strike_rate']].to_dict("records"),
+                data=top_batsmen,
                 style_table={'overflowX': 'auto'},
             )
         )
 
         # Top 5 Bowlers
-        top_bowlers = bowlers_data[bowlers_data['innings_id'] == innings_id][bowlers_data['rank'] <= 5]
-        bowling_team_name = top_bowlers['team_name'].iloc[0] if not top_bowlers.empty else "Unknown Team"
+        top_bowlers = sorted(
+            innings['bowling'],
+            key=lambda row: (-(row['wickets'] or 0), row['economy'] if row['economy'] is not None else float('inf'))
+        )[:5]
+        bowling_team_name = innings['bowling_team'] if top_bowlers else "Unknown Team"
         
         summary_content.append(html.H3(f"Innings {innings_id} Top Bowlers - {bowling_team_name}"))
         summary_content.append(
@@ -409,7 +742,7 @@ def update_match_summary(match_id):
                     {"name": col.replace('_', ' ').capitalize(), "id": col}
                     for col in ['bowler_name', 'wickets', 'runs_conceded', 'economy', 'overs']
                 ],
-                data=top_bowlers[['bowler_name', 'wickets', 'runs_conceded', 'economy', 'overs']].to_dict("records"),
+                data=top_bowlers,
                 style_table={'overflowX': 'auto'},
             )
         )
@@ -544,6 +877,294 @@ def create_match_overview(match_info):
         }
     )
 
-# Run the app
+# Career tables are maintained by the ingest run, keyed by player id
+PLAYER_SEARCH_QUERY = """
+    SELECT player_id, any_value(player_name) AS player_name, any_value(team_name) AS team_name
+    FROM (
+        SELECT batsman_id AS player_id, batsman_name AS player_name, team_name, matches FROM player_batting_careers
+        UNION ALL
+        SELECT bowler_id, bowler_name, team_name, matches FROM player_bowling_careers
+    )
+    WHERE player_name ILIKE '%' || ? || '%' OR player_id = ?
+    GROUP BY player_id
+    ORDER BY max(matches) DESC, player_name
+    LIMIT ?
+"""
+
+PLAYER_BATTING_QUERY = "SELECT * FROM player_batting_careers WHERE batsman_id = ?"
+
+PLAYER_BOWLING_QUERY = "SELECT * FROM player_bowling_careers WHERE bowler_id = ?"
+
+def search_player_options(search_value, selected_player_id=None, limit=MATCH_SEARCH_LIMIT):
+    """
+    Players whose name contains the typed text, most capped first
+
+    :param search_value: Text typed so far
+    :param selected_player_id: Current dropdown value, kept in the options so its label stays visible
+    :param limit: Maximum number of options returned
+    :return: List of dropdown options
+    """
+    players = dashboard_data().query_cache.query(
+        PLAYER_SEARCH_QUERY, (search_value, selected_player_id, limit)
+    )
+    return [
+        {'label': f"{row.player_name} ({row.team_name})", 'value': int(row.player_id)}
+        for row in players.itertuples()
+    ]
+
+@callback(
+    Output("player-dropdown", "options"),
+    Input("player-dropdown", "search_value"),
+    State("player-dropdown", "value")
+)
+@timed_callback
+def update_player_options(search_value, selected_player_id):
+    if not search_value:
+        raise PreventUpdate
+    try:
+        return search_player_options(search_value, selected_player_id)
+    except Exception as e:
+        print(f"Error searching players: {e}")
+        return []
+
+@callback(
+    Output("player-output", "children"),
+    Input("player-dropdown", "value")
+)
+@timed_callback
+def update_player_career(player_id):
+    if not player_id:
+        return ""
+    try:
+        query_cache = dashboard_data().query_cache
+        batting = query_cache.query(PLAYER_BATTING_QUERY, (int(player_id),))
+        bowling = query_cache.query(PLAYER_BOWLING_QUERY, (int(player_id),))
+    except Exception as e:
+        print(f"Error in update_player_career: {e}")
+        return html.P("Career statistics are not available yet.")
+    return render_player_career(batting, bowling)
+
+def _career_value(value):
+    # Ints as ints, rates to two places, '-' where undefined (e.g. average with no dismissals)
+    if pd.isna(value):
+        return '-'
+    if hasattr(value, 'item'):
+        value = value.item()
+    return round(value, 2) if isinstance(value, float) else value
+
+def _career_table(record, columns):
+    return dash_table.DataTable(
+        columns=[{"name": col.replace('_', ' ').capitalize(), "id": col} for col in columns],
+        data=[{col: _career_value(record[col]) for col in columns}],
+        style_table={'overflowX': 'auto'},
+    )
+
+@timed_render('player_career')
+def render_player_career(batting, bowling):
+    """
+    Career batting and bowling tables for one player
+
+    :param batting: player_batting_careers row for the player (possibly empty)
+    :param bowling: player_bowling_careers row for the player (possibly empty)
+    :return: List of components
+    """
+    content = []
+    if not batting.empty:
+        content.append(html.H3(f"{batting['batsman_name'].iloc[0]} - {batting['team_name'].iloc[0]}"))
+    elif not bowling.empty:
+        content.append(html.H3(f"{bowling['bowler_name'].iloc[0]} - {bowling['team_name'].iloc[0]}"))
+
+    content.append(html.H4("Batting"))
+    if batting.empty:
+        content.append(html.P("No batting innings."))
+    else:
+        content.append(_career_table(batting.iloc[0], [
+            'matches', 'innings', 'not_outs', 'runs', 'highest_score', 'average',
+            'strike_rate', 'hundreds', 'fifties', 'fours', 'sixes'
+        ]))
+
+    content.append(html.H4("Bowling"))
+    if bowling.empty:
+        content.append(html.P("No bowling innings."))
+    else:
+        record = bowling.iloc[0].copy()
+        # Back to cricket notation, and best figures as wickets/runs
+        record['overs'] = f"{int(record['balls']) // 6}.{int(record['balls']) % 6}"
+        record['best_figures'] = (f"{int(record['best_wickets'])}/{int(record['best_runs'])}"
+                                  if pd.notna(record['best_wickets']) else None)
+        content.append(_career_table(record, [
+            'matches', 'innings', 'overs', 'maidens', 'runs_conceded', 'wickets',
+            'best_figures', 'average', 'economy', 'strike_rate', 'five_wicket_hauls'
+        ]))
+    return content
+
+# Teams shown in the head-to-head heatmap, those with the most matches first
+HEAD_TO_HEAD_TEAMS = 20
+
+def get_head_to_head(match_format=ALL_FORMATS, year_range=None):
+    """
+    Team-vs-team matrix for one filter, cached per filter and data version
+
+    :param match_format: Format name, or ALL_FORMATS
+    :param year_range: (first year, last year), or None for every year
+    :return: HeadToHeadMatrix; shared between callers, do not mutate
+    """
+    sql, params = build_head_to_head_query(match_format, year_range)
+    return dashboard_data().query_cache.cached(
+        sql, params, lambda con: load_head_to_head(con, match_format, year_range)
+    )
+
+@callback(
+    [Output('h2h-format-dropdown', 'options'),
+     Output('h2h-year-slider', 'min'),
+     Output('h2h-year-slider', 'max'),
+     Output('h2h-year-slider', 'value'),
+     Output('h2h-year-slider', 'marks')],
+    Input('h2h-format-dropdown', 'id')
+)
+@timed_callback
+def update_head_to_head_controls(_):
+    try:
+        matches = dashboard_data().load().matches
+        formats = sorted(matches['match_format'].dropna().unique())
+        years = matches['start_date'].dropna().dt.year
+        first_year, last_year = int(years.min()), int(years.max())
+    except Exception as e:
+        print(f"Error creating head to head controls: {e}")
+        raise PreventUpdate
+    options = [{'label': ALL_FORMATS, 'value': ALL_FORMATS}] + [{'label': f, 'value': f} for f in formats]
+    marks = {year: str(year) for year in range(first_year, last_year + 1, max(1, (last_year - first_year) // 8 or 1))}
+    return options, first_year, last_year, [first_year, last_year], marks
+
+@callback(
+    Output('h2h-heatmap', 'figure'),
+    [Input('h2h-format-dropdown', 'value'),
+     Input('h2h-year-slider', 'value'),
+     Input('h2h-metric', 'value')]
+)
+@timed_callback
+def update_head_to_head(match_format, year_range, metric):
+    try:
+        return head_to_head_figure(match_format or ALL_FORMATS, year_range or None, metric or 'win_pct')
+    except Exception as e:
+        print(f"Error in update_head_to_head: {e}")
+        return go.Figure()
+
+@callback_memoizer.memoize()
+@timed_render('head_to_head')
+def head_to_head_figure(match_format, year_range, metric):
+    """
+    Heatmap of one head-to-head metric for the most active teams
+
+    :param match_format: Format name, or ALL_FORMATS
+    :param year_range: [first year, last year], or None
+    :param metric: 'win_pct' or one of OUTCOMES
+    :return: go.Figure
+    """
+    matrix = get_head_to_head(match_format, tuple(year_range) if year_range else None).top(HEAD_TO_HEAD_TEAMS)
+    played = matrix.counts[0]
+    if metric == 'win_pct':
+        z, label = matrix.win_percentage(), 'Win %'
+    else:
+        z = np.where(played > 0, matrix.counts[OUTCOMES.index(metric)], np.nan)
+        label = metric.replace('_', ' ').capitalize()
+
+    fig = go.Figure(go.Heatmap(
+        z=z,
+        x=matrix.teams,
+        y=matrix.teams,
+        # Every outcome per cell for the hover box, in OUTCOMES order
+        customdata=np.moveaxis(matrix.counts, 0, -1),
+        colorscale='RdYlGn' if metric == 'win_pct' else 'Blues',
+        colorbar=dict(title=label),
+        texttemplate='%{z:.0f}',
+        hovertemplate=("<b>%{y}</b> vs <b>%{x}</b><br>Played: %{customdata[0]}<br>Won: %{customdata[1]}"
+                       "<br>Lost: %{customdata[2]}<br>No result: %{customdata[3]}<extra></extra>"),
+        hoverongaps=False
+    ))
+    fig.update_layout(
+        title=f"{label} by team (rows) against opponent (columns)",
+        xaxis=dict(title="Opponent", side="top"),
+        yaxis=dict(title="Team", autorange="reversed"),
+        height=700
+    )
+    return fig
+
+def cache_stats_endpoint():
+    data = dashboard_data()
+    return jsonify({
+        'callbacks': callback_memoizer.stats(),
+        'query_cache_entries': len(data.query_cache.cache),
+        'render_cache_entries': len(data.render_cache.cache),
+        'render_cache_bytes': data.render_cache.cache.total_bytes
+    })
+
+def metrics_endpoint():
+    return Response(metrics.REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+def slow_queries_endpoint():
+    return jsonify(list(metrics.SLOW_QUERY_LOG))
+
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+def _observe_request(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        # Label by route pattern, not raw path, to keep the series count bounded
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.REQUEST_SECONDS.observe(time.perf_counter() - started, route)
+    return response
+
+def health_endpoint():
+    report = dashboard_data().status()
+    return jsonify(report), 200 if report['status'] == 'ready' else 503
+
+def prime_default_view():
+    """Run the queries behind the first page view so they are cached before anyone asks."""
+    update_match_table('All Series')
+    update_series_charts('All Series')
+
+def create_app(db_path=None, warmup=True):
+    """
+    Create the dashboard without loading any data
+
+    Match data is loaded on first use, or straight away in a background
+    thread when `warmup` is set. GET /health reports readiness: 200 once
+    the data is loaded, 503 while loading or after a failed load. GET
+    /api/cache/stats reports memoization hits and misses. GET /metrics
+    serves query, callback, render and request timings as Prometheus text;
+    GET /api/slow-queries lists EXPLAIN ANALYZE plans of queries slower than
+    $CRICKET_SLOW_QUERY_SECONDS.
+
+    :param db_path: DuckDB database to serve; defaults to $CRICKET_DB_PATH or cricket_matches.db
+    :param warmup: Start loading the data in the background immediately
+    :return: dash.Dash application
+    """
+    global DB_PATH
+    if db_path is not None:
+        DB_PATH = db_path
+
+    dash_app = dash.Dash(__name__)
+    dash_app.title = "Cricket Dashboard"
+    dash_app.layout = build_layout
+    dash_app.server.add_url_rule('/health', 'health', health_endpoint)
+    dash_app.server.add_url_rule('/api/cache/stats', 'cache_stats', cache_stats_endpoint)
+    dash_app.server.add_url_rule('/api/matches/search', 'match_search', match_search_endpoint)
+    dash_app.server.add_url_rule('/metrics', 'metrics', metrics_endpoint)
+    dash_app.server.add_url_rule('/api/slow-queries', 'slow_queries', slow_queries_endpoint)
+    dash_app.server.before_request(_start_request_timer)
+    dash_app.server.after_request(_observe_request)
+
+    if warmup:
+        dashboard_data().warmup(prime_default_view)
+    return dash_app
+
+app = create_app()
+
+# WSGI entry point: gunicorn -c gunicorn.conf.py app:server
+server = app.server
+
+# Run the app with the development server
 if __name__ == "__main__":
-    app.run_server(debug=True)
+    app.run(debug=DEBUG, dev_tools_ui=DEBUG, dev_tools_hot_reload=DEBUG)
@@ -0,0 +1,119 @@
+"""
+Benchmark per-match lookups as the archive grows, in three layouts: rows
+appended in arbitrary order, clustered by (match_id, innings_id), and
+clustered with match_id indexes.
+
+    python benchmarks/bench_match_lookup.py --sizes 1000,10000,100000
+
+Two timings per lookup: the four `WHERE match_id = ?` table reads a match
+view makes, which depend on the storage layout, and the dashboard's match
+bundle query, which adds a fixed planning cost on top. Both should stay
+flat across sizes once the tables are clustered and indexed.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import duckdb
+import numpy as np
+
+from synthetic import build_database
+
+from app import MATCH_BUNDLE_QUERY
+from cluster_tables import cluster_tables
+from schema import MATCH_TABLES, create_scorecard_table, ensure_match_indexes, match_index_name, table_columns
+
+LAYOUTS = ['scattered', 'clustered', 'clustered+index']
+
+def drop_match_indexes(con):
+    for table_name in MATCH_TABLES:
+        con.execute(f"DROP INDEX IF EXISTS {match_index_name(table_name)}")
+
+def scatter_tables(con, seed):
+    # Rewrite each table in a random row order, as years of out-of-order ingest leave it
+    drop_match_indexes(con)
+    for table_name in MATCH_TABLES:
+        columns = ', '.join(table_columns(table_name))
+        create_scorecard_table(con, table_name, f"{table_name}_scattered")
+        con.execute(f"""
+            INSERT INTO {table_name}_scattered ({columns})
+            SELECT {columns} FROM {table_name} ORDER BY hash(rowid + {seed})
+        """)
+        con.execute(f"DROP TABLE {table_name}")
+        con.execute(f"ALTER TABLE {table_name}_scattered RENAME TO {table_name}")
+    con.execute("CHECKPOINT")
+
+def time_lookups(con, match_ids):
+    reads, bundles = [], []
+    for match_id in match_ids:
+        started = time.perf_counter()
+        for table_name in MATCH_TABLES:
+            con.execute(f"SELECT * FROM {table_name} WHERE match_id = ?", [match_id]).fetchall()
+        reads.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        con.execute(MATCH_BUNDLE_QUERY, [match_id]).fetchall()
+        bundles.append(time.perf_counter() - started)
+    return {name: tuple(np.percentile(np.asarray(samples) * 1000, [50, 95]))
+            for name, samples in (('table reads', reads), ('bundle query', bundles))}
+
+def bench_size(db_path, n_matches, lookups, seed):
+    if not os.path.exists(db_path):
+        started = time.perf_counter()
+        build_database(db_path, n_matches, seed=seed, batch_size=2000)
+        print(f"built {n_matches} matches in {time.perf_counter() - started:.1f}s")
+
+    con = duckdb.connect(db_path)
+    try:
+        rows = sum(con.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in MATCH_TABLES)
+        all_ids = [match_id for (match_id,) in con.execute("SELECT match_id FROM match_details").fetchall()]
+        match_ids = random.Random(seed).sample(all_ids, min(lookups, len(all_ids)))
+
+        results = {}
+        scatter_tables(con, seed)
+        time_lookups(con, match_ids[:10])
+        results['scattered'] = time_lookups(con, match_ids)
+
+        cluster_tables(con, force=True)
+        drop_match_indexes(con)
+        time_lookups(con, match_ids[:10])
+        results['clustered'] = time_lookups(con, match_ids)
+
+        ensure_match_indexes(con)
+        time_lookups(con, match_ids[:10])
+        results['clustered+index'] = time_lookups(con, match_ids)
+    finally:
+        con.close()
+    return rows, results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000,100000', help="Comma-separated archive sizes, in matches")
+    parser.add_argument('--lookups', type=int, default=300, help="Matches looked up per layout")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workdir', help="Keep the synthetic databases here and reuse them between runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workdir = args.workdir or tmpdir
+        report = []
+        for n_matches in [int(size) for size in args.sizes.split(',')]:
+            db_path = os.path.join(workdir, f"lookup_{n_matches}_{args.seed}.db")
+            report.append((n_matches, *bench_size(db_path, n_matches, args.lookups, args.seed)))
+
+    for metric in ('table reads', 'bundle query'):
+        print(f"\n{metric}, {args.lookups} lookups per layout, p50 / p95 ms")
+        print(f"{'matches':>8} {'rows':>10} " + ' '.join(f"{layout:>20}" for layout in LAYOUTS))
+        for n_matches, rows, results in report:
+            cells = ' '.join(f"{results[layout][metric][0]:>9.3f} / {results[layout][metric][1]:>7.3f}"
+                             for layout in LAYOUTS)
+            print(f"{n_matches:>8} {rows:>10} {cells}")
+        if len(report) > 1:
+            growth = ' '.join(f"{report[-1][2][layout][metric][0] / report[0][2][layout][metric][0]:>19.1f}x"
+                              for layout in LAYOUTS)
+            print(f"{'p50 growth':>19} {growth}")
+
+if __name__ == "__main__":
+    main()
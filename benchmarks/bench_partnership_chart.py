@@ -0,0 +1,86 @@
+"""
+Benchmark the partnership chart: two traces per partnership (the old
+construction) against two array-backed traces per innings. Reports build
+time and serialized figure size.
+
+    python benchmarks/bench_partnership_chart.py --partnerships 10 --innings 4
+"""
+import argparse
+import os
+import sys
+import time
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import build_partnership_figure
+
+def make_innings(innings_id, n_partnerships):
+    players = [f"Player {innings_id}-{i}" for i in range(n_partnerships + 1)]
+    return {
+        'innings_id': innings_id,
+        'partnerships': [
+            {'batsman1': players[i], 'bat1_runs': (i * 7) % 60, 'batsman2': players[i + 1],
+             'bat2_runs': (i * 11) % 45, 'runs': 0, 'balls': 0}
+            for i in range(n_partnerships)
+        ]
+    }
+
+def color_map_for(innings_list):
+    players = {row[key] for innings in innings_list for row in innings['partnerships'] for key in ('batsman1', 'batsman2')}
+    palette = px.colors.qualitative.Safe
+    return {player: palette[i % len(palette)] for i, player in enumerate(players)}
+
+def per_partnership_figure(innings, color_map):
+    fig = go.Figure()
+    for row in innings['partnerships']:
+        for name_key, runs_key in (('batsman1', 'bat1_runs'), ('batsman2', 'bat2_runs')):
+            fig.add_trace(go.Bar(
+                x=[row[runs_key]],
+                y=[f"{row['batsman1']} & {row['batsman2']}"],
+                orientation="h",
+                name=row[name_key],
+                marker=dict(color=color_map[row[name_key]]),
+                text=f"{row[name_key]} ({row[runs_key]} runs)",
+                textposition="auto",
+                hovertemplate=f"<b>Batsman:</b> {row[name_key]}<br><b>Runs:</b> {row[runs_key]}<br>"
+            ))
+    fig.update_layout(
+        title=f"Innings {innings['innings_id']} Partnerships",
+        xaxis=dict(title="Runs Scored", tickmode="linear", dtick=50),
+        yaxis=dict(title="Batsmen Pairs", automargin=True),
+        barmode="stack",
+        showlegend=True,
+        height=600,
+    )
+    return fig
+
+def measure(build, innings_list, color_map, repeats):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        figures = [build(innings, color_map) for innings in innings_list]
+    elapsed = (time.perf_counter() - started) / repeats
+    return elapsed, sum(len(fig.data) for fig in figures), sum(len(fig.to_json()) for fig in figures)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--partnerships', type=int, default=10)
+    parser.add_argument('--innings', type=int, default=4)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    innings_list = [make_innings(i + 1, args.partnerships) for i in range(args.innings)]
+    color_map = color_map_for(innings_list)
+
+    old_time, old_traces, old_bytes = measure(per_partnership_figure, innings_list, color_map, args.repeats)
+    new_time, new_traces, new_bytes = measure(build_partnership_figure, innings_list, color_map, args.repeats)
+
+    print(f"{args.innings} innings x {args.partnerships} partnerships")
+    print(f"  per-partnership traces: {old_time * 1000:8.2f} ms  {old_traces:4d} traces  {old_bytes / 1024:7.1f} KiB")
+    print(f"  array-backed traces:    {new_time * 1000:8.2f} ms  {new_traces:4d} traces  {new_bytes / 1024:7.1f} KiB")
+    print(f"  speedup {old_time / new_time:.1f}x, {old_bytes / new_bytes:.1f}x smaller")
+
+if __name__ == "__main__":
+    main()
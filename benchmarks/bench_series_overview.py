@@ -0,0 +1,69 @@
+"""
+Benchmark the Series Overview filter: three full-frame scans (one per
+callback, the old layout) against one lookup in the prebuilt series index.
+
+    python benchmarks/bench_series_overview.py --matches 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import build_series_index, filter_by_series
+
+def make_matches(n_matches, n_series, seed=0):
+    rng = np.random.default_rng(seed)
+    series = np.array([f"Series {i}" for i in range(n_series)])
+    teams = np.array([f"Team {i}" for i in range(20)])
+    return pd.DataFrame({
+        'match_id': np.arange(n_matches),
+        'series_name': series[rng.integers(0, n_series, n_matches)],
+        'match_desc': [f"{i}th Match" for i in range(n_matches)],
+        'team1_name': teams[rng.integers(0, 20, n_matches)],
+        'team2_name': teams[rng.integers(0, 20, n_matches)],
+        'winning_team_name': teams[rng.integers(0, 20, n_matches)],
+        'match_format': rng.choice(['TEST', 'ODI', 'T20'], n_matches),
+        'status': 'Complete'
+    })
+
+def scan_filter(df, selected_series):
+    return df[df['series_name'] == selected_series]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matches', type=int, default=100000)
+    parser.add_argument('--series', type=int, default=2000)
+    parser.add_argument('--interactions', type=int, default=200)
+    args = parser.parse_args()
+
+    df = make_matches(args.matches, args.series)
+    picks = df['series_name'].sample(args.interactions, random_state=1).tolist()
+
+    start = time.perf_counter()
+    index = build_series_index(df)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for series in picks:
+        for _ in range(3):
+            scan_filter(df, series)
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for series in picks:
+        filter_by_series(df, index, series)
+    index_seconds = time.perf_counter() - start
+
+    print(f"{args.matches} matches, {args.series} series, {args.interactions} interactions")
+    print(f"index build:            {build_seconds * 1000:8.2f} ms (once at load)")
+    print(f"3x full scan per pick:  {scan_seconds / args.interactions * 1000:8.3f} ms")
+    print(f"1x index take per pick: {index_seconds / args.interactions * 1000:8.3f} ms")
+    print(f"speedup:                {scan_seconds / index_seconds:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark dashboard cold start: import time, first page response and time
+until /health reports the data as ready, each in a fresh interpreter.
+
+    python benchmarks/bench_startup.py --runs 5 --db cricket_matches.db
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a child process so every measurement starts cold
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+client = app.app.server.test_client()
+client.get('/')
+first_response = time.perf_counter()
+while client.get('/health').status_code != 200:
+    if app.dashboard_data().status()['status'] == 'error':
+        sys.exit(app.dashboard_data().status()['error'])
+    time.sleep(0.005)
+ready = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'first_response': first_response - started,
+    'ready': ready - started,
+}))
+"""
+
+def run_probe(db_path):
+    env = dict(os.environ, CRICKET_DB_PATH=os.path.abspath(db_path))
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--db', default=os.path.join(ROOT, 'cricket_matches.db'))
+    args = parser.parse_args()
+
+    runs = [run_probe(args.db) for _ in range(args.runs)]
+    print(f"{args.runs} cold starts against {args.db}")
+    for phase in ('import', 'first_response', 'ready'):
+        times = [run[phase] * 1000 for run in runs]
+        print(f"  {phase:<15} median {statistics.median(times):8.1f} ms   max {max(times):8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Benchmark suite: dashboard callback latency (p50/p95/p99), scorecard parser
+throughput and DuckDB insert throughput, at several archive sizes.
+
+    python benchmarks/bench_suite.py --sizes 100,1000,5000 --output bench.json
+    python benchmarks/bench_suite.py --baseline bench.json --tolerance 1.25
+
+Results are written as JSON. With --baseline, each result is compared to the
+matching one in an earlier run; the script exits with status 1 if any got
+slower than the tolerance allows.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import duckdb
+import numpy as np
+
+from synthetic import ROOT, make_matches, write_matches
+
+from ingest_scorecard import TABLE_PARSERS, ScorecardBatchWriter, store_scorecard
+from schema import ensure_schema
+
+CALLBACKS = ['update_match_table', 'update_wins_chart', 'update_format_chart', 'update_match_details', 'update_match_summary']
+
+def percentiles(samples):
+    p50, p95, p99 = np.percentile(np.asarray(samples) * 1000, [50, 95, 99])
+    return {'p50_ms': round(p50, 3), 'p95_ms': round(p95, 3), 'p99_ms': round(p99, 3)}
+
+def bench_parsers(matches, repeats):
+    results = []
+    for name, parser in TABLE_PARSERS.items():
+        best = float('inf')
+        for _ in range(repeats):
+            started = time.perf_counter()
+            rows = sum(len(parser(row['match_id'], scorecard)) for row, scorecard in matches)
+            best = min(best, time.perf_counter() - started)
+        results.append({
+            'group': 'parser', 'name': parser.__name__, 'matches': len(matches), 'table': name,
+            'seconds': round(best, 6), 'docs_per_s': round(len(matches) / best, 1), 'rows_per_s': round(rows / best, 1)
+        })
+    return results
+
+def bench_inserts(matches, workdir, batch_size):
+    results = []
+
+    def timed_load(name, load, n_matches):
+        db_path = os.path.join(workdir, f"insert_{name}_{len(matches)}.db")
+        con = duckdb.connect(db_path)
+        try:
+            ensure_schema(con)
+            started = time.perf_counter()
+            rows = load(con, matches[:n_matches])
+            elapsed = time.perf_counter() - started
+        finally:
+            con.close()
+            os.remove(db_path)
+        results.append({
+            'group': 'insert', 'name': name, 'matches': n_matches,
+            'seconds': round(elapsed, 6), 'docs_per_s': round(n_matches / elapsed, 1), 'rows_per_s': round(rows / elapsed, 1)
+        })
+
+    def batch_writer(con, subset):
+        writer = ScorecardBatchWriter(con, batch_size=batch_size)
+        rows = 0
+        for row, scorecard in subset:
+            flushed = writer.add(row['match_id'], scorecard)
+            if flushed:
+                rows += sum(flushed[1].values())
+        rows += sum(writer.flush()[1].values())
+        return rows
+
+    def per_match(con, subset):
+        return sum(sum(store_scorecard(con, row['match_id'], scorecard).values()) for row, scorecard in subset)
+
+    timed_load('ScorecardBatchWriter', batch_writer, len(matches))
+    # One transaction per match is much slower; cap it so large sizes stay quick
+    timed_load('store_scorecard', per_match, min(len(matches), 500))
+    return results
+
+def bench_callbacks(app, matches, iterations, seed):
+    data = app.dashboard_data().load()
+    rng = np.random.default_rng(seed)
+    series = ['All Series'] + sorted({row['series_name'] for row, _ in matches})
+    match_ids = [row['match_id'] for row, _ in matches]
+
+    def clear_caches():
+        app.callback_memoizer.backend.clear()
+        data.query_cache.cache.clear()
+        data.render_cache.cache.clear()
+
+    calls = {
+        'update_match_table': lambda: app.update_match_table(
+            str(rng.choice(series)), int(rng.integers(0, 3)), 11,
+            [{'column_id': 'team1_name', 'direction': 'asc'}] if rng.random() < 0.5 else [], ''
+        ),
+        'update_wins_chart': lambda: app.update_wins_chart(str(rng.choice(series))),
+        'update_format_chart': lambda: app.update_format_chart(str(rng.choice(series))),
+        'update_match_details': lambda: app.update_match_details(int(rng.choice(match_ids))),
+        'update_match_summary': lambda: app.update_match_summary(int(rng.choice(match_ids)))
+    }
+
+    results = []
+    for name in CALLBACKS:
+        for mode in ('cold', 'warm'):
+            samples = []
+            for _ in range(iterations):
+                # Cold: every cache empty. Warm: the same call was just made, so caches can answer it
+                state = rng.bit_generator.state
+                if mode == 'cold':
+                    clear_caches()
+                else:
+                    calls[name]()
+                    rng.bit_generator.state = state
+                started = time.perf_counter()
+                calls[name]()
+                samples.append(time.perf_counter() - started)
+            results.append({'group': 'callback', 'name': name, 'mode': mode, 'matches': len(matches),
+                            'iterations': iterations, **percentiles(samples)})
+    return results
+
+def result_key(result):
+    return (result['group'], result['name'], result.get('mode'), result['matches'])
+
+def compare(results, baseline_path, tolerance):
+    """Print results that got slower than `tolerance` times the baseline; return how many."""
+    with open(baseline_path) as f:
+        baseline = {result_key(result): result for result in json.load(f)['results']}
+    regressions = 0
+    for result in results:
+        old = baseline.get(result_key(result))
+        if old is None:
+            continue
+        metric = 'p95_ms' if result['group'] == 'callback' else 'seconds'
+        ratio = result[metric] / old[metric] if old[metric] else 1.0
+        if ratio > tolerance:
+            regressions += 1
+            print(f"REGRESSION {result['group']}/{result['name']} {result.get('mode') or ''} "
+                  f"@{result['matches']}: {metric} {old[metric]} -> {result[metric]} ({ratio:.2f}x)")
+    return regressions
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,5000', help='Comma-separated archive sizes (matches)')
+    parser.add_argument('--iterations', type=int, default=50, help='Calls per callback and mode')
+    parser.add_argument('--repeats', type=int, default=3, help='Parser runs per size (best is kept)')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='Allowed slowdown before flagging a regression')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        # Import after the first database exists so the app never warms up against the default one
+        os.environ['CRICKET_DB_PATH'] = os.path.join(workdir, f"archive_{sizes[0]}.db")
+        for size in sizes:
+            print(f"Archive of {size} matches")
+            db_path = os.path.join(workdir, f"archive_{size}.db")
+            matches = make_matches(size, seed=args.seed)
+            write_matches(db_path, matches, batch_size=args.batch_size)
+
+            results.extend(bench_parsers(matches, args.repeats))
+            results.extend(bench_inserts(matches, workdir, args.batch_size))
+
+            import app
+            app.create_app(db_path, warmup=False)
+            results.extend(bench_callbacks(app, matches, args.iterations, args.seed))
+            app.dashboard_data().manager.close()
+
+    for result in results:
+        timing = (f"p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms"
+                  if result['group'] == 'callback' else f"{result['docs_per_s']:10.1f} docs/s  {result['rows_per_s']:12.1f} rows/s")
+        label = f"{result['group']}/{result['name']}" + (f" ({result['mode']})" if 'mode' in result else '')
+        print(f"  {result['matches']:>6}  {label:<42} {timing}")
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'duckdb': duckdb.__version__,
+        'platform': platform.platform(),
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
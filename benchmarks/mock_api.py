@@ -0,0 +1,151 @@
+"""
+Local stand-in for the Cricbuzz API, serving seeded synthetic data.
+
+    python benchmarks/mock_api.py --matches 100000 --latency-ms 40 --rate-limit 50
+    CRICBUZZ_API_URL=http://127.0.0.1:8765 python fetch_data/ingest_scorecard.py --db synthetic.db --rps 50
+
+Serves /mcenter/v1/{match_id}/scard and /teams/v1/international with the
+same ids and data as benchmarks/synthetic.py for the same seed, so a
+database built with --matches-only can be filled by the real fetchers.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fetch_data'))
+
+from api_client import TokenBucket
+from synthetic import FIRST_MATCH_ID, is_live, make_match, make_teams_response
+
+SCORECARD_PATH = re.compile(r'^/mcenter/v1/(\d+)/scard$')
+
+class MockCricbuzzServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering like the Cricbuzz API.
+
+    Each response is delayed by `latency` seconds plus up to `jitter` seconds.
+    Requests beyond `rate_limit` per second, and a random `error_rate` share of
+    the rest, get a 429 with a Retry-After header.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, n_matches, seed=0, live_fraction=0.0, latency=0.0, jitter=0.0,
+                 rate_limit=None, error_rate=0.0, retry_after=1):
+        """
+        Args:
+            address (tuple): (host, port) to listen on
+            n_matches (int): Match ids FIRST_MATCH_ID .. FIRST_MATCH_ID + n_matches - 1 exist
+            seed (int): Archive seed, as in synthetic.py
+            live_fraction (float): Share of matches served as still in progress
+            latency (float): Base delay per response in seconds
+            jitter (float): Extra random delay per response, up to this many seconds
+            rate_limit (float): Requests per second before answering 429, None for no limit
+            error_rate (float): Share of requests answered 429 regardless of rate
+            retry_after (int): Retry-After value sent with 429s, in seconds
+        """
+        super().__init__(address, MockCricbuzzHandler)
+        self.n_matches = n_matches
+        self.seed = seed
+        self.live_fraction = live_fraction
+        self.latency = latency
+        self.jitter = jitter
+        self.limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.counts = {'200': 0, '404': 0, '429': 0}
+        self.counts_lock = threading.Lock()
+
+    def throttled(self):
+        """Whether the current request should be answered with 429."""
+        if self.error_rate and random.random() < self.error_rate:
+            return True
+        return self.limiter is not None and not self.limiter.try_acquire()
+
+    def count(self, status):
+        with self.counts_lock:
+            self.counts[str(status)] = self.counts.get(str(status), 0) + 1
+
+    def scorecard(self, match_id):
+        if not FIRST_MATCH_ID <= match_id < FIRST_MATCH_ID + self.n_matches:
+            return None
+        _, scorecard = make_match(match_id, self.seed, complete=not is_live(match_id, self.seed, self.live_fraction))
+        return scorecard
+
+class MockCricbuzzHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real API, so clients can reuse connections
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.random() * server.jitter)
+
+        if server.throttled():
+            self._send(429, {'message': 'You have exceeded the rate limit per second for your plan'},
+                       {'Retry-After': str(server.retry_after)})
+            return
+
+        path = self.path.split('?', 1)[0]
+        body = None
+        match = SCORECARD_PATH.match(path)
+        if match:
+            body = server.scorecard(int(match.group(1)))
+        elif path == '/teams/v1/international':
+            body = make_teams_response()
+
+        if body is None:
+            self._send(404, {'message': f"No data for {path}"})
+        else:
+            self._send(200, body)
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.count(status)
+
+    def log_message(self, format, *args):
+        # One line per request would swamp a load test
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic Cricbuzz API responses locally")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--matches', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--live-fraction', type=float, default=0.0, help="Share of matches still in progress")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Base delay per response")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="Extra random delay per response")
+    parser.add_argument('--rate-limit', type=float, default=None, help="Requests per second before 429s")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered 429 at random")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds sent with 429s")
+    args = parser.parse_args()
+
+    server = MockCricbuzzServer(
+        (args.host, args.port), args.matches, seed=args.seed, live_fraction=args.live_fraction,
+        latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+        rate_limit=args.rate_limit, error_rate=args.error_rate, retry_after=args.retry_after
+    )
+    print(f"Mock Cricbuzz API on http://{args.host}:{args.port} with {args.matches} matches")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Responses: {server.counts}")
+
+if __name__ == "__main__":
+    main()
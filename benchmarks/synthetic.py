@@ -0,0 +1,343 @@
+"""
+Seeded synthetic cricket data in the shape of the Cricbuzz API.
+
+Every match is generated from (seed, match_id) alone, so any single match can
+be rebuilt on demand, archives of any size stream in constant memory, and the
+same seed always yields the same data.
+
+    python benchmarks/synthetic.py --db synthetic.db --matches 100000
+    python benchmarks/synthetic.py --db synthetic.db --matches 100000 --matches-only
+
+--matches-only writes just international_matches, leaving the scorecards for
+ingest_scorecard.py to fetch from benchmarks/mock_api.py.
+"""
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import duckdb
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'fetch_data'))
+
+from career_stats import refresh_career_stats
+from ingest_scorecard import ScorecardBatchWriter
+from schema import ensure_schema
+from series_aggregates import refresh_series_aggregates
+
+TEAMS = [
+    (2, 'India', 'IND'), (4, 'Australia', 'AUS'), (9, 'England', 'ENG'),
+    (13, 'New Zealand', 'NZ'), (11, 'South Africa', 'RSA'), (3, 'Pakistan', 'PAK'),
+    (5, 'Sri Lanka', 'SL'), (10, 'West Indies', 'WI'), (6, 'Bangladesh', 'BAN'),
+    (96, 'Afghanistan', 'AFG')
+]
+# Format -> (innings, overs per innings)
+FORMATS = {'TEST': (4, 90.0), 'ODI': (2, 50.0), 'T20': (2, 20.0)}
+FORMAT_LABELS = {'TEST': 'Test', 'ODI': 'ODI', 'T20': 'T20I'}
+MATCHES_PER_SERIES = 5
+SQUAD_SIZE = 15
+FIRST_MATCH_ID = 100000
+FIRST_START_DATE = datetime(2015, 1, 1, 9, 30)
+
+INTERNATIONAL_MATCHES_DDL = """
+    CREATE TABLE IF NOT EXISTS international_matches (
+        match_id INTEGER PRIMARY KEY,
+        series_name VARCHAR,
+        match_desc VARCHAR,
+        match_format VARCHAR,
+        start_date TIMESTAMP,
+        end_date TIMESTAMP,
+        state VARCHAR,
+        status VARCHAR,
+        team1_name VARCHAR,
+        team2_name VARCHAR,
+        venue_ground VARCHAR,
+        venue_city VARCHAR
+    )
+"""
+
+def squad(team):
+    """(player_id, player_name) for every player of a team; ids are stable across matches."""
+    team_id, _, short_name = team
+    return [(team_id * 1000 + k, f"{short_name} Player {k}") for k in range(1, SQUAD_SIZE + 1)]
+
+def _series(series_no, seed):
+    rng = random.Random(f"{seed}:series:{series_no}")
+    home, away = rng.sample(TEAMS, 2)
+    match_format = rng.choice(list(FORMATS))
+    year = (FIRST_START_DATE + timedelta(days=series_no * MATCHES_PER_SERIES * 3)).year
+    return {
+        'series_id': 5000 + series_no,
+        'series_name': f"{away[1]} tour of {home[1]}, {year}",
+        'home': home,
+        'away': away,
+        'match_format': match_format
+    }
+
+def _ordinal(n):
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+def make_match(match_id, seed=0, complete=True):
+    """
+    Generate one match: its international_matches row and its scorecard document
+
+    Args:
+        match_id (int): Match id, FIRST_MATCH_ID or above
+        seed (int): Archive seed
+        complete (bool): False for a match still in progress
+
+    Returns:
+        tuple: (international_matches row dict, scorecard JSON dict)
+    """
+    offset = match_id - FIRST_MATCH_ID
+    series = _series(offset // MATCHES_PER_SERIES, seed)
+    rng = random.Random(f"{seed}:match:{match_id}")
+    match_format = series['match_format']
+    innings_count, overs_limit = FORMATS[match_format]
+    start_date = FIRST_START_DATE + timedelta(days=offset * 3)
+    end_date = start_date + timedelta(days=4 if match_format == 'TEST' else 0, hours=8)
+    team1, team2 = series['home'], series['away']
+
+    toss_winner = rng.choice((team1, team2))
+    toss_decision = rng.choice(('Batting', 'Bowling'))
+    batting_first = toss_winner if toss_decision == 'Batting' else (team2 if toss_winner is team1 else team1)
+    fielding_first = team2 if batting_first is team1 else team1
+
+    played = innings_count if complete else rng.randint(1, innings_count)
+    score_card = []
+    totals = {team1[0]: 0, team2[0]: 0}
+    for innings_id in range(1, played + 1):
+        batting, bowling = (batting_first, fielding_first) if innings_id % 2 else (fielding_first, batting_first)
+        innings = _make_innings(rng, match_id, innings_id, batting, bowling, overs_limit)
+        totals[batting[0]] += innings['scoreDetails']['runs']
+        score_card.append(innings)
+
+    winner = max((team1, team2), key=lambda team: totals[team[0]])
+    margin = abs(totals[team1[0]] - totals[team2[0]])
+    status = f"{winner[1]} won by {margin} runs" if complete else f"{batting_first[1]} opt to {toss_decision.lower()}"
+    header = {
+        'matchId': match_id,
+        'matchDescription': f"{_ordinal(offset % MATCHES_PER_SERIES + 1)} {FORMAT_LABELS[match_format]}",
+        'matchFormat': match_format,
+        'complete': complete,
+        'dayNight': rng.random() < 0.3,
+        'year': start_date.year,
+        'state': 'Complete' if complete else 'In Progress',
+        'status': status,
+        'tossResults': {'tossWinnerId': toss_winner[0], 'tossWinnerName': toss_winner[1], 'decision': toss_decision},
+        'result': {
+            'winningTeam': winner[1], 'winningteamId': winner[0], 'winningMargin': margin,
+            'winByRuns': True, 'winByInnings': False
+        } if complete else {},
+        'seriesId': series['series_id'],
+        'seriesName': series['series_name'],
+        'team1': {'id': team1[0], 'name': team1[1], 'shortName': team1[2]},
+        'team2': {'id': team2[0], 'name': team2[1], 'shortName': team2[2]}
+    }
+    match_row = {
+        'match_id': match_id,
+        'series_name': series['series_name'],
+        'match_desc': header['matchDescription'],
+        'match_format': match_format,
+        'start_date': start_date,
+        'end_date': end_date,
+        'state': header['state'],
+        'status': status,
+        'team1_name': team1[1],
+        'team2_name': team2[1],
+        'venue_ground': f"{team1[1]} Ground {rng.randint(1, 5)}",
+        'venue_city': f"{team1[1]} City"
+    }
+    return match_row, {'scoreCard': score_card, 'matchHeader': header, 'isMatchComplete': complete}
+
+def _make_innings(rng, match_id, innings_id, batting, bowling, overs_limit):
+    batters = rng.sample(squad(batting), 11)
+    bowlers = rng.sample(squad(bowling), rng.randint(5, 6))
+    wickets = rng.randint(3, 10)
+
+    batsmen_data, total_runs = {}, 0
+    for k, (player_id, player_name) in enumerate(batters[:min(11, wickets + 2)], start=1):
+        balls = rng.randint(1, 150)
+        runs = int(balls * rng.uniform(0.4, 1.6))
+        fours, sixes = runs // 12, runs // 40
+        out = k <= wickets
+        total_runs += runs
+        batsmen_data[f"bat_{k}"] = {
+            'batId': player_id, 'batName': player_name, 'runs': runs, 'balls': balls,
+            'dots': max(0, balls - runs), 'fours': fours, 'sixes': sixes, 'mins': balls + rng.randint(0, 40),
+            'strikeRate': round(100.0 * runs / balls, 2), 'isCaptain': k == 1, 'isKeeper': k == 5,
+            'outDesc': f"b {rng.choice(bowlers)[1]}" if out else 'not out',
+            'wicketCode': rng.choice(('BOWLED', 'CAUGHT', 'LBW', 'RUNOUT')) if out else '',
+            'bowlerId': rng.choice(bowlers)[0] if out else 0
+        }
+
+    extras = rng.randint(0, 25)
+    total_runs += extras
+    overs = round(min(overs_limit, rng.uniform(overs_limit * 0.5, overs_limit)), 1)
+
+    bowlers_data = {}
+    remaining_wickets = wickets
+    for k, (player_id, player_name) in enumerate(bowlers, start=1):
+        bowler_overs = round(overs / len(bowlers), 1)
+        bowler_runs = int(total_runs / len(bowlers) * rng.uniform(0.6, 1.4))
+        bowler_wickets = min(remaining_wickets, rng.randint(0, 4))
+        remaining_wickets -= bowler_wickets
+        bowlers_data[f"bowl_{k}"] = {
+            'bowlerId': player_id, 'bowlName': player_name, 'overs': bowler_overs,
+            'maidens': rng.randint(0, 3), 'runs': bowler_runs, 'wickets': bowler_wickets,
+            'economy': round(bowler_runs / bowler_overs, 2) if bowler_overs else 0.0,
+            'no_balls': rng.randint(0, 2), 'wides': rng.randint(0, 4), 'dots': rng.randint(10, 60)
+        }
+
+    partnerships_data = {}
+    batted = list(batsmen_data.values())
+    for k in range(1, len(batted)):
+        first, second = batted[k - 1], batted[k]
+        bat1_runs, bat2_runs = rng.randint(0, 60), rng.randint(0, 60)
+        partnerships_data[f"pat_{k}"] = {
+            'bat1Id': first['batId'], 'bat1Name': first['batName'], 'bat1Runs': bat1_runs,
+            'bat1fours': bat1_runs // 12, 'bat1sixes': bat1_runs // 40,
+            'bat2Id': second['batId'], 'bat2Name': second['batName'], 'bat2Runs': bat2_runs,
+            'bat2fours': bat2_runs // 12, 'bat2sixes': bat2_runs // 40,
+            'totalRuns': bat1_runs + bat2_runs, 'totalBalls': int((bat1_runs + bat2_runs) * rng.uniform(0.8, 1.6)) + 1
+        }
+
+    return {
+        'matchId': match_id,
+        'inningsId': innings_id,
+        'timeScore': 1420070400000 + match_id * 1000 + innings_id,
+        'batTeamDetails': {
+            'batTeamId': batting[0], 'batTeamName': batting[1], 'batTeamShortName': batting[2],
+            'batsmenData': batsmen_data
+        },
+        'bowlTeamDetails': {
+            'bowlTeamId': bowling[0], 'bowlTeamName': bowling[1], 'bowlTeamShortName': bowling[2],
+            'bowlersData': bowlers_data
+        },
+        'scoreDetails': {
+            'ballNbr': 0, 'isDeclared': False, 'isFollowOn': False, 'overs': overs,
+            'revisedOvers': 0, 'runRate': round(total_runs / overs, 2), 'runs': total_runs, 'wickets': wickets
+        },
+        'extrasData': {'noBalls': extras // 5, 'total': extras, 'byes': extras // 4, 'penalty': 0,
+                       'wides': extras // 3, 'legByes': extras // 6},
+        'partnershipsData': partnerships_data
+    }
+
+def is_live(match_id, seed=0, live_fraction=0.0):
+    """Whether a match is generated as still in progress."""
+    return live_fraction > 0 and random.Random(f"{seed}:live:{match_id}").random() < live_fraction
+
+def iter_matches(n_matches, seed=0, live_fraction=0.0):
+    """
+    Generate an archive lazily, one match at a time
+
+    Args:
+        n_matches (int): Number of matches
+        seed (int): Archive seed
+        live_fraction (float): Share of matches still in progress
+
+    Yields:
+        tuple: (international_matches row, scorecard JSON)
+    """
+    for match_id in range(FIRST_MATCH_ID, FIRST_MATCH_ID + n_matches):
+        yield make_match(match_id, seed, complete=not is_live(match_id, seed, live_fraction))
+
+def make_matches(n_matches, seed=0, live_fraction=0.0):
+    """
+    Generate an archive in memory
+
+    Returns:
+        list: (international_matches row, scorecard JSON) per match
+    """
+    return list(iter_matches(n_matches, seed, live_fraction))
+
+def make_teams_response():
+    """
+    Body of /teams/v1/international: section headers followed by teams
+
+    Returns:
+        dict: {'list': [...]} as served by the API
+    """
+    teams = [{'teamName': 'Test Teams'}]
+    teams.extend(
+        {'teamId': team_id, 'teamName': name, 'teamSName': short_name, 'imageId': 170000 + team_id, 'countryName': name}
+        for team_id, name, short_name in TEAMS
+    )
+    return {'list': teams, 'appIndex': {'seoTitle': 'Cricket Teams', 'webURL': 'www.cricbuzz.com/cricket-team'}}
+
+def _insert_match_rows(con, rows):
+    con.register('synthetic_matches', pd.DataFrame(rows))
+    try:
+        con.execute("INSERT OR REPLACE INTO international_matches SELECT * FROM synthetic_matches")
+    finally:
+        con.unregister('synthetic_matches')
+
+def write_matches(db_path, matches, batch_size=500, scorecards=True):
+    """
+    Write generated matches to a DuckDB database, streaming in batches
+
+    Args:
+        db_path (str): Database file, created if missing
+        matches (iterable): (international_matches row, scorecard JSON) pairs
+        batch_size (int): Matches per bulk load
+        scorecards (bool): Also load the scorecard tables and series aggregates
+
+    Returns:
+        int: Number of matches written
+    """
+    con = duckdb.connect(db_path)
+    try:
+        con.execute(INTERNATIONAL_MATCHES_DDL)
+        ensure_schema(con)
+        writer = ScorecardBatchWriter(con, batch_size=batch_size)
+        rows, written = [], 0
+        for row, scorecard in matches:
+            rows.append(row)
+            if len(rows) >= batch_size:
+                _insert_match_rows(con, rows)
+                rows = []
+            if scorecards:
+                writer.add(row['match_id'], scorecard)
+            written += 1
+        if rows:
+            _insert_match_rows(con, rows)
+        if scorecards:
+            writer.flush()
+            refresh_series_aggregates(con)
+            refresh_career_stats(con)
+    finally:
+        con.close()
+    return written
+
+def build_database(db_path, n_matches, seed=0, batch_size=500, scorecards=True, live_fraction=0.0):
+    """
+    Write a synthetic archive of `n_matches` to a DuckDB database
+
+    Returns:
+        int: Number of matches written
+    """
+    return write_matches(db_path, iter_matches(n_matches, seed, live_fraction), batch_size, scorecards)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a synthetic cricket archive")
+    parser.add_argument('--db', required=True, help="DuckDB database to write")
+    parser.add_argument('--matches', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--live-fraction', type=float, default=0.0, help="Share of matches still in progress")
+    parser.add_argument('--matches-only', action='store_true', help="Only write international_matches")
+    args = parser.parse_args()
+
+    written = build_database(
+        args.db, args.matches, seed=args.seed, batch_size=args.batch_size,
+        scorecards=not args.matches_only, live_fraction=args.live_fraction
+    )
+    print(f"Wrote {written} synthetic matches to {args.db}")
+
+if __name__ == "__main__":
+    main()
@@ -2,79 +2,70 @@ import plotly.express as px
 import plotly.graph_objs as go
 from dash.dependencies import Input, Output
 
-def register_callbacks(app, merged_df):
+from data_loader import build_series_index, filter_by_series
+
+def register_callbacks(app, merged_df, memoizer=None):
     """
     Register all dashboard callbacks.
     
     Args:
         app (dash.Dash): Dash application instance
         merged_df (pd.DataFrame): Merged match data
+        memoizer (memoize.CallbackMemoizer): Optional cache for the
+            Series Overview outputs, keyed by the selected series
     """
-    @app.callback(
-        Output('match-table', 'data'),
-        Input('series-dropdown', 'value')
-    )
-    def update_match_table(selected_series):
-        try:
-            if selected_series == 'All Series':
-                df_filtered = merged_df
-            else:
-                df_filtered = merged_df[merged_df['series_name'] == selected_series]
-            
-            # Select and rename columns for display
-            table_data = df_filtered[['match_id', 'series_name', 'match_desc', 'team1_name', 'team2_name','winning_team_name', 'status']].to_dict('records')
-            return table_data
-        except Exception as e:
-            print(f"Error in update_match_table: {e}")
-            return []
+    series_index = build_series_index(merged_df)
 
-    @app.callback(
-        Output('wins-bar-chart', 'figure'),
-        Input('series-dropdown', 'value')
-    )
-    def update_wins_chart(selected_series):
+    # Errors propagate out of these, so a memoized update_series_overview never stores a fallback
+    def match_table(df_filtered):
+        # Select and rename columns for display
+        table_data = df_filtered[['match_id', 'series_name', 'match_desc', 'team1_name', 'team2_name','winning_team_name', 'status']].to_dict('records')
+        return table_data
+
+    def wins_chart(df_filtered):
+        # Count wins by team
+        wins_df = df_filtered.groupby('winning_team_name').size().reset_index(name='wins')
+        wins_df = wins_df.sort_values('wins', ascending=False)
+
+        fig = px.bar(
+            wins_df, 
+            x='winning_team_name', 
+            y='wins', 
+            title='Team Matches',
+            labels={'team1_name': 'Team', 'wins': 'Number of Matches'}
+        )
+        return fig
+
+    def format_chart(df_filtered):
+        # Count match formats
+        format_counts = df_filtered['match_format'].value_counts()
+
+        fig = px.pie(
+            values=format_counts.values, 
+            names=format_counts.index, 
+            title='Match Formats Distribution'
+        )
+        return fig
+
+    def series_overview(selected_series):
+        # One indexed filter per interaction, shared by all three outputs
+        df_filtered = filter_by_series(merged_df, series_index, selected_series)
+        return match_table(df_filtered), wins_chart(df_filtered), format_chart(df_filtered)
+
+    if memoizer is not None:
+        series_overview = memoizer.memoize()(series_overview)
+
+    def update_series_overview(selected_series):
         try:
-            if selected_series == 'All Series':
-                df_filtered = merged_df
-            else:
-                df_filtered = merged_df[merged_df['series_name'] == selected_series]
-            
-            # Count wins by team
-            wins_df = df_filtered.groupby('winning_team_name').size().reset_index(name='wins')
-            wins_df = wins_df.sort_values('wins', ascending=False)
-            
-            fig = px.bar(
-                wins_df, 
-                x='winning_team_name', 
-                y='wins', 
-                title='Team Matches',
-                labels={'team1_name': 'Team', 'wins': 'Number of Matches'}
-            )
-            return fig
+            return series_overview(selected_series)
         except Exception as e:
-            print(f"Error in update_wins_chart: {e}")
-            return go.Figure()
+            # Fallback built outside the memoizer, so a transient error is not cached for every user
+            print(f"Error in update_series_overview: {e}")
+            return [], go.Figure(), go.Figure()
 
-    @app.callback(
-        Output('format-pie-chart', 'figure'),
+    app.callback(
+        [Output('match-table', 'data'),
+         Output('wins-bar-chart', 'figure'),
+         Output('format-pie-chart', 'figure')],
         Input('series-dropdown', 'value')
-    )
-    def update_format_chart(selected_series):
-        try:
-            if selected_series == 'All Series':
-                df_filtered = merged_df
-            else:
-                df_filtered = merged_df[merged_df['series_name'] == selected_series]
-            
-            # Count match formats
-            format_counts = df_filtered['match_format'].value_counts()
-            
-            fig = px.pie(
-                values=format_counts.values, 
-                names=format_counts.index, 
-                title='Match Formats Distribution'
-            )
-            return fig
-        except Exception as e:
-            print(f"Error in update_format_chart: {e}")
-            return go.Figure()
\ No newline at end of file
+    )(update_series_overview)
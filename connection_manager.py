@@ -0,0 +1,275 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import duckdb
+
+DEFAULT_DB_PATH = 'cricket_matches.db'
+
+# Written by fetch_data/export_parquet.py at the root of a Parquet export
+PARQUET_MANIFEST = '_manifest.json'
+PARTITION_TYPES = {'match_year': 'INTEGER', 'match_format': 'VARCHAR'}
+
+def _parquet_view_sql(parquet_dir, table_name, table):
+    columns = table['columns']
+    column_names = [name for name, _ in columns]
+    if not table['rows']:
+        # Nothing was written; keep the table queryable with its original types
+        select = ', '.join(f'CAST(NULL AS {column_type}) AS "{name}"' for name, column_type in columns)
+        return f"SELECT {select} WHERE false"
+
+    table_path = os.path.join(parquet_dir, table_name).replace("'", "''")
+    if not table['partitioned']:
+        return f"SELECT * FROM read_parquet('{table_path}/*.parquet')"
+
+    # Tables without their own match_year/match_format also expose the partition
+    # values, so scans filtered on them are pruned; international_matches and
+    # match_details keep their exact columns since the dashboard joins them with SELECT *
+    if not any(column in column_names for column in PARTITION_TYPES):
+        column_names = column_names + list(PARTITION_TYPES)
+    hive_types = ', '.join(f"'{name}': {column_type}" for name, column_type in PARTITION_TYPES.items())
+    return f"""
+        SELECT {', '.join(f'"{name}"' for name in column_names)}
+        FROM read_parquet('{table_path}/*/*/*.parquet', hive_partitioning = true, hive_types = {{{hive_types}}})
+    """
+
+def open_parquet_catalog(parquet_dir):
+    """
+    Open an in-memory database with one view per table of a Parquet export
+
+    Views read the files with read_parquet and hive partitioning, so filters
+    on match_year or match_format only open the matching partitions.
+
+    Args:
+        parquet_dir (str): Directory written by fetch_data/export_parquet.py
+
+    Returns:
+        duckdb.DuckDBPyConnection: Connection whose views mirror the exported tables
+    """
+    with open(os.path.join(parquet_dir, PARQUET_MANIFEST)) as f:
+        manifest = json.load(f)
+    conn = duckdb.connect()
+    # Export files never change in place, so their footers can be cached for the connection's lifetime
+    conn.execute("SET parquet_metadata_cache = true")
+    for table_name, table in manifest['tables'].items():
+        conn.execute(f"CREATE VIEW {table_name} AS {_parquet_view_sql(parquet_dir, table_name, table)}")
+    return conn
+
+class ConnectionManager:
+    """
+    Process-wide read-only DuckDB connection with a bounded cursor pool.
+
+    The database is opened once per process. Threads borrow cursors (DuckDB
+    duplicate connections, safe to use from one thread at a time) from a pool
+    of at most `max_cursors`, so concurrent callbacks never share a cursor and
+    never reopen the file.
+
+    The open handle locks the file against read-write opens from other
+    processes, so writers never update it in place: they write a copy and
+    rename it over the file (fetch_data/staging.py). The health check sees
+    the new modification time and reopens the database.
+
+    If `db_path` is a Parquet export directory instead of a database file, the
+    same tables are served as views over the Parquet files (see
+    open_parquet_catalog), and a new export is picked up like a changed file.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, max_cursors=8, checkout_timeout=30, health_check_interval=30):
+        """
+        Args:
+            db_path (str): Path to the DuckDB database, or to a Parquet export directory
+            max_cursors (int): Maximum number of cursors handed out at once
+            checkout_timeout (float): Seconds to wait for a free cursor
+            health_check_interval (float): Seconds between cursor health checks
+        """
+        self.db_path = db_path
+        self.max_cursors = max_cursors
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.pid = os.getpid()
+        self.conn = None
+        self.generation = 0
+        self.created = 0
+        self.idle = queue.LifoQueue()
+        self.last_health_check = 0.0
+        self.opened_mtime = None
+        self.version = None
+
+    def _file_mtime(self):
+        # A Parquet export is rewritten as a whole, manifest last
+        path = os.path.join(self.db_path, PARQUET_MANIFEST) if os.path.isdir(self.db_path) else self.db_path
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _open(self):
+        if os.path.isdir(self.db_path):
+            self.conn = open_parquet_catalog(self.db_path)
+        else:
+            self.conn = duckdb.connect(self.db_path, read_only=True)
+        self.opened_mtime = self._file_mtime()
+        self.generation += 1
+        self.last_health_check = time.monotonic()
+        # From the data itself, so a forked worker or a reopen of the same file agrees with the master
+        self.version = f"{self.opened_mtime}:{self._ingest_watermark()}"
+
+    def _ingest_watermark(self):
+        # A read-only handle sees a fixed snapshot, so this only changes on reopen
+        try:
+            return self.conn.execute("SELECT max(updated_at) FROM ingest_watermarks").fetchone()[0]
+        except duckdb.Error:
+            return None
+
+    def _close_locked(self):
+        while True:
+            try:
+                _, cursor = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            cursor.close()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.created = 0
+
+    def connection(self):
+        """
+        Return the shared root connection, opening it on first use
+
+        Returns:
+            duckdb.DuckDBPyConnection: Process-wide read-only connection
+        """
+        with self.lock:
+            if self.pid != os.getpid():
+                # Forked worker: never touch the parent's handle
+                self._reset()
+            if self.conn is None:
+                self._open()
+            return self.conn
+
+    def health_check(self):
+        """
+        Verify the database handle, reopening it if it failed or the file changed
+
+        Returns:
+            bool: True if the database answered a probe query
+        """
+        conn = self.connection()
+        with self.lock:
+            self.last_health_check = time.monotonic()
+            try:
+                conn.execute("SELECT 1").fetchone()
+                healthy = True
+            except duckdb.Error:
+                healthy = False
+            if not healthy or self._file_mtime() != self.opened_mtime:
+                # Cursors still checked out are discarded when returned
+                self._close_locked()
+                self._open()
+        return healthy
+
+    def data_version(self):
+        """
+        Return a token that changes whenever ingest changes the data
+
+        The token combines the modification time of the database file (or of
+        a Parquet export's manifest) with the latest ingest watermark. It
+        depends only on the data, so every process serving the same file
+        reports the same version, and closing or reopening the handle does
+        not change it.
+
+        Returns:
+            str: Opaque data version
+        """
+        if time.monotonic() - self.last_health_check > self.health_check_interval:
+            self.health_check()
+        self.connection()
+        return self.version
+
+    def _checkout(self):
+        if time.monotonic() - self.last_health_check > self.health_check_interval:
+            self.health_check()
+        conn = self.connection()
+
+        with self.lock:
+            try:
+                generation, cursor = self.idle.get_nowait()
+                if generation == self.generation:
+                    return generation, cursor
+                cursor.close()
+                self.created -= 1
+            except queue.Empty:
+                pass
+            if self.created < self.max_cursors:
+                self.created += 1
+                return self.generation, conn.cursor()
+
+        try:
+            generation, cursor = self.idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No DuckDB cursor available for {self.db_path} after {self.checkout_timeout}s")
+        return generation, cursor
+
+    def _checkin(self, generation, cursor):
+        with self.lock:
+            if generation == self.generation and self.pid == os.getpid():
+                self.idle.put((generation, cursor))
+                return
+        cursor.close()
+
+    @contextmanager
+    def cursor(self):
+        """
+        Borrow a cursor for the calling thread
+
+        Yields:
+            duckdb.DuckDBPyConnection: Cursor returned to the pool on exit
+        """
+        generation, cursor = self._checkout()
+        try:
+            yield cursor
+        finally:
+            self._checkin(generation, cursor)
+
+    def close(self):
+        """Close idle cursors and the root connection."""
+        with self.lock:
+            if self.pid == os.getpid():
+                self._close_locked()
+            self.generation += 1
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+def get_connection_manager(db_path=DEFAULT_DB_PATH):
+    """
+    Return the process-wide connection manager for a database file
+
+    Args:
+        db_path (str): Path to the DuckDB database
+
+    Returns:
+        ConnectionManager: Shared manager for `db_path`
+    """
+    key = os.path.abspath(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = ConnectionManager(db_path)
+        return manager
+
+@atexit.register
+def close_all():
+    """Close every managed connection, e.g. on interpreter shutdown."""
+    with _managers_lock:
+        for manager in _managers.values():
+            manager.close()
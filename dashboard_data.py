@@ -0,0 +1,162 @@
+import atexit
+import os
+import threading
+import time
+
+import pandas as pd
+
+from connection_manager import get_connection_manager
+from data_loader import build_series_index
+from match_search import MatchSearchIndex
+from metrics import execute_timed
+from query_cache import QueryCache
+from render_cache import RenderCache
+
+MATCHES_QUERY = "SELECT * FROM international_matches m JOIN match_details md ON m.match_id = md.match_id"
+
+class DashboardData:
+    """
+    In-memory match data behind the dashboard, loaded on first use.
+
+    Nothing touches the database until `load()` is called, either by the
+    first callback that needs the data or by a background warmup thread, so
+    creating the app stays cheap. Concurrent callers wait for a single load.
+    The frames are rebuilt when the connection manager's data version moves
+    on, e.g. after an ingest run.
+    """
+
+    def __init__(self, db_path):
+        """
+        Args:
+            db_path (str): Path to the DuckDB database
+        """
+        self.db_path = db_path
+        self.manager = get_connection_manager(db_path)
+        self.query_cache = QueryCache(self.manager)
+        self.render_cache = RenderCache(self.manager)
+        self.lock = threading.Lock()
+        self.warmup_lock = threading.Lock()
+        self.ready = threading.Event()
+        self.error = None
+        self.load_seconds = None
+        self.warmup_thread = None
+        # Data version the frames below were built from
+        self.version = None
+
+    def load(self):
+        """
+        Load the match frame and build the indexes for the current data version
+
+        The first call loads; later calls return at once unless the data
+        version has changed, in which case the frames are rebuilt. If a
+        rebuild fails, the previous frames stay in service.
+
+        Returns:
+            DashboardData: self, with matches, series_index, search_index and
+            series_options populated
+        """
+        version = self.manager.data_version()
+        if self.ready.is_set() and self.version == version:
+            return self
+        with self.lock:
+            version = self.manager.data_version()
+            if self.ready.is_set() and self.version == version:
+                return self
+            started = time.perf_counter()
+            try:
+                with self.manager.cursor() as con:
+                    matches = execute_timed(con, MATCHES_QUERY).df()
+                series_index = build_series_index(matches)
+                search_index = MatchSearchIndex(matches)
+                series_options = [{'label': 'All Series', 'value': 'All Series'}] + [
+                    {'label': series, 'value': series}
+                    for series in matches['series_name'].unique()
+                    if pd.notna(series)
+                ]
+            except Exception as e:
+                self.error = str(e)
+                if not self.ready.is_set():
+                    raise
+                print(f"Reloading dashboard data for {self.db_path} failed, keeping the previous data: {e}")
+                return self
+            self.matches, self.series_index, self.search_index, self.series_options = (
+                matches, series_index, search_index, series_options)
+            self.version = version
+            self.error = None
+            self.load_seconds = time.perf_counter() - started
+            self.ready.set()
+        return self
+
+    def warmup(self, prime=None):
+        """
+        Start loading in a background thread
+
+        Args:
+            prime (callable): Optional function run after the load, e.g. to
+                fill query caches for the default view
+
+        Returns:
+            threading.Thread: The warmup thread (daemon)
+        """
+        def run():
+            try:
+                self.load()
+                if prime is not None:
+                    prime()
+            except Exception as e:
+                print(f"Warmup failed for {self.db_path}: {e}")
+
+        with self.warmup_lock:
+            if self.warmup_thread is None or not self.warmup_thread.is_alive():
+                self.warmup_thread = threading.Thread(target=run, name='dashboard-warmup', daemon=True)
+                self.warmup_thread.start()
+            return self.warmup_thread
+
+    def status(self):
+        """
+        Readiness report for the health endpoint
+
+        Returns:
+            dict: status ('ready', 'loading' or 'error'), db_path, load_seconds, matches
+        """
+        if self.ready.is_set():
+            status = 'ready'
+        elif self.error is not None:
+            status = 'error'
+        else:
+            status = 'loading'
+        report = {'status': status, 'db_path': self.db_path, 'load_seconds': self.load_seconds}
+        if status == 'ready':
+            report['matches'] = len(self.matches)
+        if self.error is not None:
+            report['error'] = self.error
+        return report
+
+_datasets = {}
+_datasets_lock = threading.Lock()
+
+def get_dashboard_data(db_path):
+    """
+    Return the process-wide dashboard data for a database file
+
+    Args:
+        db_path (str): Path to the DuckDB database
+
+    Returns:
+        DashboardData: Shared, lazily loaded data for `db_path`
+    """
+    key = os.path.abspath(db_path)
+    with _datasets_lock:
+        data = _datasets.get(key)
+        if data is None:
+            data = _datasets[key] = DashboardData(db_path)
+        return data
+
+@atexit.register
+def wait_for_warmups():
+    """Let running warmups finish before connections are closed at shutdown."""
+    # Registered after connection_manager's close_all, so it runs first
+    with _datasets_lock:
+        threads = [data.warmup_thread for data in _datasets.values() if data.warmup_thread is not None]
+    for thread in threads:
+        thread.join()
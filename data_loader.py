@@ -1,9 +1,13 @@
-import duckdb
 import pandas as pd
 
+from connection_manager import get_connection_manager
+
 def connect_database(db_path='cricket_matches.db'):
     """
-    Establish a connection to the DuckDB database.
+    Get the shared read-only connection to the DuckDB database.
+    
+    The connection is opened once per process by the connection manager and
+    must not be closed by callers.
     
     Args:
         db_path (str): Path to the database file
@@ -12,7 +16,7 @@ def connect_database(db_path='cricket_matches.db'):
         duckdb.DuckDBPyConnection: Database connection
     """
     try:
-        conn = duckdb.connect(db_path, read_only=True)
+        conn = get_connection_manager(db_path).connection()
         return conn
     except Exception as e:
         print(f"Database connection error: {e}")
@@ -76,4 +80,37 @@ def merge_match_data(international_matches, match_details):
         except Exception as e:
             print(f"Merge error: {e}")
             return international_matches
-    return pd.DataFrame()
\ No newline at end of file
+    return pd.DataFrame()
+
+def build_series_index(merged_df):
+    """
+    Map each series to the row positions of its matches.
+    
+    Built once at load time so a series filter is a positional take instead
+    of a full-frame comparison.
+    
+    Args:
+        merged_df (pd.DataFrame): Merged match data
+    
+    Returns:
+        dict: Series name -> numpy array of row positions
+    """
+    if merged_df.empty or 'series_name' not in merged_df.columns:
+        return {}
+    return merged_df.groupby('series_name', sort=False).indices
+
+def filter_by_series(merged_df, series_index, selected_series):
+    """
+    Select the matches of one series using a prebuilt series index.
+    
+    Args:
+        merged_df (pd.DataFrame): Merged match data
+        series_index (dict): Output of build_series_index for merged_df
+        selected_series (str): Series name, or 'All Series' for every match
+    
+    Returns:
+        pd.DataFrame: Matches in the selected series
+    """
+    if selected_series == 'All Series':
+        return merged_df
+    return merged_df.take(series_index.get(selected_series, []))
@@ -0,0 +1,217 @@
+import http.client
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Cricbuzz API Configuration
+CRICBUZZ_API_HOST = "cricbuzz-cricket.p.rapidapi.com"
+# Point every fetcher elsewhere, e.g. the local mock server: CRICBUZZ_API_URL=http://127.0.0.1:8765
+CRICBUZZ_API_URL = os.getenv("CRICBUZZ_API_URL", f"https://{CRICBUZZ_API_HOST}")
+
+def api_connection(base_url=None, timeout=30):
+    """
+    Open an HTTP(S) connection to the Cricbuzz API or a stand-in for it
+
+    Args:
+        base_url (str): scheme://host[:port], defaults to CRICBUZZ_API_URL
+        timeout (float): Socket timeout in seconds
+
+    Returns:
+        http.client.HTTPConnection: Unopened connection for the URL's scheme
+    """
+    url = urlsplit(base_url or CRICBUZZ_API_URL)
+    connection_class = http.client.HTTPConnection if url.scheme == 'http' else http.client.HTTPSConnection
+    return connection_class(url.hostname, url.port, timeout=timeout)
+
+def api_headers():
+    """Request headers carrying the RapidAPI key (empty if unset, e.g. for the mock server)."""
+    return {
+        'x-rapidapi-key': os.getenv("RAPIDAPI_KEY2", ""),
+        'x-rapidapi-host': CRICBUZZ_API_HOST
+    }
+
+def retry_after_seconds(value, default):
+    """
+    Seconds to wait according to a Retry-After header
+
+    Args:
+        value (str): Header value, either delay-seconds or an HTTP-date (RFC 9110)
+        default (float): Delay used when the header is missing or unparseable
+
+    Returns:
+        float: Non-negative delay in seconds
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting requests to a fixed rate.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    `acquire` blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): Requests allowed per second
+            capacity (float): Maximum burst size, defaults to `rate`
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _take(self):
+        # Take a token if one is available; otherwise return the wait for the next
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def try_acquire(self):
+        """Take one token without blocking; return False if none is available."""
+        return self._take() == 0.0
+
+    def acquire(self):
+        """Block until one token can be taken from the bucket."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+class CricbuzzClient:
+    """
+    Cricbuzz API client sharing one rate limiter across threads.
+
+    Each thread keeps its own persistent connection to the API host so
+    requests reuse keep-alive sockets instead of reconnecting per match.
+    """
+
+    def __init__(self, requests_per_second=2.0, base_url=None, max_retries=3):
+        """
+        Args:
+            requests_per_second (float): Shared request quota
+            base_url (str): API scheme://host[:port], defaults to CRICBUZZ_API_URL
+            max_retries (int): Attempts per request on connection errors or 429s, at least one
+        """
+        self.base_url = base_url or CRICBUZZ_API_URL
+        self.max_retries = max(1, max_retries)
+        self.limiter = TokenBucket(requests_per_second)
+        self.headers = dict(api_headers(), Connection='keep-alive')
+        self.local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = api_connection(self.base_url)
+            self.local.conn = conn
+        return conn
+
+    def _reset_connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+        self.local.conn = None
+
+    def get_json(self, endpoint):
+        """
+        GET an endpoint and parse the JSON body
+
+        Args:
+            endpoint (str): Request path, e.g. /mcenter/v1/{match_id}/scard
+
+        Returns:
+            dict: Parsed JSON response
+        """
+        last_error = None
+        for attempt in range(self.max_retries):
+            self.limiter.acquire()
+            try:
+                conn = self._connection()
+                conn.request("GET", endpoint, headers=self.headers)
+                res = conn.getresponse()
+                # Always drain the body so the socket can be reused
+                data = res.read()
+            except (http.client.HTTPException, OSError) as e:
+                # Stale keep-alive socket or network error: reconnect and retry
+                last_error = e
+                self._reset_connection()
+                continue
+
+            if res.status == 429:
+                last_error = Exception(f"API rate limit hit for {endpoint}")
+                time.sleep(retry_after_seconds(res.getheader('Retry-After'), 2 ** attempt))
+                continue
+            if res.status != 200:
+                raise Exception(f"API request failed with status {res.status}")
+            return json.loads(data.decode("utf-8"))
+
+        raise last_error
+
+    def close(self):
+        """Close the calling thread's connection."""
+        self._reset_connection()
+
+def fetch_scorecards_concurrently(client, match_ids, workers=4, max_pending=None):
+    """
+    Fetch scorecards for many matches on a thread pool
+
+    At most `max_pending` requests are queued or unconsumed at a time, and
+    each result is released once yielded, so memory stays flat however many
+    matches a backfill covers.
+
+    Args:
+        client (CricbuzzClient): Shared, rate limited API client
+        match_ids (iterable): Match ids to fetch
+        workers (int): Number of fetch threads
+        max_pending (int): Requests in flight, defaults to twice `workers`
+
+    Yields:
+        tuple: (match_id, scorecard dict or None) in completion order
+    """
+    def fetch(match_id):
+        try:
+            return client.get_json(f"/mcenter/v1/{match_id}/scard")
+        except Exception as e:
+            print(f"Error fetching scorecard for match {match_id}: {e}")
+            return None
+
+    match_ids = iter(match_ids)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(fetch, match_id): match_id
+                   for match_id in itertools.islice(match_ids, max_pending or 2 * workers)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                match_id = pending.pop(future)
+                # Refill the window before handing the result to the caller
+                for next_id in itertools.islice(match_ids, 1):
+                    pending[executor.submit(fetch, next_id)] = next_id
+                yield match_id, future.result()
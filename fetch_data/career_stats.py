@@ -0,0 +1,167 @@
+from staging import staged_connection
+
+# A batsman is out unless the scorecard says otherwise
+IS_OUT = "lower(coalesce(out_description, '')) NOT IN ('', 'not out', 'batting')"
+
+# Cricket overs notation (9.3 = nine overs and three balls) to balls
+BALLS = "CAST(floor(overs) AS INTEGER) * 6 + CAST(round((overs - floor(overs)) * 10) AS INTEGER)"
+
+# Scorecard table holding each career table's player rows, by player id column
+PLAYER_TABLES = {'batsman_id': 'batsmen_details', 'bowler_id': 'bowlers_details'}
+
+def ensure_career_tables(con):
+    """
+    Create the per-player career tables read by the Player Careers tab
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+    """
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS player_batting_careers (
+            batsman_id INTEGER PRIMARY KEY,
+            batsman_name VARCHAR,
+            team_name VARCHAR,
+            matches INTEGER,
+            innings INTEGER,
+            not_outs INTEGER,
+            runs INTEGER,
+            balls_faced INTEGER,
+            highest_score INTEGER,
+            average DOUBLE,
+            strike_rate DOUBLE,
+            fifties INTEGER,
+            hundreds INTEGER,
+            fours INTEGER,
+            sixes INTEGER
+        )
+    """)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS player_bowling_careers (
+            bowler_id INTEGER PRIMARY KEY,
+            bowler_name VARCHAR,
+            team_name VARCHAR,
+            matches INTEGER,
+            innings INTEGER,
+            balls INTEGER,
+            maidens INTEGER,
+            runs_conceded INTEGER,
+            wickets INTEGER,
+            average DOUBLE,
+            economy DOUBLE,
+            strike_rate DOUBLE,
+            best_wickets INTEGER,
+            best_runs INTEGER,
+            five_wicket_hauls INTEGER
+        )
+    """)
+
+def _player_filter(id_column, table_name, match_ids, player_ids=()):
+    # Players with a row in any of the given matches, plus those whose rows the run removed
+    if match_ids is None:
+        return 'true', []
+    where = (f"{id_column} IN (SELECT {id_column} FROM {table_name} "
+             f"WHERE match_id IN ({', '.join('?' for _ in match_ids)}))")
+    params = list(match_ids)
+    if player_ids:
+        where += f" OR {id_column} IN ({', '.join('?' for _ in player_ids)})"
+        params += list(player_ids)
+    return where, params
+
+def refresh_career_stats(con, match_ids=None, player_ids=None):
+    """
+    Recompute batting and bowling careers for the players in `match_ids`
+
+    Each touched player's career is rebuilt from all of their rows, so a
+    re-ingested live match replaces its earlier contribution instead of
+    adding to it. A refetched scorecard can also drop a player, whose rows
+    are gone by the time this runs; the writer reports those ids in
+    `player_ids` so their careers lose the match too. Players who did not
+    appear in the run are left alone.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        match_ids (list): Matches changed by the ingest run, None to rebuild everything
+        player_ids (dict): PLAYER_TABLES id column -> ids that had rows in those matches before the run
+    """
+    ensure_career_tables(con)
+    if match_ids is not None and not match_ids:
+        return
+
+    player_ids = player_ids or {}
+    batting_where, batting_params = _player_filter(
+        'batsman_id', 'batsmen_details', match_ids, sorted(player_ids.get('batsman_id', ())))
+    bowling_where, bowling_params = _player_filter(
+        'bowler_id', 'bowlers_details', match_ids, sorted(player_ids.get('bowler_id', ())))
+
+    con.execute("BEGIN TRANSACTION")
+    try:
+        con.execute(f"DELETE FROM player_batting_careers WHERE {batting_where}", batting_params)
+        con.execute(f"""
+            INSERT INTO player_batting_careers
+            WITH innings AS (
+                SELECT *, {IS_OUT} AS is_out
+                FROM batsmen_details
+                WHERE batsman_id IS NOT NULL AND ({batting_where})
+            )
+            SELECT batsman_id,
+                   arg_max(batsman_name, match_id),
+                   arg_max(bat_team_name, match_id),
+                   COUNT(DISTINCT match_id),
+                   COUNT(*) FILTER (WHERE is_out OR balls_faced > 0 OR runs > 0),
+                   COUNT(*) FILTER (WHERE NOT is_out AND (balls_faced > 0 OR runs > 0)),
+                   coalesce(SUM(runs), 0),
+                   coalesce(SUM(balls_faced), 0),
+                   MAX(runs),
+                   SUM(runs) / nullif(COUNT(*) FILTER (WHERE is_out), 0),
+                   100.0 * SUM(runs) / nullif(SUM(balls_faced), 0),
+                   COUNT(*) FILTER (WHERE runs >= 50 AND runs < 100),
+                   COUNT(*) FILTER (WHERE runs >= 100),
+                   coalesce(SUM(fours), 0),
+                   coalesce(SUM(sixes), 0)
+            FROM innings
+            GROUP BY batsman_id
+        """, batting_params)
+
+        con.execute(f"DELETE FROM player_bowling_careers WHERE {bowling_where}", bowling_params)
+        con.execute(f"""
+            INSERT INTO player_bowling_careers
+            WITH spells AS (
+                SELECT *, {BALLS} AS balls,
+                       -- Best figures: most wickets, then fewest runs
+                       row_number() OVER (PARTITION BY bowler_id ORDER BY wickets DESC, runs_conceded ASC) AS figures_rank
+                FROM bowlers_details
+                WHERE bowler_id IS NOT NULL AND ({bowling_where})
+            )
+            SELECT bowler_id,
+                   arg_max(bowler_name, match_id),
+                   arg_max(bowl_team_name, match_id),
+                   COUNT(DISTINCT match_id),
+                   COUNT(*),
+                   coalesce(SUM(balls), 0),
+                   coalesce(SUM(maidens), 0),
+                   coalesce(SUM(runs_conceded), 0),
+                   coalesce(SUM(wickets), 0),
+                   SUM(runs_conceded) / nullif(SUM(wickets), 0),
+                   6.0 * SUM(runs_conceded) / nullif(SUM(balls), 0),
+                   SUM(balls) / nullif(SUM(wickets), 0),
+                   any_value(wickets) FILTER (WHERE figures_rank = 1),
+                   any_value(runs_conceded) FILTER (WHERE figures_rank = 1),
+                   COUNT(*) FILTER (WHERE wickets >= 5)
+            FROM spells
+            GROUP BY bowler_id
+        """, bowling_params)
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+def main():
+    # Configuration
+    DB_PATH = 'cricket_matches.db'
+
+    with staged_connection(DB_PATH) as con:
+        refresh_career_stats(con)
+        print("Rebuilt player career tables")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import time
+
+from schema import MATCH_TABLES, create_scorecard_table, ensure_schema, match_index_name, table_columns
+from staging import staged_connection
+
+def _out_of_order_rows(con, table_name):
+    # Rows whose (match_id, innings_id) sorts before the row stored ahead of them
+    return con.execute(f"""
+        SELECT COUNT(*) FROM (
+            SELECT match_id, innings_id,
+                   lag(match_id) OVER (ORDER BY rowid) AS previous_match_id,
+                   lag(innings_id) OVER (ORDER BY rowid) AS previous_innings_id
+            FROM {table_name}
+        )
+        WHERE match_id < previous_match_id
+           OR (match_id = previous_match_id AND innings_id < previous_innings_id)
+    """).fetchone()[0]
+
+def cluster_table(con, table_name):
+    """
+    Rewrite a scorecard table sorted by (match_id, innings_id)
+
+    Ingest appends matches in fetch order and live matches are rewritten
+    in place, so one match's rows end up spread over many row groups. Sorted,
+    each row group covers a narrow match_id range and its min/max zone map
+    lets a `WHERE match_id = ?` scan skip every other row group.
+
+    The sorted copy is built next to the table and swapped in with its
+    primary key and match_id index in one transaction.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        table_name (str): Scorecard table, e.g. batsmen_details
+
+    Returns:
+        int: Rows rewritten
+    """
+    staging_table = f"{table_name}_clustered"
+    columns = ', '.join(table_columns(table_name))
+
+    con.execute("BEGIN TRANSACTION")
+    try:
+        create_scorecard_table(con, table_name, staging_table)
+        con.execute(f"""
+            INSERT INTO {staging_table} ({columns})
+            SELECT {columns} FROM {table_name}
+            ORDER BY match_id, innings_id
+        """)
+        rows = con.execute(f"SELECT COUNT(*) FROM {staging_table}").fetchone()[0]
+        con.execute(f"DROP TABLE {table_name}")
+        con.execute(f"ALTER TABLE {staging_table} RENAME TO {table_name}")
+        con.execute(f"CREATE INDEX {match_index_name(table_name)} ON {table_name} (match_id)")
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+    return rows
+
+def cluster_tables(con, table_names=MATCH_TABLES, force=False):
+    """
+    Cluster the per-match tables that are out of (match_id, innings_id) order
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        table_names (list): Scorecard tables to check
+        force (bool): Rewrite tables that are already in order too
+
+    Returns:
+        dict: Table name -> rows rewritten, for the tables rewritten
+    """
+    rewritten = {}
+    for table_name in table_names:
+        out_of_order = _out_of_order_rows(con, table_name)
+        if not out_of_order and not force:
+            print(f"{table_name} is already clustered")
+            continue
+        started = time.perf_counter()
+        rewritten[table_name] = cluster_table(con, table_name)
+        print(f"Clustered {table_name}: {rewritten[table_name]} rows "
+              f"({out_of_order} out of order) in {time.perf_counter() - started:.2f}s")
+    if rewritten:
+        # Write the sorted row groups out now and release the blocks of the old copies
+        con.execute("CHECKPOINT")
+    return rewritten
+
+def main():
+    # Configuration
+    DB_PATH = 'cricket_matches.db'
+
+    parser = argparse.ArgumentParser(description="Sort the per-match scorecard tables by match for fast lookups")
+    parser.add_argument('--db', default=DB_PATH, help="DuckDB database to rewrite")
+    parser.add_argument('--force', action='store_true', help="Rewrite tables that are already in order")
+    args = parser.parse_args()
+
+    with staged_connection(args.db) as con:
+        ensure_schema(con)
+        cluster_tables(con, force=args.force)
+
+if __name__ == "__main__":
+    main()
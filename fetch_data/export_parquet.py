@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+import duckdb
+
+# Read by connection_manager.py to build the dashboard's views over the export
+MANIFEST_NAME = '_manifest.json'
+
+PARTITION_COLUMNS = ['match_year', 'match_format']
+
+def _columns(con, table_name):
+    return [(name, column_type) for name, column_type, *_ in con.execute(f"DESCRIBE {table_name}").fetchall()]
+
+def _partitioned_select(table_name, column_names):
+    # Partition values come from the table when it has them, otherwise from the match it belongs to
+    native = [column for column in PARTITION_COLUMNS if column in column_names]
+    exclude = f" EXCLUDE ({', '.join(native)})" if native else ''
+    match_year = 't.match_year' if 'match_year' in native else 'year(im.start_date)'
+    match_format = 't.match_format' if 'match_format' in native else 'im.match_format'
+    # Rows sorted by match within each file keep per-row-group min/max stats tight for match_id lookups
+    order_by = 't.match_id, t.innings_id' if 'innings_id' in column_names else 't.match_id'
+    return f"""
+        SELECT t.*{exclude}, {match_year} AS match_year, {match_format} AS match_format
+        FROM {table_name} t
+        LEFT JOIN international_matches im ON t.match_id = im.match_id
+        ORDER BY {order_by}
+    """
+
+def export_parquet(db_path, out_dir):
+    """
+    Write every table of a DuckDB database as Parquet
+
+    Tables and views with a match_id column are hive-partitioned by match_year and
+    match_format (out_dir/table/match_year=2023/match_format=ODI/*.parquet);
+    the rest are written as a single file. A manifest records each table's
+    columns, types and row count. The export is built next to `out_dir` and
+    swapped in at the end, so readers never see a half-written tree.
+
+    Args:
+        db_path (str): Source DuckDB database, opened read-only
+        out_dir (str): Export directory, replaced if it exists
+
+    Returns:
+        dict: The manifest written to out_dir/_manifest.json
+    """
+    out_dir = os.path.abspath(out_dir)
+    staging_dir = f"{out_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    con = duckdb.connect(db_path, read_only=True)
+    try:
+        table_names = [name for (name,) in con.execute("""
+            SELECT table_name FROM duckdb_tables() WHERE database_name = current_database() ORDER BY 1
+        """).fetchall()]
+        has_matches = 'international_matches' in table_names
+        tables = {}
+        for table_name in table_names:
+            columns = _columns(con, table_name)
+            column_names = [name for name, _ in columns]
+            rows = con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+            partitioned = has_matches and 'match_id' in column_names
+            table_dir = os.path.join(staging_dir, table_name)
+
+            if rows and partitioned:
+                con.execute(f"""
+                    COPY ({_partitioned_select(table_name, column_names)}) TO '{table_dir}'
+                    (FORMAT PARQUET, PARTITION_BY ({', '.join(PARTITION_COLUMNS)}), COMPRESSION ZSTD)
+                """)
+            elif rows:
+                os.makedirs(table_dir)
+                con.execute(f"""
+                    COPY {table_name} TO '{os.path.join(table_dir, 'data.parquet')}'
+                    (FORMAT PARQUET, COMPRESSION ZSTD)
+                """)
+
+            tables[table_name] = {'columns': columns, 'rows': rows, 'partitioned': partitioned}
+            print(f"Exported {table_name}: {rows} rows{' (partitioned)' if partitioned else ''}")
+    finally:
+        con.close()
+
+    manifest = {
+        'source': os.path.abspath(db_path),
+        'exported_at': datetime.now(timezone.utc).isoformat(),
+        'partition_columns': PARTITION_COLUMNS,
+        'tables': tables
+    }
+    with open(os.path.join(staging_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    # Swap the finished export in place of the previous one
+    previous_dir = f"{out_dir}.old-{os.getpid()}"
+    if os.path.exists(out_dir):
+        os.rename(out_dir, previous_dir)
+    os.rename(staging_dir, out_dir)
+    shutil.rmtree(previous_dir, ignore_errors=True)
+    return manifest
+
+def main():
+    # Configuration
+    DB_PATH = 'cricket_matches.db'
+    OUT_DIR = 'cricket_parquet'
+
+    parser = argparse.ArgumentParser(description="Export the match database as hive-partitioned Parquet")
+    parser.add_argument('--db', default=DB_PATH, help="Source DuckDB database")
+    parser.add_argument('--out', default=OUT_DIR, help="Export directory, replaced on each run")
+    args = parser.parse_args()
+
+    manifest = export_parquet(args.db, args.out)
+    print(f"Exported {len(manifest['tables'])} tables to {args.out}")
+
+if __name__ == "__main__":
+    main()
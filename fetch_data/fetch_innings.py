@@ -1,9 +1,9 @@
-import http.client
 import duckdb
 import json
-import os
 import time
 
+from api_client import api_connection, api_headers
+
 def fetch_match_innings_details(match_id):
     """
     Fetch innings details for a specific match_id
@@ -15,11 +15,8 @@ def fetch_match_innings_details(match_id):
         list: Parsed innings details or None if fetch fails
     """
     try:
-        conn = http.client.HTTPSConnection("cricbuzz-cricket.p.rapidapi.com")
-        headers = {
-            'x-rapidapi-key': os.getenv("RAPIDAPI_KEY2"),
-            'x-rapidapi-host': "cricbuzz-cricket.p.rapidapi.com"
-        }
+        conn = api_connection()
+        headers = api_headers()
         
         # Fetch scorecard data for the specific match
         conn.request("GET", f"/mcenter/v1/{match_id}/scard", headers=headers)
@@ -1,9 +1,9 @@
-import http.client
 import json
 import duckdb
-import os
+
+from api_client import api_connection, api_headers
+
 # Cricbuzz API Configuration
-CRICBUZZ_API_HOST = "cricbuzz-cricket.p.rapidapi.com"
 ENDPOINT = "/teams/v1/international"
 
 # DuckDB Database Configuration
@@ -12,12 +12,8 @@ TABLE_NAME = "teams"
 
 def fetch_team_data():
     """Fetch team data from the Cricbuzz API."""
-    conn = http.client.HTTPSConnection(CRICBUZZ_API_HOST)
-    headers = {
-        'x-rapidapi-key': os.getenv("RAPIDAPI_KEY2"),
-        'x-rapidapi-host': CRICBUZZ_API_HOST
-    }
-    conn.request("GET", ENDPOINT, headers=headers)
+    conn = api_connection()
+    conn.request("GET", ENDPOINT, headers=api_headers())
     response = conn.getresponse()
     if response.status != 200:
         raise Exception(f"API request failed with status {response.status}")
@@ -0,0 +1,689 @@
+import argparse
+import pandas as pd
+
+from api_client import CricbuzzClient, fetch_scorecards_concurrently
+from career_stats import PLAYER_TABLES, refresh_career_stats
+from response_cache import CACHE_DIR, ResponseCache, scorecard_endpoint
+from series_aggregates import refresh_series_aggregates
+from schema import PRIMARY_KEYS, ensure_schema, get_watermark, update_watermarks
+from staging import staged_connection
+
+# Columns written for each table, in insert order
+MATCH_DETAILS_COLUMNS = [
+    'match_id',
+    'is_complete',
+    'is_day_night',
+    'match_year',
+    'match_state',
+    'match_status',
+    'toss_winner_id',
+    'toss_winner_name',
+    'toss_decision',
+    'winning_team_id',
+    'winning_team_name',
+    'winning_margin',
+    'is_won_by_runs',
+    'is_won_by_innings',
+    'series_id',
+    'series_name'
+]
+
+INNINGS_DETAILS_COLUMNS = [
+    'match_id',
+    'innings_id',
+    'time_score',
+    'ball_number',
+    'is_declared',
+    'is_follow_on',
+    'overs',
+    'revised_overs',
+    'run_rate',
+    'total_runs',
+    'total_wickets',
+    'extras_no_balls',
+    'extras_total',
+    'extras_byes',
+    'extras_penalty',
+    'extras_wides',
+    'extras_leg_byes'
+]
+
+BATSMEN_DETAILS_COLUMNS = [
+    'match_id',
+    'innings_id',
+    'bat_team_id',
+    'bat_team_name',
+    'bat_team_short_name',
+    'batsman_id',
+    'batsman_name',
+    'is_captain',
+    'is_keeper',
+    'runs',
+    'balls_faced',
+    'dots',
+    'fours',
+    'sixes',
+    'minutes',
+    'strike_rate',
+    'out_description',
+    'bowler_id',
+    'fielder1_id',
+    'fielder2_id',
+    'fielder3_id',
+    'wicket_code',
+    'batting_position'
+]
+
+BOWLERS_DETAILS_COLUMNS = [
+    'match_id',
+    'innings_id',
+    'bowl_team_id',
+    'bowl_team_name',
+    'bowl_team_short_name',
+    'bowler_id',
+    'bowler_name',
+    'is_captain',
+    'is_keeper',
+    'overs',
+    'maidens',
+    'runs_conceded',
+    'wickets',
+    'economy',
+    'no_balls',
+    'wides',
+    'dot_balls',
+    'bowling_position'
+]
+
+PARTNERSHIPS_COLUMNS = [
+    'match_id',
+    'innings_id',
+    'partnership_id',
+    'bat1_id',
+    'bat1_name',
+    'bat1_runs',
+    'bat1_fours',
+    'bat1_sixes',
+    'bat2_id',
+    'bat2_name',
+    'bat2_runs',
+    'bat2_fours',
+    'bat2_sixes',
+    'total_runs',
+    'total_balls'
+]
+
+TABLE_COLUMNS = {
+    'match_details': MATCH_DETAILS_COLUMNS,
+    'innings_details': INNINGS_DETAILS_COLUMNS,
+    'batsmen_details': BATSMEN_DETAILS_COLUMNS,
+    'bowlers_details': BOWLERS_DETAILS_COLUMNS,
+    'partnerships': PARTNERSHIPS_COLUMNS
+}
+
+def fetch_scorecard(match_id, client=None):
+    """
+    Fetch the full scorecard document for a specific match_id
+
+    Args:
+        match_id (int): Unique identifier for the match
+        client (CricbuzzClient): Client to reuse, a new one is created if omitted
+
+    Returns:
+        dict: Parsed scorecard JSON or None if fetch fails
+    """
+    try:
+        client = client or CricbuzzClient()
+        return client.get_json(f"/mcenter/v1/{match_id}/scard")
+    except Exception as e:
+        print(f"Error fetching scorecard for match {match_id}: {e}")
+        return None
+
+def _key_position(key, default):
+    # 'bat_3' -> 3: scorecards key players in batting and bowling order
+    try:
+        return int(key.split('_')[1])
+    except (IndexError, ValueError):
+        return default
+
+def parse_match_details(match_id, match_data):
+    """
+    Extract the match_details row from a scorecard document
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        list: A single match_details row, or an empty list if there is no header
+    """
+    header = match_data.get('matchHeader')
+    if not header:
+        return []
+
+    toss_results = header.get('tossResults', {})
+    result = header.get('result', {})
+    return [{
+        'match_id': match_id,
+        'is_complete': header.get('complete', False),
+        'is_day_night': header.get('dayNight', False),
+        'match_year': header.get('year'),
+        'match_state': header.get('state'),
+        'match_status': header.get('status'),
+        'toss_winner_id': toss_results.get('tossWinnerId'),
+        'toss_winner_name': toss_results.get('tossWinnerName'),
+        'toss_decision': toss_results.get('decision'),
+        'winning_team_id': result.get('winningteamId'),
+        'winning_team_name': result.get('winningTeam'),
+        'winning_margin': result.get('winningMargin'),
+        'is_won_by_runs': result.get('winByRuns', False),
+        'is_won_by_innings': result.get('winByInnings', False),
+        'series_id': header.get('seriesId'),
+        'series_name': header.get('seriesName')
+    }]
+
+def parse_innings_details(match_id, match_data):
+    """
+    Extract innings_details rows from a scorecard document
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        list: One row per innings
+    """
+    innings_details = []
+    for innings in match_data.get('scoreCard', []):
+        score_details = innings.get('scoreDetails', {})
+        extras_data = innings.get('extrasData', {})
+        innings_details.append({
+            'match_id': match_id,
+            'innings_id': innings.get('inningsId'),
+            'time_score': innings.get('timeScore'),
+            'ball_number': score_details.get('ballNbr'),
+            'is_declared': score_details.get('isDeclared', False),
+            'is_follow_on': score_details.get('isFollowOn', False),
+            'overs': score_details.get('overs'),
+            'revised_overs': score_details.get('revisedOvers', 0),
+            'run_rate': score_details.get('runRate'),
+            'total_runs': score_details.get('runs'),
+            'total_wickets': score_details.get('wickets'),
+            'extras_no_balls': extras_data.get('noBalls', 0),
+            'extras_total': extras_data.get('total', 0),
+            'extras_byes': extras_data.get('byes', 0),
+            'extras_penalty': extras_data.get('penalty', 0),
+            'extras_wides': extras_data.get('wides', 0),
+            'extras_leg_byes': extras_data.get('legByes', 0)
+        })
+    return innings_details
+
+def parse_batsmen_details(match_id, match_data):
+    """
+    Extract batsmen_details rows from a scorecard document
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        list: One row per batsman per innings
+    """
+    batsmen_details = []
+    for scorecard in match_data.get('scoreCard', []):
+        innings_id = scorecard.get('inningsId')
+        bat_team_details = scorecard.get('batTeamDetails', {})
+
+        for position, (bat_key, batsman) in enumerate(bat_team_details.get('batsmenData', {}).items(), start=1):
+            batsmen_details.append({
+                'match_id': match_id,
+                'innings_id': innings_id,
+                'bat_team_id': bat_team_details.get('batTeamId'),
+                'bat_team_name': bat_team_details.get('batTeamName'),
+                'bat_team_short_name': bat_team_details.get('batTeamShortName'),
+                'batsman_id': batsman.get('batId'),
+                'batsman_name': batsman.get('batName'),
+                'is_captain': batsman.get('isCaptain', False),
+                'is_keeper': batsman.get('isKeeper', False),
+                'runs': batsman.get('runs', 0),
+                'balls_faced': batsman.get('balls', 0),
+                'dots': batsman.get('dots', 0),
+                'fours': batsman.get('fours', 0),
+                'sixes': batsman.get('sixes', 0),
+                'minutes': batsman.get('mins', 0),
+                'strike_rate': batsman.get('strikeRate', 0.0),
+                'out_description': batsman.get('outDesc', ''),
+                'bowler_id': batsman.get('bowlerId', 0),
+                'fielder1_id': batsman.get('fielderId1', 0),
+                'fielder2_id': batsman.get('fielderId2', 0),
+                'fielder3_id': batsman.get('fielderId3', 0),
+                'wicket_code': batsman.get('wicketCode', ''),
+                'batting_position': _key_position(bat_key, position)
+            })
+    return batsmen_details
+
+def parse_bowlers_details(match_id, match_data):
+    """
+    Extract bowlers_details rows from a scorecard document
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        list: One row per bowler per innings
+    """
+    bowlers_details = []
+    for scorecard in match_data.get('scoreCard', []):
+        innings_id = scorecard.get('inningsId')
+        bowl_team_details = scorecard.get('bowlTeamDetails', {})
+
+        for position, (bowl_key, bowler) in enumerate(bowl_team_details.get('bowlersData', {}).items(), start=1):
+            bowlers_details.append({
+                'match_id': match_id,
+                'innings_id': innings_id,
+                'bowl_team_id': bowl_team_details.get('bowlTeamId'),
+                'bowl_team_name': bowl_team_details.get('bowlTeamName'),
+                'bowl_team_short_name': bowl_team_details.get('bowlTeamShortName', ''),
+                'bowler_id': bowler.get('bowlerId'),
+                'bowler_name': bowler.get('bowlName'),
+                'is_captain': bowler.get('isCaptain', False),
+                'is_keeper': bowler.get('isKeeper', False),
+                'overs': bowler.get('overs', 0.0),
+                'maidens': bowler.get('maidens', 0),
+                'runs_conceded': bowler.get('runs', 0),
+                'wickets': bowler.get('wickets', 0),
+                'economy': bowler.get('economy', 0.0),
+                'no_balls': bowler.get('no_balls', 0),
+                'wides': bowler.get('wides', 0),
+                'dot_balls': bowler.get('dots', 0),
+                'bowling_position': _key_position(bowl_key, position)
+            })
+    return bowlers_details
+
+def parse_partnerships_details(match_id, match_data):
+    """
+    Extract partnerships rows from a scorecard document
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        list: One row per partnership per innings
+    """
+    partnerships_details = []
+    for scorecard in match_data.get('scoreCard', []):
+        innings_id = scorecard.get('inningsId')
+
+        for partnership_key, partnership in scorecard.get('partnershipsData', {}).items():
+            # Extract partnership ID from the key (e.g., 'pat_1' -> 1)
+            try:
+                partnership_id = int(partnership_key.split('_')[1])
+            except (IndexError, ValueError):
+                partnership_id = 0
+
+            partnerships_details.append({
+                'match_id': match_id,
+                'innings_id': innings_id,
+                'partnership_id': partnership_id,
+                'bat1_id': partnership.get('bat1Id', 0),
+                'bat1_name': partnership.get('bat1Name', ''),
+                'bat1_runs': partnership.get('bat1Runs', 0),
+                'bat1_fours': partnership.get('bat1fours', 0),
+                'bat1_sixes': partnership.get('bat1sixes', 0),
+                'bat2_id': partnership.get('bat2Id', 0),
+                'bat2_name': partnership.get('bat2Name', ''),
+                'bat2_runs': partnership.get('bat2Runs', 0),
+                'bat2_fours': partnership.get('bat2fours', 0),
+                'bat2_sixes': partnership.get('bat2sixes', 0),
+                'total_runs': partnership.get('totalRuns', 0),
+                'total_balls': partnership.get('totalBalls', 0)
+            })
+    return partnerships_details
+
+# Parser for each target table
+TABLE_PARSERS = {
+    'match_details': parse_match_details,
+    'innings_details': parse_innings_details,
+    'batsmen_details': parse_batsmen_details,
+    'bowlers_details': parse_bowlers_details,
+    'partnerships': parse_partnerships_details
+}
+
+def parse_scorecard(match_id, match_data):
+    """
+    Fan a scorecard document out into rows for every scorecard table
+
+    Args:
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        dict: Table name -> list of rows
+    """
+    return {
+        table_name: parser(match_id, match_data)
+        for table_name, parser in TABLE_PARSERS.items()
+    }
+
+class ScorecardBatchWriter:
+    """
+    Collect parsed scorecard rows across many matches and bulk load them.
+
+    Rows are buffered per table; `flush` clears every table's rows for the
+    batch's matches and loads each buffer as a DataFrame with a single
+    INSERT ... SELECT per table, all inside one transaction. A refetched
+    scorecard therefore replaces its match outright: rows it no longer has,
+    such as a removed partnership, are dropped rather than left behind.
+    The ids of players whose rows are cleared are kept in
+    `replaced_player_ids`, so derived tables can also update players the
+    new scorecard no longer lists.
+    """
+
+    def __init__(self, con, batch_size=500):
+        """
+        Args:
+            con (duckdb.DuckDBPyConnection): Open read-write connection
+            batch_size (int): Matches buffered before `add` flushes automatically
+        """
+        self.con = con
+        self.batch_size = batch_size
+        self.match_ids = []
+        self.rows = {table_name: [] for table_name in TABLE_COLUMNS}
+        self.replaced_player_ids = {id_column: set() for id_column in PLAYER_TABLES}
+
+    def add(self, match_id, match_data):
+        """
+        Parse a scorecard into the current batch
+
+        Args:
+            match_id (int): Unique identifier for the match
+            match_data (dict): Parsed scorecard JSON
+
+        Returns:
+            dict: Result of `flush` if the batch filled up, otherwise None
+        """
+        for table_name, rows in parse_scorecard(match_id, match_data).items():
+            self.rows[table_name].extend(rows)
+        self.match_ids.append(match_id)
+        if len(self.match_ids) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        """
+        Load the buffered batch into every table in one transaction
+
+        Returns:
+            tuple: (match ids loaded, table name -> rows upserted)
+        """
+        match_ids, table_rows = self.match_ids, self.rows
+        self.match_ids = []
+        self.rows = {table_name: [] for table_name in TABLE_COLUMNS}
+        counts = {table_name: 0 for table_name in TABLE_COLUMNS}
+        if not match_ids:
+            return match_ids, counts
+
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.register('batch_match_ids', pd.DataFrame({'match_id': match_ids}))
+            try:
+                for id_column, table_name in PLAYER_TABLES.items():
+                    self.replaced_player_ids[id_column].update(player_id for (player_id,) in self.con.execute(f"""
+                        SELECT DISTINCT {id_column} FROM {table_name}
+                        WHERE match_id IN (SELECT match_id FROM batch_match_ids) AND {id_column} IS NOT NULL
+                    """).fetchall())
+                for table_name in TABLE_COLUMNS:
+                    self.con.execute(f"""
+                        DELETE FROM {table_name}
+                        WHERE match_id IN (SELECT match_id FROM batch_match_ids)
+                    """)
+            finally:
+                self.con.unregister('batch_match_ids')
+
+            for table_name, rows in table_rows.items():
+                if not rows:
+                    continue
+                columns = TABLE_COLUMNS[table_name]
+                key = PRIMARY_KEYS[table_name]
+                batch = pd.DataFrame.from_records(rows, columns=columns)
+                # The primary key rejects repeated keys within one statement
+                batch = batch.dropna(subset=key).drop_duplicates(subset=key, keep='last')
+
+                self.con.register('scorecard_batch', batch)
+                try:
+                    self.con.execute(f"""
+                        INSERT INTO {table_name} ({', '.join(columns)})
+                        SELECT {', '.join(columns)} FROM scorecard_batch
+                    """)
+                finally:
+                    self.con.unregister('scorecard_batch')
+                counts[table_name] = len(batch)
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+
+        return match_ids, counts
+
+def store_scorecard(con, match_id, match_data):
+    """
+    Replace the rows of one scorecard in all five tables in a single transaction
+
+    The match's existing rows are deleted before the new ones are inserted,
+    so storing the same scorecard again never duplicates rows.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        match_id (int): Unique identifier for the match
+        match_data (dict): Parsed scorecard JSON
+
+    Returns:
+        dict: Table name -> number of rows upserted
+    """
+    writer = ScorecardBatchWriter(con)
+    writer.add(match_id, match_data)
+    _, counts = writer.flush()
+    return counts
+
+def _is_complete(match_data):
+    return bool(match_data and match_data.get('matchHeader', {}).get('complete'))
+
+class _IngestRun:
+    """Batch scorecards into the writer and keep the totals needed to advance watermarks."""
+
+    def __init__(self, con, batch_size=500):
+        self.con = con
+        self.writer = ScorecardBatchWriter(con, batch_size=batch_size)
+        self.match_ids = []
+        self.table_counts = {table_name: 0 for table_name in TABLE_COLUMNS}
+
+    def store(self, match_id, match_data):
+        if not match_data or 'matchHeader' not in match_data:
+            print(f"No scorecard found for match {match_id}")
+            return
+        try:
+            self._record(self.writer.add(match_id, match_data))
+        except Exception as e:
+            print(f"Error storing scorecard batch ending at match {match_id}: {e}")
+
+    def _record(self, result):
+        if result is None:
+            return
+        match_ids, counts = result
+        if match_ids:
+            print(f"Loaded {len(match_ids)} scorecards: {counts}")
+        self.match_ids.extend(match_ids)
+        for table_name, count in counts.items():
+            self.table_counts[table_name] += count
+
+    def fetch_and_store(self, cache, match_ids, workers, requests_per_second):
+        client = CricbuzzClient(requests_per_second=requests_per_second)
+        for match_id, match_data in fetch_scorecards_concurrently(client, match_ids, workers=workers):
+            if match_data:
+                cache.put(scorecard_endpoint(match_id), match_data)
+            self.store(match_id, match_data)
+
+    def finish(self):
+        try:
+            self._record(self.writer.flush())
+        except Exception as e:
+            print(f"Error storing final scorecard batch: {e}")
+        update_watermarks(self.con, self.table_counts, self.match_ids)
+        print(f"Stored {len(self.match_ids)} scorecards: {self.table_counts}")
+        try:
+            refresh_series_aggregates(self.con, self.match_ids)
+        except Exception as e:
+            print(f"Error refreshing series aggregates: {e}")
+        try:
+            refresh_career_stats(self.con, self.match_ids, self.writer.replaced_player_ids)
+        except Exception as e:
+            print(f"Error refreshing career stats: {e}")
+
+def select_pending_matches(con, full=False):
+    """
+    Select the matches an ingest run needs to touch
+
+    Incremental runs pick matches with no match_details row, matches whose
+    stored state is not complete, and matches starting after the oldest
+    scorecard-table watermark.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open connection
+        full (bool): Ignore watermarks and select every match
+
+    Returns:
+        list: Match ids to ingest
+    """
+    if full:
+        query, params = "SELECT DISTINCT match_id FROM international_matches", []
+    else:
+        query = """
+            SELECT DISTINCT im.match_id
+            FROM international_matches im
+            LEFT JOIN match_details md ON im.match_id = md.match_id
+            WHERE md.match_id IS NULL
+               OR md.match_state IS NULL
+               OR lower(md.match_state) <> 'complete'
+               OR im.start_date > ?
+        """
+        params = [get_watermark(con, list(TABLE_COLUMNS)) or '-infinity']
+    return [match_id for (match_id,) in con.execute(query, params).fetchall()]
+
+def ingest_scorecards(db_path, workers=4, requests_per_second=2.0, cache_dir=CACHE_DIR, full=False, batch_size=500):
+    """
+    Incrementally fetch international match scorecards and upsert every scorecard table
+
+    Only new or changed matches are selected (see select_pending_matches).
+    Completed scorecards already in the response cache are stored without an
+    API call; the rest are fetched concurrently on `workers` threads sharing
+    one token bucket, cached, and bulk loaded on the calling thread.
+
+    Args:
+        db_path (str): Path to DuckDB database
+        workers (int): Number of concurrent fetch threads
+        requests_per_second (float): API quota shared by all threads
+        cache_dir (str): Raw response cache directory
+        full (bool): Ignore watermarks and process every match
+        batch_size (int): Scorecards per bulk load
+    """
+    cache = ResponseCache(cache_dir)
+
+    with staged_connection(db_path) as con:
+        try:
+            ensure_schema(con)
+            run = _IngestRun(con, batch_size=batch_size)
+
+            to_fetch = []
+            for match_id in select_pending_matches(con, full=full):
+                match_data = cache.get(scorecard_endpoint(match_id))
+                if _is_complete(match_data):
+                    run.store(match_id, match_data)
+                else:
+                    to_fetch.append(match_id)
+
+            run.fetch_and_store(cache, to_fetch, workers, requests_per_second)
+            run.finish()
+
+        except Exception as e:
+            print(f"Error ingesting scorecards: {e}")
+
+def replay_scorecards(db_path, cache_dir=CACHE_DIR, batch_size=500):
+    """
+    Rebuild the scorecard rows of every cached match without any API calls
+
+    Each batch deletes and reloads its own matches in one transaction (see
+    ScorecardBatchWriter), so matches missing from the cache keep their
+    stored rows and a failed run leaves every match either old or rebuilt.
+
+    Args:
+        db_path (str): Path to DuckDB database
+        cache_dir (str): Raw response cache directory
+        batch_size (int): Scorecards per bulk load
+    """
+    cache = ResponseCache(cache_dir)
+
+    with staged_connection(db_path) as con:
+        try:
+            ensure_schema(con)
+            run = _IngestRun(con, batch_size=batch_size)
+            for match_id, match_data in cache.scorecards():
+                run.store(match_id, match_data)
+            run.finish()
+
+        except Exception as e:
+            print(f"Error replaying scorecards: {e}")
+
+def refresh_incomplete_scorecards(db_path, workers=4, requests_per_second=2.0, cache_dir=CACHE_DIR, batch_size=500):
+    """
+    Refetch only the matches whose stored match_state is not complete
+
+    Args:
+        db_path (str): Path to DuckDB database
+        workers (int): Number of concurrent fetch threads
+        requests_per_second (float): API quota shared by all threads
+        cache_dir (str): Raw response cache directory
+        batch_size (int): Scorecards per bulk load
+    """
+    cache = ResponseCache(cache_dir)
+
+    with staged_connection(db_path) as con:
+        try:
+            ensure_schema(con)
+            match_ids = [match_id for (match_id,) in con.execute("""
+                SELECT match_id
+                FROM match_details
+                WHERE match_state IS NULL OR lower(match_state) <> 'complete'
+            """).fetchall()]
+            print(f"Refreshing {len(match_ids)} incomplete matches")
+
+            run = _IngestRun(con, batch_size=batch_size)
+            run.fetch_and_store(cache, match_ids, workers, requests_per_second)
+            run.finish()
+
+        except Exception as e:
+            print(f"Error refreshing incomplete scorecards: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load Cricbuzz scorecards into DuckDB")
+    parser.add_argument('--db', default='cricket_matches.db', help="Path to DuckDB database")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="Raw response cache directory")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent fetch threads")
+    parser.add_argument('--rps', type=float, default=2.0, help="API requests per second")
+    parser.add_argument('--batch-size', type=int, default=500, help="Scorecards per bulk load")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--replay', action='store_true', help="Rebuild every cached match from the cache, no network")
+    mode.add_argument('--refresh-incomplete', action='store_true', help="Refetch matches that are not complete")
+    mode.add_argument('--full', action='store_true', help="Ignore watermarks and process every match")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay_scorecards(args.db, cache_dir=args.cache_dir, batch_size=args.batch_size)
+    elif args.refresh_incomplete:
+        refresh_incomplete_scorecards(args.db, workers=args.workers, requests_per_second=args.rps, cache_dir=args.cache_dir, batch_size=args.batch_size)
+    else:
+        ingest_scorecards(args.db, workers=args.workers, requests_per_second=args.rps, cache_dir=args.cache_dir, full=args.full, batch_size=args.batch_size)
+
+if __name__ == "__main__":
+    main()
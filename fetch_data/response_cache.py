@@ -0,0 +1,107 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+# Default location of the raw API response cache
+CACHE_DIR = 'api_cache'
+
+SCORECARD_ENDPOINT = re.compile(r'^/mcenter/v1/(\d+)/scard$')
+
+def scorecard_endpoint(match_id):
+    """Return the scorecard endpoint path for a match."""
+    return f"/mcenter/v1/{match_id}/scard"
+
+class ResponseCache:
+    """
+    Compressed on-disk cache of raw API responses.
+
+    Entries are addressed by the SHA-256 of the endpoint path and stored as
+    gzipped JSON under a two-character fan-out directory. Each entry records
+    its endpoint so the cache can be walked without a database.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        """
+        Args:
+            cache_dir (str): Directory holding cached responses
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, endpoint):
+        digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json.gz")
+
+    def get(self, endpoint):
+        """
+        Load a cached response
+
+        Args:
+            endpoint (str): Request path
+
+        Returns:
+            dict: Cached JSON body or None if not cached
+        """
+        path = self._path(endpoint)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)['body']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable cache entry for {endpoint}: {e}")
+            return None
+
+    def put(self, endpoint, body):
+        """
+        Store a response, replacing any previous entry atomically
+
+        Args:
+            endpoint (str): Request path
+            body (dict): Parsed JSON response
+        """
+        path = self._path(endpoint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump({'endpoint': endpoint, 'fetched_at': time.time(), 'body': body}, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def entries(self):
+        """
+        Walk every cached response
+
+        Yields:
+            tuple: (endpoint, body)
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for root, _, files in os.walk(self.cache_dir):
+            for name in sorted(files):
+                if not name.endswith('.json.gz'):
+                    continue
+                try:
+                    with gzip.open(os.path.join(root, name), 'rt', encoding='utf-8') as f:
+                        entry = json.load(f)
+                    yield entry['endpoint'], entry['body']
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Skipping unreadable cache entry {name}: {e}")
+
+    def scorecards(self):
+        """
+        Walk every cached scorecard
+
+        Yields:
+            tuple: (match_id, scorecard dict)
+        """
+        for endpoint, body in self.entries():
+            match = SCORECARD_ENDPOINT.match(endpoint)
+            if match:
+                yield int(match.group(1)), body
@@ -0,0 +1,302 @@
+import duckdb
+
+from staging import staged_connection
+
+# Table definitions for the scorecard tables, with their primary keys
+TABLE_DEFINITIONS = {
+    'match_details': ('''
+        match_id INTEGER,
+        is_complete BOOLEAN,
+        is_day_night BOOLEAN,
+        match_year INTEGER,
+        match_state VARCHAR,
+        match_status VARCHAR,
+        toss_winner_id INTEGER,
+        toss_winner_name VARCHAR,
+        toss_decision VARCHAR,
+        winning_team_id INTEGER,
+        winning_team_name VARCHAR,
+        winning_margin INTEGER,
+        is_won_by_runs BOOLEAN,
+        is_won_by_innings BOOLEAN,
+        series_id INTEGER,
+        series_name VARCHAR
+    ''', ['match_id']),
+    'innings_details': ('''
+        match_id INTEGER,
+        innings_id INTEGER,
+        time_score BIGINT,
+        ball_number INTEGER,
+        is_declared BOOLEAN,
+        is_follow_on BOOLEAN,
+        overs FLOAT,
+        revised_overs INTEGER,
+        run_rate FLOAT,
+        total_runs INTEGER,
+        total_wickets INTEGER,
+        extras_no_balls INTEGER,
+        extras_total INTEGER,
+        extras_byes INTEGER,
+        extras_penalty INTEGER,
+        extras_wides INTEGER,
+        extras_leg_byes INTEGER
+    ''', ['match_id', 'innings_id']),
+    'batsmen_details': ('''
+        match_id INTEGER,
+        innings_id INTEGER,
+        bat_team_id INTEGER,
+        bat_team_name VARCHAR,
+        bat_team_short_name VARCHAR,
+        batsman_id INTEGER,
+        batsman_name VARCHAR,
+        is_captain BOOLEAN,
+        is_keeper BOOLEAN,
+        runs INTEGER,
+        balls_faced INTEGER,
+        dots INTEGER,
+        fours INTEGER,
+        sixes INTEGER,
+        minutes INTEGER,
+        strike_rate FLOAT,
+        out_description VARCHAR,
+        bowler_id INTEGER,
+        fielder1_id INTEGER,
+        fielder2_id INTEGER,
+        fielder3_id INTEGER,
+        wicket_code VARCHAR,
+        batting_position INTEGER
+    ''', ['match_id', 'innings_id', 'batsman_id']),
+    'bowlers_details': ('''
+        match_id INTEGER,
+        innings_id INTEGER,
+        bowl_team_id INTEGER,
+        bowl_team_name VARCHAR,
+        bowl_team_short_name VARCHAR,
+        bowler_id INTEGER,
+        bowler_name VARCHAR,
+        is_captain BOOLEAN,
+        is_keeper BOOLEAN,
+        overs FLOAT,
+        maidens INTEGER,
+        runs_conceded INTEGER,
+        wickets INTEGER,
+        economy FLOAT,
+        no_balls INTEGER,
+        wides INTEGER,
+        dot_balls INTEGER,
+        bowling_position INTEGER
+    ''', ['match_id', 'innings_id', 'bowler_id']),
+    'partnerships': ('''
+        match_id INTEGER,
+        innings_id INTEGER,
+        partnership_id INTEGER,
+        bat1_id INTEGER,
+        bat1_name VARCHAR,
+        bat1_runs INTEGER,
+        bat1_fours INTEGER,
+        bat1_sixes INTEGER,
+        bat2_id INTEGER,
+        bat2_name VARCHAR,
+        bat2_runs INTEGER,
+        bat2_fours INTEGER,
+        bat2_sixes INTEGER,
+        total_runs INTEGER,
+        total_balls INTEGER
+    ''', ['match_id', 'innings_id', 'partnership_id'])
+}
+
+PRIMARY_KEYS = {table_name: key for table_name, (_, key) in TABLE_DEFINITIONS.items()}
+
+# Scorecard order of the batting and bowling cards; clustering rewrites rows in match order only
+POSITION_COLUMNS = {'batting_position', 'bowling_position'}
+
+# Tables the dashboard reads one match at a time, indexed on match_id.
+# match_details needs no extra index: its primary key is match_id alone.
+MATCH_TABLES = ['innings_details', 'batsmen_details', 'bowlers_details', 'partnerships']
+
+def _column_definitions(columns):
+    # 'match_id INTEGER,\n...' -> [('match_id', 'INTEGER'), ...]
+    return [tuple(line.strip().rstrip(',').split(None, 1)) for line in columns.strip().splitlines() if line.strip()]
+
+def table_columns(table_name):
+    """
+    Column names of a scorecard table, in table order
+
+    Args:
+        table_name (str): Scorecard table, e.g. batsmen_details
+
+    Returns:
+        list: Column names
+    """
+    return [name for name, _ in _column_definitions(TABLE_DEFINITIONS[table_name][0])]
+
+def _table_exists(con, table_name):
+    return con.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND database_name = current_database()",
+        [table_name]
+    ).fetchone()[0] > 0
+
+def _has_primary_key(con, table_name):
+    return con.execute("""
+        SELECT COUNT(*) FROM duckdb_constraints()
+        WHERE table_name = ? AND constraint_type = 'PRIMARY KEY' AND database_name = current_database()
+    """, [table_name]).fetchone()[0] > 0
+
+def _add_missing_columns(con, table_name):
+    # Columns added to TABLE_DEFINITIONS later; positions are backfilled from insertion order
+    existing = {name for name, *_ in con.execute(f"DESCRIBE {table_name}").fetchall()}
+    for name, column_type in _column_definitions(TABLE_DEFINITIONS[table_name][0]):
+        if name in existing:
+            continue
+        con.execute(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}")
+        if name in POSITION_COLUMNS:
+            con.execute(f"""
+                UPDATE {table_name} SET {name} = ordered.position
+                FROM (
+                    SELECT rowid AS row_id, row_number() OVER (PARTITION BY match_id, innings_id ORDER BY rowid) AS position
+                    FROM {table_name}
+                ) ordered
+                WHERE {table_name}.rowid = ordered.row_id
+            """)
+        print(f"Added column {name} to {table_name}")
+
+def _create_table(con, table_name, columns, key):
+    con.execute(f"CREATE TABLE {table_name} ({columns}, PRIMARY KEY ({', '.join(key)}))")
+
+def create_scorecard_table(con, table_name, physical_name=None):
+    """
+    Create a keyed scorecard table from its definition
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        table_name (str): Scorecard table, e.g. batsmen_details
+        physical_name (str): Name to create it under, e.g. for a copy; `table_name` by default
+    """
+    columns, key = TABLE_DEFINITIONS[table_name]
+    _create_table(con, physical_name or table_name, columns, key)
+
+def match_index_name(table_name):
+    return f"idx_{table_name}_match_id"
+
+def ensure_match_indexes(con):
+    """
+    Create the match_id ART indexes behind the per-match lookups
+
+    The composite primary keys start with match_id, but DuckDB only uses an
+    index for a filter on all of its columns, so `WHERE match_id = ?` needs
+    its own single-column index to avoid a full scan.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+    """
+    for table_name in MATCH_TABLES:
+        con.execute(f"CREATE INDEX IF NOT EXISTS {match_index_name(table_name)} ON {table_name} (match_id)")
+
+def ensure_schema(con):
+    """
+    Create the scorecard and watermark tables, adding primary keys where missing
+
+    Tables created before keys were declared are rebuilt in place: rows with
+    a NULL key are dropped and duplicate keys keep a single row. Columns
+    added to TABLE_DEFINITIONS since a table was created are added to it,
+    with positions numbered in stored row order. The tables in MATCH_TABLES
+    get a match_id index.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+    """
+    for table_name, (columns, key) in TABLE_DEFINITIONS.items():
+        if not _table_exists(con, table_name):
+            _create_table(con, table_name, columns, key)
+            continue
+        # Before any rebuild below, while rows are still in insertion order
+        _add_missing_columns(con, table_name)
+        if _has_primary_key(con, table_name):
+            continue
+
+        key_list = ', '.join(key)
+        con.execute("BEGIN TRANSACTION")
+        try:
+            con.execute(f"ALTER TABLE {table_name} RENAME TO {table_name}_unkeyed")
+            _create_table(con, table_name, columns, key)
+            con.execute(f"""
+                INSERT INTO {table_name}
+                SELECT DISTINCT ON ({key_list}) * FROM {table_name}_unkeyed
+                WHERE {' AND '.join(f'{column} IS NOT NULL' for column in key)}
+            """)
+            con.execute(f"DROP TABLE {table_name}_unkeyed")
+            con.execute("COMMIT")
+            print(f"Added primary key ({key_list}) to {table_name}")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS ingest_watermarks (
+            table_name VARCHAR PRIMARY KEY,
+            last_start_date TIMESTAMP,
+            last_match_id INTEGER,
+            rows_upserted BIGINT,
+            updated_at TIMESTAMP
+        )
+    """)
+
+    ensure_match_indexes(con)
+
+def get_watermark(con, table_names):
+    """
+    Return the oldest ingest watermark across tables
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open connection
+        table_names (list): Tables that must all be up to date
+
+    Returns:
+        datetime: Lowest last_start_date, or None if any table has no watermark
+    """
+    rows = con.execute(f"""
+        SELECT table_name, last_start_date FROM ingest_watermarks
+        WHERE table_name IN ({', '.join('?' for _ in table_names)})
+    """, list(table_names)).fetchall()
+    if len(rows) < len(table_names) or any(last is None for _, last in rows):
+        return None
+    return min(last for _, last in rows)
+
+def update_watermarks(con, table_counts, match_ids):
+    """
+    Advance per-table watermarks after an ingest run
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        table_counts (dict): Table name -> rows upserted in this run
+        match_ids (list): Matches stored in this run
+    """
+    if not match_ids:
+        return
+    last_start_date, last_match_id = con.execute(f"""
+        SELECT max(start_date), arg_max(match_id, start_date)
+        FROM international_matches
+        WHERE match_id IN ({', '.join('?' for _ in match_ids)})
+    """, list(match_ids)).fetchone()
+
+    for table_name, rows_upserted in table_counts.items():
+        con.execute("""
+            INSERT INTO ingest_watermarks VALUES (?, ?, ?, ?, now())
+            ON CONFLICT (table_name) DO UPDATE SET
+                last_start_date = greatest(ingest_watermarks.last_start_date, excluded.last_start_date),
+                last_match_id = CASE
+                    WHEN excluded.last_start_date >= coalesce(ingest_watermarks.last_start_date, excluded.last_start_date)
+                    THEN excluded.last_match_id ELSE ingest_watermarks.last_match_id END,
+                rows_upserted = excluded.rows_upserted,
+                updated_at = excluded.updated_at
+        """, [table_name, last_start_date, last_match_id, rows_upserted])
+
+def main():
+    # Configuration
+    DB_PATH = 'cricket_matches.db'
+
+    with staged_connection(DB_PATH) as con:
+        ensure_schema(con)
+
+if __name__ == "__main__":
+    main()
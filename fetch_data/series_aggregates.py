@@ -0,0 +1,116 @@
+from staging import staged_connection
+
+ALL_SERIES = 'All Series'
+
+def ensure_aggregate_tables(con):
+    """
+    Create the per-series summary tables read by the Series Overview tab
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+    """
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS series_team_wins (
+            series_id INTEGER,
+            series_name VARCHAR,
+            winning_team_name VARCHAR,
+            wins INTEGER
+        )
+    """)
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS series_match_formats (
+            series_id INTEGER,
+            series_name VARCHAR,
+            match_format VARCHAR,
+            count INTEGER
+        )
+    """)
+
+def _series_filter(series_names):
+    # NULL series names need IS NULL rather than IN
+    names = [name for name in series_names if name is not None]
+    clauses = []
+    if names:
+        clauses.append(f"im.series_name IN ({', '.join('?' for _ in names)})")
+    if len(names) < len(series_names):
+        clauses.append("im.series_name IS NULL")
+    return ' OR '.join(clauses) or 'false', names
+
+def refresh_series_aggregates(con, match_ids=None):
+    """
+    Refresh team wins and format counts per series, plus the 'All Series' rows
+
+    Only series containing `match_ids` are recomputed; the 'All Series' rows
+    are then re-summed from the per-series rows, so the cost follows the
+    size of the run rather than the size of the archive.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open read-write connection
+        match_ids (list): Matches changed by the ingest run, None to rebuild everything
+    """
+    ensure_aggregate_tables(con)
+
+    if match_ids is None:
+        where, params = 'true', []
+        delete_where, delete_params = "true", []
+    else:
+        if not match_ids:
+            return
+        series_names = [name for (name,) in con.execute(f"""
+            SELECT DISTINCT series_name FROM international_matches
+            WHERE match_id IN ({', '.join('?' for _ in match_ids)})
+        """, list(match_ids)).fetchall()]
+        if not series_names:
+            return
+        where, params = _series_filter(series_names)
+        delete_where, delete_params = where.replace('im.', ''), params
+
+    con.execute("BEGIN TRANSACTION")
+    try:
+        for table_name in ('series_team_wins', 'series_match_formats'):
+            con.execute(f"DELETE FROM {table_name} WHERE ({delete_where}) OR series_name = ?", delete_params + [ALL_SERIES])
+
+        con.execute(f"""
+            INSERT INTO series_team_wins
+            SELECT any_value(md.series_id), im.series_name, md.winning_team_name, COUNT(*)
+            FROM international_matches im
+            JOIN match_details md ON im.match_id = md.match_id
+            WHERE ({where}) AND md.winning_team_name IS NOT NULL
+            GROUP BY im.series_name, md.winning_team_name
+        """, params)
+        con.execute(f"""
+            INSERT INTO series_match_formats
+            SELECT any_value(md.series_id), im.series_name, im.match_format, COUNT(*)
+            FROM international_matches im
+            JOIN match_details md ON im.match_id = md.match_id
+            WHERE ({where}) AND im.match_format IS NOT NULL
+            GROUP BY im.series_name, im.match_format
+        """, params)
+
+        con.execute("""
+            INSERT INTO series_team_wins
+            SELECT NULL, ?, winning_team_name, SUM(wins)
+            FROM series_team_wins
+            GROUP BY winning_team_name
+        """, [ALL_SERIES])
+        con.execute("""
+            INSERT INTO series_match_formats
+            SELECT NULL, ?, match_format, SUM(count)
+            FROM series_match_formats
+            GROUP BY match_format
+        """, [ALL_SERIES])
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+def main():
+    # Configuration
+    DB_PATH = 'cricket_matches.db'
+
+    with staged_connection(DB_PATH) as con:
+        refresh_series_aggregates(con)
+        print("Rebuilt series aggregates")
+
+if __name__ == "__main__":
+    main()
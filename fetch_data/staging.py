@@ -0,0 +1,67 @@
+import os
+import shutil
+from contextlib import contextmanager
+
+import duckdb
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, run one writer at a time by hand
+    fcntl = None
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+@contextmanager
+def staged_connection(db_path):
+    """
+    Open a read-write copy of a database and rename it over the original on exit
+
+    A running dashboard keeps the database open read-only, and DuckDB then
+    refuses read-write opens from any other process. Writers therefore work
+    on a copy beside the file and move it into place when they finish. The
+    dashboard notices the new modification time on its next health check
+    and reopens the file; until then it serves the old one.
+
+    Whatever was committed is published, even if the block raises, just as
+    it would stay in a database written in place. A lock file next to the
+    database makes a second writer wait, so neither overwrites the other's
+    copy.
+
+    Args:
+        db_path (str): DuckDB database to write; created if missing
+
+    Yields:
+        duckdb.DuckDBPyConnection: Read-write connection to the copy
+    """
+    db_path = os.path.abspath(db_path)
+    staging_path = f"{db_path}.tmp-{os.getpid()}"
+    with open(f"{db_path}.lock", 'w') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        _remove(staging_path)
+        _remove(f"{staging_path}.wal")
+        had_wal = os.path.exists(f"{db_path}.wal")
+        try:
+            if os.path.exists(db_path):
+                shutil.copyfile(db_path, staging_path)
+            if had_wal:
+                # Left by a writer that did not shut down cleanly; the copy replays it
+                shutil.copyfile(f"{db_path}.wal", f"{staging_path}.wal")
+            con = duckdb.connect(staging_path)
+        except Exception:
+            _remove(staging_path)
+            _remove(f"{staging_path}.wal")
+            raise
+
+        try:
+            yield con
+        finally:
+            # Closing checkpoints the copy, so the renamed file needs no WAL
+            con.close()
+            os.replace(staging_path, db_path)
+            if had_wal:
+                _remove(f"{db_path}.wal")
@@ -0,0 +1,36 @@
+"""
+Production server settings
+
+    gunicorn -c gunicorn.conf.py app:server
+
+The app is imported once in the master (preload_app), which loads the match
+data before any worker is forked, so workers share those pages copy-on-write.
+The master then closes its DuckDB handle, once; each worker opens its own
+read-only handle on first use. The data version depends only on the database
+contents, so a worker's first load finds the preloaded frames current.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('CRICKET_BIND', '0.0.0.0:8050')
+workers = int(os.environ.get('CRICKET_WORKERS', multiprocessing.cpu_count()))
+# Threads per worker share the worker's cursor pool (8 cursors by default)
+threads = int(os.environ.get('CRICKET_THREADS', 4))
+timeout = int(os.environ.get('CRICKET_TIMEOUT', 60))
+preload_app = True
+
+# No debug mode, no dev tools
+raw_env = ['CRICKET_ENV=production', 'DASH_DEBUG=false']
+
+def when_ready(server):
+    # Runs once in the master before the first fork; respawned workers reuse the same frames.
+    # Wait for the warmup thread so no fork happens while it holds a lock or a DuckDB cursor.
+    import app
+    data = app.dashboard_data()
+    if data.warmup_thread is not None:
+        data.warmup_thread.join()
+    try:
+        data.load()
+    except Exception as e:
+        server.log.error(f"Could not preload match data: {e}")
+    data.manager.close()
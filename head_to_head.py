@@ -0,0 +1,124 @@
+from datetime import datetime
+
+import numpy as np
+
+from metrics import execute_timed
+
+ALL_FORMATS = 'All Formats'
+
+# Layers of HeadToHeadMatrix.counts, each from the row team's point of view
+OUTCOMES = ('played', 'won', 'lost', 'no_result')
+
+def build_head_to_head_query(match_format=None, year_range=None):
+    """
+    One grouped scan of fixtures and results for the filter
+
+    Each fixture is counted once under (team1_name, team2_name); the
+    mirrored cells are filled in numpy rather than by a second scan. Only
+    completed matches count, so scheduled and live fixtures are not played
+    games without a result.
+
+    Args:
+        match_format (str): e.g. 'ODI', or None / ALL_FORMATS for every format
+        year_range (tuple): (first year, last year), inclusive, or None for all years
+
+    Returns:
+        tuple: (SQL string, list of parameters)
+    """
+    clauses = ['im.team1_name IS NOT NULL', 'im.team2_name IS NOT NULL', "lower(md.match_state) = 'complete'"]
+    params = []
+    if match_format and match_format != ALL_FORMATS:
+        clauses.append('im.match_format = ?')
+        params.append(match_format)
+    if year_range:
+        # A range on start_date itself, not year(start_date), so zone maps can skip row groups
+        clauses.append('im.start_date >= ? AND im.start_date < ?')
+        params += [datetime(int(year_range[0]), 1, 1), datetime(int(year_range[1]) + 1, 1, 1)]
+
+    sql = f"""
+        SELECT im.team1_name, im.team2_name,
+               COUNT(*) AS played,
+               COUNT(*) FILTER (WHERE md.winning_team_name = im.team1_name) AS team1_won,
+               COUNT(*) FILTER (WHERE md.winning_team_name = im.team2_name) AS team2_won
+        FROM international_matches im
+        JOIN match_details md ON im.match_id = md.match_id
+        WHERE {' AND '.join(clauses)}
+        GROUP BY im.team1_name, im.team2_name
+    """
+    return sql, params
+
+class HeadToHeadMatrix:
+    """
+    Dense team-vs-team results for one filter.
+
+    `teams` maps array index to team name; `counts[k, i, j]` holds outcome
+    OUTCOMES[k] for team i against team j, so counts[1] (won) is the
+    transpose of counts[2] (lost).
+    """
+
+    def __init__(self, teams, counts):
+        self.teams = teams
+        self.counts = counts
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Args:
+            rows (list): (team1_name, team2_name, played, team1_won, team2_won) tuples
+
+        Returns:
+            HeadToHeadMatrix
+        """
+        teams = sorted({row[0] for row in rows} | {row[1] for row in rows})
+        counts = np.zeros((len(OUTCOMES), len(teams), len(teams)), dtype=np.int64)
+        if not rows:
+            return cls(teams, counts)
+
+        index = {team: i for i, team in enumerate(teams)}
+        team1 = np.fromiter((index[row[0]] for row in rows), dtype=np.intp, count=len(rows))
+        team2 = np.fromiter((index[row[1]] for row in rows), dtype=np.intp, count=len(rows))
+        played, team1_won, team2_won = (np.array([row[k] for row in rows], dtype=np.int64) for k in (2, 3, 4))
+        no_result = played - team1_won - team2_won
+
+        # add.at accumulates repeated (i, j) pairs, e.g. a team listed first and second in different fixtures
+        for layer, forward, backward in ((0, played, played), (1, team1_won, team2_won),
+                                         (2, team2_won, team1_won), (3, no_result, no_result)):
+            np.add.at(counts[layer], (team1, team2), forward)
+            np.add.at(counts[layer], (team2, team1), backward)
+        return cls(teams, counts)
+
+    def top(self, n):
+        """
+        Restrict the matrix to the `n` teams with the most matches
+
+        Args:
+            n (int): Number of teams kept
+
+        Returns:
+            HeadToHeadMatrix: Teams in their original (alphabetical) order
+        """
+        if len(self.teams) <= n:
+            return self
+        keep = np.sort(np.argsort(-self.counts[0].sum(axis=1), kind='stable')[:n])
+        return HeadToHeadMatrix([self.teams[i] for i in keep], self.counts[:, keep][:, :, keep])
+
+    def win_percentage(self):
+        """Won / played per cell, NaN where the teams never met."""
+        played = self.counts[0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(played > 0, 100.0 * self.counts[1] / played, np.nan)
+
+def load_head_to_head(con, match_format=None, year_range=None):
+    """
+    Run the grouped query and build the dense matrix
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Open connection or cursor
+        match_format (str): Format filter, see build_head_to_head_query
+        year_range (tuple): (first year, last year) filter
+
+    Returns:
+        HeadToHeadMatrix
+    """
+    sql, params = build_head_to_head_query(match_format, year_range)
+    return HeadToHeadMatrix.from_rows(execute_timed(con, sql, params).fetchall())
@@ -0,0 +1,110 @@
+import bisect
+import re
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    """Lower-case alphanumeric tokens of `text`."""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+def match_labels(matches):
+    """Dropdown labels, "Team 1 vs Team 2 (Match Description)", for every row."""
+    return (
+        matches['team1_name'].astype(str) + ' vs ' + matches['team2_name'].astype(str)
+        + ' (' + matches['match_desc'].astype(str) + ')'
+    ).tolist()
+
+class MatchSearchIndex:
+    """
+    Prefix index over team names, match descriptions, series and dates.
+
+    Every distinct token is kept in one sorted list, so all tokens starting
+    with a typed prefix form a contiguous range found with two bisections.
+    Each token maps to the sorted row positions containing it; a multi-word
+    query intersects the matches of each word.
+
+    Options carry the indexed text in their `search` field: dcc.Dropdown
+    filters the options it receives in the browser against label, value and
+    search, and would otherwise hide matches found by series or date.
+    """
+
+    def __init__(self, matches):
+        """
+        Args:
+            matches (pd.DataFrame): Rows with match_id, team1_name, team2_name,
+                match_desc, series_name and optionally start_date
+        """
+        if 'start_date' in matches.columns:
+            # Most recent matches first, so the top N results are the newest
+            matches = matches.sort_values('start_date', ascending=False, na_position='last')
+        self.match_ids = matches['match_id'].tolist()
+        self.labels = match_labels(matches)
+        self.positions = {match_id: position for position, match_id in enumerate(self.match_ids)}
+
+        postings = {}
+        texts = [[] for _ in self.match_ids]
+        text_columns = [column for column in ('team1_name', 'team2_name', 'match_desc', 'series_name') if column in matches.columns]
+        for position, row in enumerate(matches[text_columns].itertuples(index=False)):
+            for value in row:
+                if pd.notna(value):
+                    texts[position].append(str(value))
+        if 'start_date' in matches.columns:
+            for position, start_date in enumerate(matches['start_date']):
+                if pd.notna(start_date):
+                    texts[position].append(f"{start_date:%Y-%m-%d %B}")
+        for position, values in enumerate(texts):
+            tokens = tokenize(' '.join(values))
+            for token in tokens:
+                postings.setdefault(token, set()).add(position)
+            # Raw values and their tokens, so the browser matches typed text however it splits words
+            texts[position] = ' '.join(values + tokens)
+        self.search_texts = texts
+
+        self.tokens = sorted(postings)
+        self.postings = [np.fromiter(sorted(postings[token]), dtype=np.int64) for token in self.tokens]
+
+    def _prefix_positions(self, prefix):
+        lo = bisect.bisect_left(self.tokens, prefix)
+        hi = bisect.bisect_left(self.tokens, prefix + '\uffff')
+        if lo == hi:
+            return np.empty(0, dtype=np.int64)
+        if hi - lo == 1:
+            return self.postings[lo]
+        return np.unique(np.concatenate(self.postings[lo:hi]))
+
+    def search(self, query, limit=20):
+        """
+        Find matches whose tokens start with every word of `query`
+
+        Args:
+            query (str): Free text typed by the user
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Dropdown options [{'label': ..., 'value': match_id, 'search': ...}], newest first
+        """
+        words = tokenize(query or '')
+        if not words:
+            return []
+
+        positions = None
+        # Rarest prefix first keeps the intersections small
+        for candidates in sorted((self._prefix_positions(word) for word in words), key=len):
+            positions = candidates if positions is None else np.intersect1d(positions, candidates, assume_unique=True)
+            if not len(positions):
+                return []
+
+        return [self._option(position) for position in positions[:limit]]
+
+    def _option(self, position):
+        return {'label': self.labels[position], 'value': self.match_ids[position], 'search': self.search_texts[position]}
+
+    def option_for(self, match_id):
+        """Dropdown option for one match id, or None if unknown."""
+        position = self.positions.get(match_id)
+        if position is None:
+            return None
+        return self._option(position)
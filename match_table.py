@@ -0,0 +1,122 @@
+import math
+
+# Columns shown in the Series Overview match table
+MATCH_TABLE_COLUMNS = ['match_id', 'series_name', 'match_desc', 'team1_name', 'team2_name', 'status']
+NUMERIC_COLUMNS = {'match_id'}
+
+FILTER_OPERATORS = [
+    ['ge ', '>='],
+    ['le ', '<='],
+    ['lt ', '<'],
+    ['gt ', '>'],
+    ['ne ', '!='],
+    ['eq ', '='],
+    ['contains '],
+    ['datestartswith ']
+]
+
+def split_filter_part(filter_part):
+    """
+    Parse one clause of a DataTable filter_query, e.g. {team1_name} contains India
+
+    Args:
+        filter_part (str): A single clause, without the && separator
+
+    Returns:
+        tuple: (column, operator, value), or (None, None, None) if unparseable
+    """
+    start, end = filter_part.find('{'), filter_part.find('}')
+    if start == -1 or end < start:
+        return None, None, None
+    name = filter_part[start + 1:end]
+    rest = filter_part[end + 1:].lstrip()
+
+    # Match the operator right after the column so values containing e.g. "ge " are safe
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if rest.startswith(operator):
+                value_part = rest[len(operator):].strip()
+                if len(value_part) > 1 and value_part[0] == value_part[-1] and value_part[0] in ('"', "'", '`'):
+                    value = value_part[1:-1].replace('\\' + value_part[0], value_part[0])
+                else:
+                    value = value_part
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+def build_filter_clauses(filter_query):
+    """
+    Translate a DataTable filter_query into parameterized SQL predicates
+
+    Only known table columns are accepted; values are always bound as parameters.
+
+    Args:
+        filter_query (str): DataTable filter_query, clauses joined with &&
+
+    Returns:
+        tuple: (list of SQL predicates, list of parameters)
+    """
+    clauses, params = [], []
+    for filter_part in (filter_query or '').split(' && '):
+        column, operator, value = split_filter_part(filter_part)
+        if column not in MATCH_TABLE_COLUMNS or value == '':
+            continue
+
+        if column in NUMERIC_COLUMNS and operator not in ('contains', 'datestartswith'):
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+
+        if operator == 'contains':
+            clauses.append(f"CAST({column} AS VARCHAR) ILIKE '%' || ? || '%'")
+        elif operator == 'datestartswith':
+            clauses.append(f"CAST({column} AS VARCHAR) LIKE ? || '%'")
+        else:
+            symbol = dict(FILTER_OPERATORS[:6])[operator + ' ']
+            clauses.append(f"{column} {symbol} ?")
+        params.append(value)
+    return clauses, params
+
+def build_match_table_query(selected_series, page_current, page_size, sort_by, filter_query):
+    """
+    Build one page of the match table as a LIMIT/OFFSET/ORDER BY/WHERE query
+
+    Args:
+        selected_series (str): Series name, or 'All Series'
+        page_current (int): Zero-based page number
+        page_size (int): Rows per page
+        sort_by (list): DataTable sort_by, [{'column_id': ..., 'direction': 'asc'|'desc'}]
+        filter_query (str): DataTable filter_query
+
+    Returns:
+        tuple: (SQL text, parameter tuple); rows carry a total_rows column
+    """
+    clauses, params = build_filter_clauses(filter_query)
+    if selected_series != 'All Series':
+        clauses.insert(0, "series_name = ?")
+        params.insert(0, selected_series)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    order_by = []
+    for sort in sort_by or []:
+        if sort.get('column_id') in MATCH_TABLE_COLUMNS:
+            direction = 'DESC' if sort.get('direction') == 'desc' else 'ASC'
+            order_by.append(f"{sort['column_id']} {direction} NULLS LAST")
+    order_by.append('match_id')
+
+    sql = f"""
+        SELECT {', '.join(MATCH_TABLE_COLUMNS)}, COUNT(*) OVER () AS total_rows
+        FROM (
+            SELECT {', '.join(f'im.{column}' for column in MATCH_TABLE_COLUMNS)}
+            FROM international_matches im
+            JOIN match_details md ON im.match_id = md.match_id
+        ) matches
+        {where}
+        ORDER BY {', '.join(order_by)}
+        LIMIT ? OFFSET ?
+    """
+    return sql, tuple(params) + (int(page_size), int(page_current) * int(page_size))
+
+def page_count(total_rows, page_size):
+    """Number of pages needed for `total_rows`, never less than one."""
+    return max(1, math.ceil(total_rows / page_size))
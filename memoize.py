@@ -0,0 +1,215 @@
+import functools
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from plotly.io.json import to_json_plotly
+
+from metrics import SERIALIZE_SECONDS, timed
+from query_cache import LRUCache
+
+class MemoryBackend:
+    """
+    In-process store of serialized callback results, least recently used first out.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 1024 * 1024):
+        """
+        Args:
+            max_entries (int): Results kept in memory
+            max_bytes (int): Total size of serialized results kept in memory
+        """
+        self.cache = LRUCache(max_entries, max_bytes=max_bytes, sizeof=lambda entry: len(entry[1]))
+
+    def get(self, key):
+        """Return the payload stored under `key`, or None if missing or expired."""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return payload
+
+    def set(self, key, payload, expires_at):
+        self.cache.put(key, (expires_at, payload))
+
+    def clear(self):
+        self.cache.clear()
+
+class FileSystemBackend:
+    """
+    Serialized callback results stored as files, shared by every worker process.
+
+    Each entry is one file whose first line is its expiry time. Reads bump the
+    file's modification time, so pruning by oldest mtime once the directory
+    passes `max_bytes` evicts the least recently used entries.
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache files
+            max_bytes (int): Total size of cache files kept on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(os.path.getsize(path) for path in self._files())
+
+    def _files(self):
+        return glob.glob(os.path.join(self.cache_dir, '*', '*.json'))
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Return the payload stored under `key`, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                expires_at = f.readline().strip()
+                payload = f.read()
+        except OSError:
+            return None
+        if expires_at and float(expires_at) < time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def set(self, key, payload, expires_at):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = f"{'' if expires_at is None else expires_at}\n{payload}".encode('utf-8')
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self.lock:
+            self.total_bytes += len(data)
+            if self.total_bytes > self.max_bytes:
+                self._prune()
+
+    def _prune(self):
+        files = []
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self.total_bytes = total
+
+    def clear(self):
+        with self.lock:
+            for path in self._files():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.total_bytes = 0
+
+class CallbackMemoizer:
+    """
+    Memoize pure callbacks on their arguments and the current data version.
+
+    Results are stored as Plotly/Dash JSON, so a hit costs one json.loads and
+    returns plain dicts and lists that Dash sends as they are. Keys include
+    the data version, so an ingest run makes every older entry unreachable.
+    Exceptions such as PreventUpdate are never cached.
+    """
+
+    def __init__(self, backend=None, version=None, ttl=None):
+        """
+        Args:
+            backend (MemoryBackend or FileSystemBackend): Result store, in-memory by default
+            version (callable): version() -> token that changes with the data
+            ttl (float): Default seconds a result stays valid, None for no expiry
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.version = version
+        self.ttl = ttl
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def _key(self, name, args, kwargs):
+        version = self.version() if self.version is not None else None
+        raw = json.dumps([str(version), name, args, kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _count(self, name, outcome):
+        with self.lock:
+            counters = self.counters.setdefault(name, {'hits': 0, 'misses': 0})
+            counters[outcome] += 1
+
+    def memoize(self, ttl=None):
+        """
+        Decorator caching a function's serialized result
+
+        Place it below @callback so Dash registers the memoized function.
+
+        Args:
+            ttl (float): Seconds a result stays valid, defaults to the memoizer's ttl
+
+        Returns:
+            callable: Decorator
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        def decorator(func):
+            name = f"{func.__module__}.{func.__qualname__}"
+            with self.lock:
+                self.counters.setdefault(name, {'hits': 0, 'misses': 0})
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = self._key(name, args, kwargs)
+                payload = self.backend.get(key)
+                if payload is not None:
+                    self._count(name, 'hits')
+                    return json.loads(payload)
+
+                self._count(name, 'misses')
+                result = func(*args, **kwargs)
+                with timed(SERIALIZE_SECONDS, func.__name__):
+                    payload = to_json_plotly(result)
+                self.backend.set(key, payload, None if ttl is None else time.time() + ttl)
+                return json.loads(payload)
+
+            return wrapper
+
+        return decorator
+
+    def stats(self):
+        """
+        Hit and miss counters per memoized function
+
+        Returns:
+            dict: Function name -> {'hits': int, 'misses': int}
+        """
+        with self.lock:
+            return {name: dict(counters) for name, counters in self.counters.items()}
@@ -0,0 +1,284 @@
+import functools
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow scans
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Queries slower than this many seconds are re-run under EXPLAIN ANALYZE; unset or 0 disables it
+SLOW_QUERY_SECONDS = float(os.environ.get('CRICKET_SLOW_QUERY_SECONDS') or 0)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(label_names, label_values, extra=()):
+    pairs = list(zip(label_names, label_values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+class Histogram:
+    """
+    Prometheus histogram with labels: cumulative bucket counts, sum and count.
+    """
+
+    def __init__(self, name, help_text, label_names=(), buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            name (str): Metric name, e.g. dashboard_query_seconds
+            help_text (str): HELP line
+            label_names (tuple): Label names, in the order values are passed
+            buckets (tuple): Upper bounds in seconds, ascending
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self.lock:
+            series = self.series.get(label_values)
+            if series is None:
+                series = self.series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            items = [(labels, list(counts), total, count) for labels, (counts, total, count) in self.series.items()]
+        for label_values, counts, total, count in sorted(items):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, label_values, [('le', repr(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values, [('le', '+Inf')])
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class Counter:
+    """
+    Prometheus counter with labels.
+    """
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            items = sorted(self.values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {value}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics rendered in the Prometheus text format.
+
+    Collectors are callables returning extra exposition lines at scrape time,
+    for values owned elsewhere such as cache hit counters.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []
+        self.lock = threading.Lock()
+
+    def _get_or_create(self, metric_class, name, *args):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = metric_class(name, *args)
+            return metric
+
+    def histogram(self, name, help_text, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, help_text, label_names, buckets)
+
+    def counter(self, name, help_text, label_names=()):
+        return self._get_or_create(Counter, name, help_text, label_names)
+
+    def register_collector(self, collect):
+        """
+        Args:
+            collect (callable): collect() -> list of exposition lines
+        """
+        with self.lock:
+            self.collectors.append(collect)
+
+    def render(self):
+        """
+        Returns:
+            str: Every metric in the Prometheus text exposition format
+        """
+        with self.lock:
+            metrics = list(self.metrics.values())
+            collectors = list(self.collectors)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collect in collectors:
+            try:
+                lines.extend(collect())
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+QUERY_SECONDS = REGISTRY.histogram(
+    'dashboard_query_seconds', 'DuckDB query execution time, by query fingerprint', ('fingerprint',))
+CALLBACK_SECONDS = REGISTRY.histogram(
+    'dashboard_callback_seconds', 'Dash callback body time, by callback', ('callback',))
+CALLBACK_ERRORS = REGISTRY.counter(
+    'dashboard_callback_errors_total', 'Dash callbacks that raised, by callback', ('callback',))
+RENDER_SECONDS = REGISTRY.histogram(
+    'dashboard_render_seconds', 'Figure and table construction time, by component', ('component',))
+SERIALIZE_SECONDS = REGISTRY.histogram(
+    'dashboard_serialize_seconds', 'JSON serialization time of cached output, by component', ('component',))
+REQUEST_SECONDS = REGISTRY.histogram(
+    'dashboard_request_seconds', 'HTTP request time including Dash serialization, by route', ('route',))
+SLOW_QUERIES = REGISTRY.counter(
+    'dashboard_slow_queries_total', 'Queries over the slow query threshold, by query fingerprint', ('fingerprint',))
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+_fingerprints = {}
+# Fingerprint -> normalized query text (truncated), exposed as dashboard_query_info
+QUERY_TEXT = {}
+_fingerprints_lock = threading.Lock()
+
+def query_fingerprint(sql):
+    """
+    Short stable id for a query shape: literals and whitespace are normalized away
+
+    Args:
+        sql (str): Query text
+
+    Returns:
+        str: 12 hex characters, the same for every execution of the same query shape
+    """
+    fingerprint = _fingerprints.get(sql)
+    if fingerprint is None:
+        normalized = _WHITESPACE.sub(' ', _LITERALS.sub('?', sql)).strip().lower()
+        fingerprint = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:12]
+        with _fingerprints_lock:
+            _fingerprints[sql] = fingerprint
+            QUERY_TEXT.setdefault(fingerprint, normalized[:200])
+    return fingerprint
+
+def _query_info():
+    lines = ["# HELP dashboard_query_info Normalized text of each query fingerprint", "# TYPE dashboard_query_info gauge"]
+    with _fingerprints_lock:
+        items = sorted(QUERY_TEXT.items())
+    for fingerprint, text in items:
+        lines.append(f'dashboard_query_info{{fingerprint="{fingerprint}",query="{_escape(text)}"}} 1')
+    return lines
+
+REGISTRY.register_collector(_query_info)
+
+# Most recent slow query plans, newest last
+SLOW_QUERY_LOG = deque(maxlen=50)
+
+def execute_timed(con, sql, params=None):
+    """
+    Execute a query, recording its time under the query's fingerprint
+
+    When SLOW_QUERY_SECONDS is set and the query takes longer, it is run again
+    under EXPLAIN ANALYZE and the plan is kept in SLOW_QUERY_LOG.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Connection or cursor
+        sql (str): Query text
+        params (list): Query parameters
+
+    Returns:
+        duckdb.DuckDBPyConnection: `con`, ready to fetch the results
+    """
+    fingerprint = query_fingerprint(sql)
+    started = time.perf_counter()
+    con.execute(sql, params)
+    elapsed = time.perf_counter() - started
+    QUERY_SECONDS.observe(elapsed, fingerprint)
+
+    if SLOW_QUERY_SECONDS and elapsed > SLOW_QUERY_SECONDS:
+        SLOW_QUERIES.inc(fingerprint)
+        try:
+            # A separate cursor leaves the caller's pending result untouched
+            explain = con.cursor()
+            try:
+                plan = '\n'.join(row[-1] for row in explain.execute(f"EXPLAIN ANALYZE {sql}", params).fetchall())
+            finally:
+                explain.close()
+        except Exception as e:
+            plan = f"EXPLAIN ANALYZE failed: {e}"
+        SLOW_QUERY_LOG.append({
+            'fingerprint': fingerprint,
+            'seconds': round(elapsed, 6),
+            'query': QUERY_TEXT.get(fingerprint),
+            'captured_at': datetime.now(timezone.utc).isoformat(),
+            'plan': plan
+        })
+        print(f"Slow query {fingerprint} took {elapsed:.3f}s")
+    return con
+
+@contextmanager
+def timed(histogram, *label_values):
+    """Observe the time spent in the with block."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, *label_values)
+
+def timed_callback(func):
+    """Decorator timing a Dash callback body and counting its errors (PreventUpdate excluded)."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if type(e).__name__ != 'PreventUpdate':
+                CALLBACK_ERRORS.inc(name)
+            raise
+        finally:
+            CALLBACK_SECONDS.observe(time.perf_counter() - started, name)
+
+    return wrapper
+
+def timed_render(component):
+    """Decorator timing figure or table construction under `component`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(RENDER_SECONDS, component):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+
+from metrics import execute_timed
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by entry count and,
+    optionally, by the total size of its values.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=None, sizeof=len):
+        """
+        Args:
+            max_entries (int): Entries kept before the least recently used is evicted
+            max_bytes (int): Total size kept before evicting, None for no size limit
+            sizeof (callable): sizeof(value) -> size in bytes, used with max_bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        with self.lock:
+            self._discard(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Would evict everything else and still not fit
+                return
+            self.entries[key] = value
+            self.sizes[key] = size
+            self.total_bytes += size
+            while len(self.entries) > self.max_entries or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                self._discard(next(iter(self.entries)))
+
+    def _discard(self, key):
+        if key in self.entries:
+            del self.entries[key]
+            self.total_bytes -= self.sizes.pop(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.total_bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+class QueryCache:
+    """
+    Cache of parameterized query results keyed by (query, params, data version).
+
+    When the data version reported by the connection manager changes, every
+    cached result is dropped so the next request reads the new data.
+    """
+
+    def __init__(self, manager, max_entries=256):
+        """
+        Args:
+            manager (ConnectionManager): Source of cursors and the data version
+            max_entries (int): Results kept in memory
+        """
+        self.manager = manager
+        self.cache = LRUCache(max_entries)
+        self.version = None
+        self.lock = threading.Lock()
+
+    def _current_version(self):
+        version = self.manager.data_version()
+        with self.lock:
+            if version != self.version:
+                self.cache.clear()
+                self.version = version
+        return version
+
+    def cached(self, sql, params, load):
+        """
+        Return a cached result, computing it with `load` on a miss
+
+        Args:
+            sql (str): Query text, part of the cache key
+            params (tuple): Query parameters, part of the cache key
+            load (callable): load(cursor) -> result, run on a cache miss
+
+        Returns:
+            object: Cached result, shared between callers; do not mutate
+        """
+        key = (sql, tuple(params), self._current_version())
+        result = self.cache.get(key)
+        if result is None:
+            with self.manager.cursor() as con:
+                result = load(con)
+            self.cache.put(key, result)
+        return result
+
+    def query(self, sql, params=()):
+        """
+        Run a parameterized query, serving repeated calls from memory
+
+        Args:
+            sql (str): Query text with ? placeholders
+            params (tuple): Query parameters
+
+        Returns:
+            pd.DataFrame: Query result, shared between callers; do not mutate
+        """
+        return self.cached(sql, params, lambda con: execute_timed(con, sql, list(params)).df())
@@ -0,0 +1,62 @@
+import json
+import threading
+
+from plotly.io.json import to_json_plotly
+
+from metrics import SERIALIZE_SECONDS, timed
+from query_cache import LRUCache
+
+class RenderCache:
+    """
+    Serialized callback output keyed by (match_id, view, data version).
+
+    Scorecards, partnership figures and the overview card of a finished match
+    never change, so their rendered JSON is kept and a repeat request costs a
+    single json.loads. Entries are evicted least recently used first once their
+    total size passes `max_bytes`, and everything is dropped when the ingest
+    data version changes.
+    """
+
+    def __init__(self, manager, max_bytes=64 * 1024 * 1024, max_entries=4096):
+        """
+        Args:
+            manager (ConnectionManager): Source of the data version
+            max_bytes (int): Total size of serialized output kept in memory
+            max_entries (int): Rendered views kept in memory
+        """
+        self.manager = manager
+        self.cache = LRUCache(max_entries, max_bytes=max_bytes)
+        self.version = None
+        self.lock = threading.Lock()
+
+    def _current_version(self):
+        version = self.manager.data_version()
+        with self.lock:
+            if version != self.version:
+                self.cache.clear()
+                self.version = version
+        return version
+
+    def render(self, match_id, view, build, cacheable=True):
+        """
+        Return the output of `build`, from the cache when possible
+
+        Args:
+            match_id (int): Match the view shows
+            view (str): Name of the view, e.g. 'details' or 'summary'
+            build (callable): build() -> Dash components and/or figures
+            cacheable (bool): False for views that may still change, e.g. live matches
+
+        Returns:
+            object: JSON-ready output (plain dicts and lists) for a Dash callback
+        """
+        if not cacheable:
+            return build()
+        key = (match_id, view, self._current_version())
+        payload = self.cache.get(key)
+        if payload is None:
+            output = build()
+            with timed(SERIALIZE_SECONDS, view):
+                payload = to_json_plotly(output)
+            self.cache.put(key, payload)
+        return json.loads(payload)
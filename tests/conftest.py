@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Dashboard modules live at the repository root; ingest modules import each other from fetch_data/
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, 'fetch_data')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
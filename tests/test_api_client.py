@@ -0,0 +1,110 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api_client import CricbuzzClient, TokenBucket, fetch_scorecards_concurrently, retry_after_seconds
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    # Answers each request with the next (status, headers) of the server's script, then 200
+    def do_GET(self):
+        # Count before answering: the client may check the count as soon as it has the response
+        self.server.requests += 1
+        status, headers = self.server.script.pop(0) if self.server.script else (200, {})
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ScriptedHandler)
+    server.script = []
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def client_for(server, **kwargs):
+    return CricbuzzClient(requests_per_second=100, base_url=f"http://127.0.0.1:{server.server_port}", **kwargs)
+
+def test_token_bucket_allows_a_burst_then_limits():
+    bucket = TokenBucket(rate=1, capacity=3)
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+def test_retry_after_seconds_reads_delay_seconds():
+    assert retry_after_seconds('3', 1) == 3.0
+    assert retry_after_seconds('-5', 1) == 0.0
+    assert retry_after_seconds(None, 2) == 2
+
+def test_retry_after_seconds_reads_http_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 25 <= retry_after_seconds(format_datetime(retry_at, usegmt=True), 1) <= 30
+    assert retry_after_seconds('Wed, 21 Oct 2015 07:28:00 GMT', 1) == 0.0
+    assert retry_after_seconds('soon', 4) == 4
+
+def test_client_retries_after_429_with_http_date(api_server):
+    api_server.script = [(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})]
+    client = client_for(api_server, max_retries=2)
+    try:
+        assert client.get_json('/mcenter/v1/1/scard') == {'path': '/mcenter/v1/1/scard'}
+    finally:
+        client.close()
+    assert api_server.requests == 2
+
+def test_client_with_zero_retries_still_makes_one_attempt(api_server):
+    client = client_for(api_server, max_retries=0)
+    try:
+        assert client.get_json('/ok') == {'path': '/ok'}
+    finally:
+        client.close()
+
+def test_client_raises_the_last_error_when_retries_run_out(api_server):
+    api_server.script = [(429, {'Retry-After': '0'})] * 2
+    client = client_for(api_server, max_retries=2)
+    try:
+        with pytest.raises(Exception, match='rate limit'):
+            client.get_json('/limited')
+    finally:
+        client.close()
+    assert api_server.requests == 2
+
+class CountingClient:
+    def __init__(self):
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def get_json(self, endpoint):
+        with self.lock:
+            self.requested.append(endpoint)
+        return {'endpoint': endpoint}
+
+def test_concurrent_fetch_keeps_a_bounded_window():
+    client = CountingClient()
+    results = fetch_scorecards_concurrently(client, range(1000), workers=2, max_pending=4)
+
+    seen = []
+    for match_id, scorecard in results:
+        # Requests never run more than the window ahead of what was consumed
+        assert len(client.requested) <= len(seen) + 1 + 4
+        seen.append(match_id)
+        assert scorecard == {'endpoint': f"/mcenter/v1/{match_id}/scard"}
+
+    assert sorted(seen) == list(range(1000))
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from callbacks import register_callbacks
+from memoize import CallbackMemoizer
+
+class CapturingApp:
+    # Stands in for dash.Dash: keeps the registered callback function
+    def callback(self, *args):
+        def register(func):
+            self.func = func
+            return func
+        return register
+
+def merged_matches():
+    return pd.DataFrame({
+        'match_id': [1, 2], 'series_name': ['Asia Cup', 'Asia Cup'], 'match_desc': ['1st ODI', '2nd ODI'],
+        'team1_name': ['India', 'Pakistan'], 'team2_name': ['Pakistan', 'India'],
+        'winning_team_name': ['India', 'India'], 'status': ['India won', 'India won'], 'match_format': ['ODI', 'ODI']
+    })
+
+def test_errors_are_not_memoized():
+    matches = merged_matches()
+    app = CapturingApp()
+    register_callbacks(app, matches, memoizer=CallbackMemoizer(ttl=3600))
+
+    # A transient failure: the frame is missing a column for one call
+    status = matches.pop('status')
+    table, wins, formats = app.func('Asia Cup')
+    assert table == []
+
+    matches['status'] = status
+    table, wins, formats = app.func('Asia Cup')
+    assert [row['match_id'] for row in table] == [1, 2]
+    assert wins['data']
@@ -0,0 +1,120 @@
+import duckdb
+import pytest
+
+from career_stats import refresh_career_stats
+from ingest_scorecard import _IngestRun
+from schema import ensure_schema
+
+def batting(bat_id, name, runs, balls, out_desc='c Smith b Jones'):
+    return {'batId': bat_id, 'batName': name, 'runs': runs, 'balls': balls, 'outDesc': out_desc}
+
+def bowling(bowler_id, name, overs, runs, wickets):
+    return {'bowlerId': bowler_id, 'bowlName': name, 'overs': overs, 'runs': runs, 'wickets': wickets}
+
+def scorecard(batsmen, bowlers, state='Complete'):
+    return {
+        'matchHeader': {'state': state, 'complete': state == 'Complete'},
+        'scoreCard': [{
+            'inningsId': 1,
+            'batTeamDetails': {
+                'batTeamId': 2, 'batTeamName': 'India',
+                'batsmenData': {f'bat_{i}': b for i, b in enumerate(batsmen, start=1)},
+            },
+            'bowlTeamDetails': {
+                'bowlTeamId': 4, 'bowlTeamName': 'Australia',
+                'bowlersData': {f'bowl_{i}': b for i, b in enumerate(bowlers, start=1)},
+            },
+        }],
+    }
+
+@pytest.fixture
+def con():
+    con = duckdb.connect()
+    # The fixture list the ingest run advances its watermarks from
+    con.execute("""
+        CREATE TABLE international_matches AS
+        SELECT range AS match_id, 'Test' AS match_format, TIMESTAMP '2023-01-01' + to_days(range::INTEGER) AS start_date,
+               'India' AS team1_name, 'Australia' AS team2_name
+        FROM range(1, 4)
+    """)
+    ensure_schema(con)
+    yield con
+    con.close()
+
+def ingest(con, scorecards):
+    run = _IngestRun(con)
+    for match_id, match_data in scorecards.items():
+        run.store(match_id, match_data)
+    run.finish()
+
+def batting_career(con, batsman_id):
+    return con.execute("""
+        SELECT matches, innings, not_outs, runs, highest_score, average, strike_rate
+        FROM player_batting_careers WHERE batsman_id = ?
+    """, [batsman_id]).fetchone()
+
+def bowling_career(con, bowler_id):
+    return con.execute("""
+        SELECT matches, wickets, balls, average, economy, best_wickets, best_runs
+        FROM player_bowling_careers WHERE bowler_id = ?
+    """, [bowler_id]).fetchone()
+
+def test_batting_average_counts_only_dismissals(con):
+    ingest(con, {
+        1: scorecard([batting(10, 'Gavaskar', 60, 100)], [bowling(20, 'Lillee', 10.0, 40, 1)]),
+        2: scorecard([batting(10, 'Gavaskar', 40, 50, out_desc='not out')], [bowling(20, 'Lillee', 10.0, 40, 1)]),
+    })
+
+    matches, innings, not_outs, runs, highest, average, strike_rate = batting_career(con, 10)
+    assert (matches, innings, not_outs, runs, highest) == (2, 2, 1, 100, 60)
+    assert average == 100
+    assert strike_rate == pytest.approx(100 * 100 / 150)
+
+def test_best_figures_prefer_wickets_then_fewest_runs(con):
+    ingest(con, {
+        1: scorecard([batting(10, 'Gavaskar', 0, 1)], [bowling(20, 'Lillee', 9.3, 30, 2)]),
+        2: scorecard([batting(10, 'Gavaskar', 0, 1)], [bowling(20, 'Lillee', 10.0, 50, 3)]),
+        3: scorecard([batting(10, 'Gavaskar', 0, 1)], [bowling(20, 'Lillee', 8.0, 20, 3)]),
+    })
+
+    matches, wickets, balls, average, economy, best_wickets, best_runs = bowling_career(con, 20)
+    assert (matches, wickets, balls) == (3, 8, 57 + 60 + 48)
+    assert average == pytest.approx(100 / 8)
+    assert economy == pytest.approx(6 * 100 / 165)
+    assert (best_wickets, best_runs) == (3, 20)
+
+def test_refetched_scorecard_without_a_player_drops_their_contribution(con):
+    ingest(con, {
+        1: scorecard([batting(10, 'Gavaskar', 50, 80), batting(11, 'Kapil', 30, 20)],
+                     [bowling(20, 'Lillee', 5.0, 25, 1), bowling(21, 'Thomson', 4.0, 30, 0)], state='In Progress'),
+        2: scorecard([batting(11, 'Kapil', 10, 12)], [bowling(21, 'Thomson', 10.0, 45, 2)]),
+    })
+    assert batting_career(con, 11)[3] == 40
+    assert bowling_career(con, 21)[1] == 2
+
+    # The final scorecard for match 1 no longer lists Kapil or Thomson
+    ingest(con, {
+        1: scorecard([batting(10, 'Gavaskar', 70, 110)], [bowling(20, 'Lillee', 10.0, 42, 2)]),
+    })
+
+    assert batting_career(con, 10)[3] == 70
+    assert batting_career(con, 11)[:4] == (1, 1, 0, 10)
+    assert bowling_career(con, 21)[:2] == (1, 2)
+
+def test_player_whose_only_match_dropped_them_loses_their_career(con):
+    ingest(con, {1: scorecard([batting(10, 'Gavaskar', 50, 80), batting(11, 'Kapil', 30, 20)], [])})
+
+    ingest(con, {1: scorecard([batting(10, 'Gavaskar', 50, 80)], [])})
+
+    assert batting_career(con, 11) is None
+
+def test_full_rebuild_matches_incremental_refresh(con):
+    ingest(con, {
+        1: scorecard([batting(10, 'Gavaskar', 50, 80)], [bowling(20, 'Lillee', 5.0, 25, 1)]),
+        2: scorecard([batting(10, 'Gavaskar', 25, 30)], [bowling(20, 'Lillee', 7.2, 31, 4)]),
+    })
+    incremental = con.execute("SELECT * FROM player_batting_careers ORDER BY batsman_id").fetchall()
+
+    refresh_career_stats(con)
+
+    assert con.execute("SELECT * FROM player_batting_careers ORDER BY batsman_id").fetchall() == incremental
@@ -0,0 +1,51 @@
+import os
+import shutil
+
+import duckdb
+
+from connection_manager import ConnectionManager
+from staging import staged_connection
+from test_schema import BUNDLED_DB
+
+def test_data_version_survives_closing_and_reopening(tmp_path):
+    path = str(tmp_path / 'cricket_matches.db')
+    shutil.copyfile(BUNDLED_DB, path)
+    manager = ConnectionManager(path)
+    version = manager.data_version()
+
+    # What gunicorn's master does before forking, and what a forked worker sees
+    manager.close()
+    assert manager.data_version() == version
+    assert ConnectionManager(path).data_version() == version
+    manager.close()
+
+def test_data_version_changes_with_the_data(tmp_path):
+    path = str(tmp_path / 'cricket_matches.db')
+    shutil.copyfile(BUNDLED_DB, path)
+    manager = ConnectionManager(path, health_check_interval=0)
+    version = manager.data_version()
+    manager.close()
+
+    con = duckdb.connect(path)
+    con.execute("CREATE TABLE ingest_watermarks (table_name VARCHAR, updated_at TIMESTAMP)")
+    con.execute("INSERT INTO ingest_watermarks VALUES ('match_details', now())")
+    con.close()
+
+    assert manager.data_version() != version
+    manager.close()
+
+def test_staged_writes_reach_a_running_dashboard(tmp_path):
+    path = str(tmp_path / 'cricket_matches.db')
+    shutil.copyfile(BUNDLED_DB, path)
+    manager = ConnectionManager(path, health_check_interval=0)
+    with manager.cursor() as con:
+        matches = con.execute("SELECT COUNT(*) FROM match_details").fetchone()[0]
+
+    # The dashboard's read-only handle stays open while ingest writes
+    with staged_connection(path) as con:
+        con.execute("DELETE FROM match_details WHERE match_id = (SELECT min(match_id) FROM match_details)")
+
+    with manager.cursor() as con:
+        assert con.execute("SELECT COUNT(*) FROM match_details").fetchone()[0] == matches - 1
+    manager.close()
+    assert sorted(os.listdir(tmp_path)) == ['cricket_matches.db', 'cricket_matches.db.lock']
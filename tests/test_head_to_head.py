@@ -0,0 +1,36 @@
+import duckdb
+
+from head_to_head import load_head_to_head
+
+def test_only_completed_matches_are_counted():
+    con = duckdb.connect()
+    con.execute("""
+        CREATE TABLE international_matches (
+            match_id INTEGER, team1_name VARCHAR, team2_name VARCHAR,
+            match_format VARCHAR, start_date TIMESTAMP
+        )
+    """)
+    con.execute("CREATE TABLE match_details (match_id INTEGER, match_state VARCHAR, winning_team_name VARCHAR)")
+    con.execute("""
+        INSERT INTO international_matches VALUES
+            (1, 'India', 'Australia', 'ODI', '2023-03-01'),
+            (2, 'Australia', 'India', 'ODI', '2023-03-04'),
+            (3, 'India', 'Australia', 'ODI', '2023-03-07'),
+            (4, 'India', 'Australia', 'ODI', '2023-03-10'),
+            (5, 'India', 'Australia', 'ODI', '2023-03-13')
+    """)
+    # 3 is live, 4 has no details yet, 5 was abandoned without a winner
+    con.execute("""
+        INSERT INTO match_details VALUES
+            (1, 'Complete', 'India'),
+            (2, 'complete', 'Australia'),
+            (3, 'In Progress', NULL),
+            (5, 'Complete', NULL)
+    """)
+
+    matrix = load_head_to_head(con)
+    india, australia = matrix.teams.index('India'), matrix.teams.index('Australia')
+
+    played, won, lost, no_result = matrix.counts[:, india, australia]
+    assert (played, won, lost, no_result) == (3, 1, 1, 1)
+    assert matrix.counts[0, australia, india] == 3
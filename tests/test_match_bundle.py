@@ -0,0 +1,48 @@
+import shutil
+
+import duckdb
+import pytest
+
+import app
+from schema import ensure_schema
+from test_schema import BUNDLED_DB
+
+MATCH_ID = 109092
+
+@pytest.fixture
+def serve(tmp_path, monkeypatch):
+    # Point the dashboard at a private copy of the committed database
+    def serve(migrate):
+        path = str(tmp_path / f"{'migrated' if migrate else 'bundled'}.db")
+        shutil.copyfile(BUNDLED_DB, path)
+        if migrate:
+            con = duckdb.connect(path)
+            try:
+                ensure_schema(con)
+            finally:
+                con.close()
+        monkeypatch.setattr(app, 'DB_PATH', path)
+    return serve
+
+def batting_names(bundle):
+    return [[batsman['batsman_name'] for batsman in innings['batting']] for innings in bundle['innings']]
+
+def test_unmigrated_database_lists_cards_in_stored_order(serve):
+    serve(migrate=False)
+
+    assert not app.has_position_columns()
+    bundle = app.load_match_bundle(MATCH_ID)
+    assert len(bundle['innings']) == 2
+    assert all(batting_names(bundle))
+    assert app.update_match_details(MATCH_ID)
+    assert app.update_match_summary(MATCH_ID)
+
+def test_migrated_database_orders_cards_by_position(serve):
+    serve(migrate=False)
+    stored_order = batting_names(app.load_match_bundle(MATCH_ID))
+
+    serve(migrate=True)
+
+    assert app.has_position_columns()
+    # Positions are backfilled from stored order, so the cards read the same
+    assert batting_names(app.load_match_bundle(MATCH_ID)) == stored_order
@@ -0,0 +1,63 @@
+import pandas as pd
+
+from match_search import MatchSearchIndex, tokenize
+
+MATCHES = pd.DataFrame({
+    'match_id': [1, 2, 3],
+    'team1_name': ['India', 'England', 'Indonesia'],
+    'team2_name': ['Australia', 'New Zealand', 'India'],
+    'match_desc': ['1st ODI', '2nd Test', '3rd T20I'],
+    'series_name': ['Border-Gavaskar Trophy', 'England tour', 'Asian Games'],
+    'start_date': pd.to_datetime(['2023-03-01', '2024-02-15', '2023-10-05'])
+})
+
+def matched_ids(index, query, limit=20):
+    return [option['value'] for option in index.search(query, limit)]
+
+def test_tokenize_lowercases_alphanumeric_words():
+    assert tokenize('Border-Gavaskar Trophy, 1st ODI') == ['border', 'gavaskar', 'trophy', '1st', 'odi']
+
+def test_prefix_matches_every_token_starting_with_it_newest_first():
+    index = MatchSearchIndex(MATCHES)
+
+    # "ind" prefixes both India and Indonesia
+    assert matched_ids(index, 'ind') == [3, 1]
+    assert matched_ids(index, 'indo') == [3]
+
+def test_every_word_must_match():
+    index = MatchSearchIndex(MATCHES)
+
+    assert matched_ids(index, 'india aus') == [1]
+    assert matched_ids(index, 'india zealand') == []
+
+def test_matches_series_and_dates():
+    index = MatchSearchIndex(MATCHES)
+
+    assert matched_ids(index, 'gavaskar') == [1]
+    assert matched_ids(index, 'february') == [2]
+    assert matched_ids(index, '2023') == [3, 1]
+
+def test_limit_and_empty_queries():
+    index = MatchSearchIndex(MATCHES)
+
+    assert matched_ids(index, 'i', limit=1) == [3]
+    assert index.search('') == []
+    assert index.search('--') == []
+
+def test_option_labels():
+    index = MatchSearchIndex(MATCHES)
+
+    option = index.search('england')[0]
+    assert (option['label'], option['value']) == ('England vs New Zealand (2nd Test)', 2)
+    assert index.option_for(1)['label'] == 'India vs Australia (1st ODI)'
+    assert index.option_for(99) is None
+
+def test_options_carry_the_indexed_text_for_the_browser():
+    # dcc.Dropdown filters options client-side on label, value and search
+    index = MatchSearchIndex(MATCHES)
+
+    for query in ('gavaskar', 'border-gav', '2023 03', 'march'):
+        option = index.search(query)[0]
+        assert option['value'] == 1
+        assert all(word in option['search'].lower() for word in query.split())
+    assert 'Border-Gavaskar Trophy' in index.option_for(1)['search']
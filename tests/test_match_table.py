@@ -0,0 +1,46 @@
+from match_table import build_filter_clauses, build_match_table_query, page_count, split_filter_part
+
+def test_split_filter_part_reads_column_operator_and_value():
+    assert split_filter_part('{team1_name} contains India') == ('team1_name', 'contains', 'India')
+    assert split_filter_part('{match_id} ge 100') == ('match_id', 'ge', '100')
+    # DataTable sends symbols as well as the two-letter names
+    assert split_filter_part('{match_id} > 100') == ('match_id', 'gt', '100')
+
+def test_split_filter_part_unquotes_values():
+    assert split_filter_part('{series_name} contains "Asia Cup"') == ('series_name', 'contains', 'Asia Cup')
+    assert split_filter_part("{team1_name} eq 'O\\'Brien XI'") == ('team1_name', 'eq', "O'Brien XI")
+
+def test_split_filter_part_matches_operator_after_column_only():
+    # "ge " inside the value must not be taken for the operator
+    assert split_filter_part('{match_desc} contains age group') == ('match_desc', 'contains', 'age group')
+
+def test_split_filter_part_rejects_unparseable_clauses():
+    assert split_filter_part('team1_name contains India') == (None, None, None)
+    assert split_filter_part('{team1_name} like India') == (None, None, None)
+
+def test_build_filter_clauses_binds_values_as_parameters():
+    clauses, params = build_filter_clauses('{team1_name} contains India && {match_id} gt 5')
+
+    assert clauses == ["CAST(team1_name AS VARCHAR) ILIKE '%' || ? || '%'", "match_id > ?"]
+    assert params == ['India', 5]
+
+def test_build_filter_clauses_skips_unknown_columns_and_bad_numbers():
+    clauses, params = build_filter_clauses('{venue} contains x && {match_id} eq abc && {status} eq ')
+
+    assert clauses == []
+    assert params == []
+
+def test_build_match_table_query_pages_and_sorts():
+    sql, params = build_match_table_query(
+        'Asia Cup', 2, 10, [{'column_id': 'team1_name', 'direction': 'desc'}, {'column_id': 'nope'}],
+        '{team2_name} contains Sri'
+    )
+
+    assert 'WHERE series_name = ? AND CAST(team2_name AS VARCHAR)' in sql
+    assert 'ORDER BY team1_name DESC NULLS LAST, match_id' in sql
+    assert 'nope' not in sql
+    assert params == ('Asia Cup', 'Sri', 10, 20)
+
+def test_page_count_is_at_least_one():
+    assert page_count(0, 10) == 1
+    assert page_count(21, 10) == 3
@@ -0,0 +1,40 @@
+from query_cache import LRUCache
+
+def test_evicts_least_recently_used_over_max_bytes():
+    cache = LRUCache(max_entries=10, max_bytes=10)
+    cache.put('a', 'aaaa')
+    cache.put('b', 'bbbb')
+    assert cache.get('a') == 'aaaa'  # 'b' is now the least recently used
+
+    cache.put('c', 'cccc')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'aaaa'
+    assert cache.get('c') == 'cccc'
+    assert cache.total_bytes == 8
+
+def test_value_larger_than_max_bytes_is_not_cached():
+    cache = LRUCache(max_bytes=4)
+    cache.put('a', 'aa')
+    cache.put('b', 'bbbbb')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'aa'
+    assert cache.total_bytes == 2
+
+def test_replacing_a_key_updates_its_size():
+    cache = LRUCache(max_bytes=10)
+    cache.put('a', 'aaaaaaaa')
+    cache.put('a', 'aa')
+    cache.put('b', 'bbbbbbbb')
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 10
+
+def test_evicts_over_max_entries():
+    cache = LRUCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, key)
+
+    assert cache.get('a') is None
+    assert len(cache) == 2
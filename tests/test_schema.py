@@ -0,0 +1,60 @@
+import os
+import shutil
+
+import duckdb
+import pytest
+
+from schema import MATCH_TABLES, TABLE_DEFINITIONS, ensure_schema, match_index_name
+
+BUNDLED_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cricket_matches.db')
+
+@pytest.fixture
+def bundled_copy(tmp_path):
+    # The committed database predates primary keys, positions and the match_id indexes
+    path = str(tmp_path / 'cricket_matches.db')
+    shutil.copyfile(BUNDLED_DB, path)
+    return path
+
+def row_counts(con):
+    return {table_name: con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+            for table_name in TABLE_DEFINITIONS}
+
+def primary_keys(con):
+    return {table_name for (table_name,) in con.execute("""
+        SELECT table_name FROM duckdb_constraints()
+        WHERE constraint_type = 'PRIMARY KEY' AND database_name = current_database()
+    """).fetchall()}
+
+def test_ensure_schema_migrates_the_bundled_database(bundled_copy):
+    con = duckdb.connect(bundled_copy)
+    try:
+        before = row_counts(con)
+        ensure_schema(con)
+
+        assert row_counts(con) == before
+        assert set(TABLE_DEFINITIONS) <= primary_keys(con)
+        indexes = {name for (name,) in con.execute("SELECT index_name FROM duckdb_indexes()").fetchall()}
+        assert {match_index_name(table_name) for table_name in MATCH_TABLES} <= indexes
+
+        # Positions are numbered 1..n within each innings, in stored order
+        assert con.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT match_id, innings_id, min(batting_position) AS first, max(batting_position) AS last,
+                       COUNT(*) AS batsmen, COUNT(DISTINCT batting_position) AS positions
+                FROM batsmen_details GROUP BY match_id, innings_id
+            ) WHERE first != 1 OR last != batsmen OR positions != batsmen
+        """).fetchone()[0] == 0
+        assert con.execute("SELECT COUNT(*) FROM bowlers_details WHERE bowling_position IS NULL").fetchone()[0] == 0
+    finally:
+        con.close()
+
+def test_ensure_schema_is_idempotent(bundled_copy):
+    con = duckdb.connect(bundled_copy)
+    try:
+        ensure_schema(con)
+        migrated = row_counts(con)
+        ensure_schema(con)
+
+        assert row_counts(con) == migrated
+    finally:
+        con.close()
@@ -0,0 +1,37 @@
+import shutil
+
+import pytest
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import app
+from test_schema import BUNDLED_DB
+
+FILTER = '{team1_name} contains a'
+
+@pytest.fixture(autouse=True)
+def bundled(tmp_path, monkeypatch):
+    path = str(tmp_path / 'cricket_matches.db')
+    shutil.copyfile(BUNDLED_DB, path)
+    monkeypatch.setattr(app, 'DB_PATH', path)
+
+def trigger(prop_id, value):
+    # What Dash sets up for a callback fired by `prop_id`
+    context_value.set(AttributeDict(triggered_inputs=[{'prop_id': prop_id, 'value': value}]))
+
+def test_filter_change_returns_to_the_first_page():
+    trigger('match-table.filter_query', FILTER)
+
+    data, pages, page_current, *_ = app.update_series_overview('All Series', 2, 5, [], FILTER)
+
+    assert page_current == 0
+    assert len(data) == 5
+    assert pages > 1
+
+def test_paging_keeps_the_requested_page():
+    trigger('match-table.page_current', 1)
+
+    data, pages, page_current, *_ = app.update_series_overview('All Series', 1, 5, [], FILTER)
+
+    assert page_current == 1
+    assert data